@@ -9,7 +9,6 @@ from app.utils.security import http_bearer
 from ...core.config import (
     ACCESS_TOKEN_EXPIRE_MINUTES,
 )
-from ...models.user import User
 from ...schemas.user import UserIn, UserLogin, UserResponse, UserUpdate
 from ...services.auth_service import (
     delete_user_service,
@@ -19,6 +18,7 @@ from ...services.auth_service import (
     update_user_profile_service,
 )
 from ...utils.security import (
+    AuthenticatedUser,
     create_access_token,
     get_current_user,
 )
@@ -52,24 +52,29 @@ async def login(user_in: UserLogin):
 
 @router.post("/logout", status_code=status.HTTP_200_OK, tags=["auth"])
 async def logout(
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
     credentials: HTTPAuthorizationCredentials = Depends(http_bearer),
 ):
     return await logout_user_service(credentials.credentials)
 
 
 @router.get("/profile", response_model=UserResponse, tags=["auth"])
-async def get_user_profile(current_user: User = Depends(get_current_user)):
+async def get_user_profile(
+    current_user: AuthenticatedUser = Depends(get_current_user),
+):
+    # 이메일, 가입일 등은 캐시에 없으므로 전체 사용자 정보를 조회합니다.
+    user = await current_user.load()
     return {
-        "id": str(current_user.id),
-        "email": current_user.email,
-        "created_at": current_user.created_at.isoformat(),
+        "id": str(user.id),
+        "email": user.email,
+        "created_at": user.created_at.isoformat(),
     }
 
 
 @router.put("/profile", tags=["auth"])
 async def update_profile(
-    request: UpdateProfileRequest, current_user: User = Depends(get_current_user)
+    request: UpdateProfileRequest,
+    current_user: AuthenticatedUser = Depends(get_current_user),
 ):
     result = await update_user_profile_service(current_user.id, request.new_data)
     if "error" in result:
@@ -80,7 +85,7 @@ async def update_profile(
 
 
 @router.delete("/profile", tags=["auth"])
-async def delete_profile(current_user: User = Depends(get_current_user)):
+async def delete_profile(current_user: AuthenticatedUser = Depends(get_current_user)):
     result = await delete_user_service(current_user.id)
     if "error" in result:
         raise HTTPException(
@@ -90,7 +95,7 @@ async def delete_profile(current_user: User = Depends(get_current_user)):
 
 
 @router.post("/refresh", tags=["auth"])
-async def refresh_token(current_user: User = Depends(get_current_user)):
+async def refresh_token(current_user: AuthenticatedUser = Depends(get_current_user)):
     # 현재 사용자로부터 새로운 액세스 토큰 생성
     new_access_token = create_access_token(
         data={"sub": str(current_user.id)},
@@ -1,52 +1,176 @@
 from datetime import date
-from typing import List, Optional
+from typing import Annotated, List, Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
 from app.api.v1.auth import get_current_user
-from app.models.user import User
-from app.schemas.diary import DiaryCreate, DiaryOut, DiaryUpdate
+from app.core.config import DIARY_PAGE_SIZE, DIARY_PAGE_SIZE_MAX
+from app.schemas.diary import (
+    DiaryBulkDelete,
+    DiaryBulkResult,
+    DiaryBulkUpdate,
+    DiaryCreate,
+    DiaryOut,
+    DiaryPage,
+    DiarySearchParams,
+    DiarySearchResult,
+    DiaryUpdate,
+    SummaryJobOut,
+)
+from app.services.bulk_service import (
+    bulk_delete_diaries_service,
+    bulk_update_diaries_service,
+)
 from app.services.diary_service import (
     create_diary_service,
     delete_diary_service,
-    get_all_diaries_service,
+    diaries_to_dicts,
+    fetch_diary_page,
     get_diary_by_id_service,
+    get_diary_updated_at,
+    get_summary_job_service,
+    serialize_diary,
+    stream_summary_service,
     summarize_diary_service,
     update_diary_service,
 )
-from app.services.search_service import search_diary
+from app.services.export_service import EXPORT_FORMATS, export_diaries
+from app.services.import_service import import_events, spool_upload
+from app.services.search_service import (
+    combined_search_diary,
+    search_diary,
+    search_diary_fulltext,
+)
+from app.services.stats_service import get_diary_version
+from app.utils.etag import (
+    diary_etag,
+    diary_list_etag,
+    etag_headers,
+    etag_matches,
+    not_modified,
+)
+from app.utils.responses import FastJSONResponse
+from app.utils.security import AuthenticatedUser
 
-router = APIRouter(prefix="/api/v1/diary", tags=["diary"])
+# 목록 API는 DiaryOut 검증 없이 dict를 바로 orjson으로 직렬화합니다.
+# (response_model은 문서화용이며, Response를 직접 반환하면 FastAPI가 다시 검증하지 않습니다.)
+router = APIRouter(
+    prefix="/api/v1/diary", tags=["diary"], default_response_class=FastJSONResponse
+)
 
 
 # 일기 생성
 @router.post("/create", response_model=DiaryOut)
 async def create_new_diary(
     diary_data: DiaryCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthenticatedUser = Depends(get_current_user),
 ):
     new_diary_orm = await create_diary_service(current_user, diary_data)
 
-    return DiaryOut.model_validate(new_diary_orm)
+    return await serialize_diary(new_diary_orm)
+
+
+# 일기 한꺼번에 가져오기 (NDJSON 업로드)
+@router.post("/import")
+async def import_diaries(
+    request: Request,
+    current_user: AuthenticatedUser = Depends(get_current_user),
+):
+    """
+    한 줄에 일기 하나(DiaryCreate + 선택적인 created_at)인 NDJSON 본문을 가져옵니다.
+
+    - 줄 단위로 검증하고, 올바른 일기만 일정 개수씩 한 트랜잭션으로 저장
+    - 진행 상황을 NDJSON으로 전송: progress(청크마다, 이번 청크의 줄 오류 포함) -> done
+    - 저장 중 오류가 나면 error 이벤트 후 중단 (이전 청크는 저장된 상태)
+    """
+    file = await spool_upload(request.stream())
+    return StreamingResponse(
+        import_events(current_user.id, file),
+        media_type="application/x-ndjson",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+# 일기 일괄 수정 (감정 변경, 태그 추가/제거)
+@router.post("/bulk/update", response_model=DiaryBulkResult)
+async def bulk_update_diaries(
+    data: DiaryBulkUpdate,
+    current_user: AuthenticatedUser = Depends(get_current_user),
+):
+    """
+    ids(일기 id 목록) 또는 filter(복합 검색 조건)에 맞는 내 일기를 한 번에 수정합니다.
+    다른 사용자의 일기 id는 무시됩니다.
+    """
+    return await bulk_update_diaries_service(current_user.id, data)
+
 
+# 일기 일괄 삭제
+@router.post("/bulk/delete", response_model=DiaryBulkResult)
+async def bulk_delete_diaries(
+    data: DiaryBulkDelete,
+    current_user: AuthenticatedUser = Depends(get_current_user),
+):
+    """
+    ids(일기 id 목록) 또는 filter(복합 검색 조건)에 맞는 내 일기를 한 번에 삭제합니다.
+    다른 사용자의 일기 id는 무시됩니다.
+    """
+    return await bulk_delete_diaries_service(current_user.id, data)
 
-# 모든 일기 조회
-@router.get("/inquiry", response_model=List[DiaryOut])
-async def get_diaries(current_user: User = Depends(get_current_user)):
-    return await get_all_diaries_service(current_user.id)
+
+# 모든 일기 조회 (커서 기반 페이지네이션)
+@router.get("/inquiry", response_model=DiaryPage)
+async def get_diaries(
+    limit: int = Query(DIARY_PAGE_SIZE, ge=1, le=DIARY_PAGE_SIZE_MAX),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor 값"),
+    if_none_match: Optional[str] = Header(None),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+):
+    """
+    ETag는 사용자별 일기 버전(작성/수정/삭제마다 증가)과 limit/cursor로 만듭니다.
+    If-None-Match가 맞으면 일기를 읽지 않고 304를 반환합니다.
+    """
+    # 버전을 먼저 읽으므로 응답 본문은 항상 ETag의 버전보다 같거나 새롭습니다.
+    version = await get_diary_version(current_user.id)
+    etag = diary_list_etag(current_user.id, version, limit, cursor)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
+    diaries, next_cursor = await fetch_diary_page(current_user.id, limit, cursor)
+    return FastJSONResponse(
+        {"items": await diaries_to_dicts(diaries), "next_cursor": next_cursor},
+        headers=etag_headers(etag),
+    )
 
 
 # 일기 검색
-@router.get("/search", response_model=List[DiaryOut])
+@router.get("/search", response_model=List[DiarySearchResult])
 async def search_diaries(
-    search_type: str = Query(..., description="검색 타입: title, tag, date"),
-    query: Optional[str] = Query(None, description="검색어 (title, tag 검색 시)"),
+    search_type: str = Query(
+        ...,
+        description="검색 타입: title, text(제목+본문 부분 일치), tag, date, "
+        "content(fulltext)",
+    ),
+    query: Optional[str] = Query(
+        None, description="검색어 (title, text, tag, content 검색 시)"
+    ),
     start_date: Optional[date] = Query(None, description="시작 날짜 (date 검색 시)"),
     end_date: Optional[date] = Query(
         None, description="종료 날짜 (date 검색 시, 선택사항)"
     ),
-    current_user: User = Depends(get_current_user),
+    limit: int = Query(
+        DIARY_PAGE_SIZE,
+        ge=1,
+        le=DIARY_PAGE_SIZE_MAX,
+        description="페이지 크기 (content 검색 시)",
+    ),
+    offset: int = Query(0, ge=0, description="건너뛸 결과 수 (content 검색 시)"),
+    current_user: AuthenticatedUser = Depends(get_current_user),
 ):
+    # 본문 전문 검색: 관련도 순 + 스니펫
+    if search_type in ("content", "fulltext"):
+        return await search_diary_fulltext(current_user.id, query, limit, offset)
+
     diaries = await search_diary(
         user_id=current_user.id,
         search_type=search_type,
@@ -55,43 +179,137 @@ async def search_diaries(
         end_date=end_date,
     )
 
-    return [DiaryOut.model_validate(diary) for diary in diaries]
+    return FastJSONResponse(await diaries_to_dicts(diaries))
+
+
+# 복합 검색 (제목 + 태그 + 기간을 한 번에)
+@router.get("/search/combined", response_model=DiaryPage)
+async def combined_search_diaries(
+    params: Annotated[DiarySearchParams, Query()],
+    limit: int = Query(DIARY_PAGE_SIZE, ge=1, le=DIARY_PAGE_SIZE_MAX),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor 값"),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+):
+    """
+    title(부분 일치), tags(모두 포함), start_date~end_date 조건을 함께 적용합니다.
+    모든 조건을 하나의 SQL 쿼리로 만들어 실행합니다.
+    """
+    diaries, next_cursor = await combined_search_diary(
+        current_user.id, params, limit, cursor
+    )
+    return FastJSONResponse(
+        {"items": await diaries_to_dicts(diaries), "next_cursor": next_cursor}
+    )
+
+
+# 전체 일기 내보내기 (스트리밍)
+@router.get("/export")
+async def export_all_diaries(
+    export_format: str = Query(
+        "ndjson", alias="format", pattern="^(ndjson|csv)$", description="ndjson, csv"
+    ),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+):
+    """
+    모든 일기를 태그와 함께 오래된 순으로 내보냅니다.
+    일기를 일정 개수씩 읽어 바로 전송하므로 일기 수와 상관없이 서버 메모리 사용량이 일정합니다.
+    """
+    return StreamingResponse(
+        export_diaries(current_user.id, export_format),
+        media_type=EXPORT_FORMATS[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="diaries.{export_format}"'
+        },
+    )
 
 
 # 특정 일기 조회
 @router.get("/{diary_id}", response_model=DiaryOut)
-async def get_diary(diary_id: int, current_user: User = Depends(get_current_user)):
+async def get_diary(
+    diary_id: int,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+):
     """
     diary_id 를 입력하면 조회해 주는 기능
+    If-None-Match가 일기의 ETag와 맞으면 updated_at만 읽고 304를 반환합니다.
     """
-    return await get_diary_by_id_service(diary_id, current_user.id)
+    if if_none_match:
+        updated_at = await get_diary_updated_at(diary_id, current_user.id)
+        if updated_at is not None:
+            etag = diary_etag(diary_id, updated_at)
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag)
+
+    diary = await get_diary_by_id_service(diary_id, current_user.id)
+    response.headers.update(etag_headers(diary_etag(diary.id, diary.updated_at)))
+    return diary
 
 
-# 일기 AI 요약 생성
-@router.post("/{diary_id}/summarize", response_model=DiaryOut)
+# 일기 AI 요약 작업 상태 조회
+@router.get("/summarize/jobs/{job_id}", response_model=SummaryJobOut)
+async def get_summary_job(
+    job_id: str, current_user: AuthenticatedUser = Depends(get_current_user)
+):
+    """status가 succeeded이면 ai_summary에 요약 결과가 들어 있습니다."""
+    return await get_summary_job_service(job_id, current_user.id)
+
+
+# 일기 AI 요약 생성 (백그라운드 작업)
+@router.post(
+    "/{diary_id}/summarize",
+    response_model=SummaryJobOut,
+    status_code=status.HTTP_202_ACCEPTED,
+)
 async def summarize_diary(
-    diary_id: int, current_user: User = Depends(get_current_user)
+    diary_id: int, current_user: AuthenticatedUser = Depends(get_current_user)
 ):
     """
     일기 AI 요약 생성
 
-    - 일기 내용을 AI로 분석하여 2-3문장으로 요약
-    - 이미 요약이 있는 경우 400 에러 반환
+    - 요약 작업을 큐에 넣고 job_id를 바로 반환 (202)
+    - 결과는 GET /summarize/jobs/{job_id}로 조회
+    - 같은 일기의 작업이 진행 중이면 기존 작업을 반환
+    """
+    return await summarize_diary_service(diary_id, current_user.id)
+
+
+# 일기 AI 요약 생성 (스트리밍)
+@router.post("/{diary_id}/summarize/stream")
+async def stream_diary_summary(
+    diary_id: int, current_user: AuthenticatedUser = Depends(get_current_user)
+):
     """
-    diary = await summarize_diary_service(diary_id, current_user.id)
-    return DiaryOut.model_validate(diary)
+    일기 AI 요약을 생성되는 대로 Server-Sent Events로 전송
+
+    - event: token (data: {"text": 요약 조각}) 여러 번
+    - event: done (data: {"diary_id", "ai_summary"}) 완료 시 요약 저장 후 한 번
+    - event: error (data: {"detail"}) 실패 시 한 번
+    """
+    events = await stream_summary_service(diary_id, current_user.id)
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        # 프록시가 응답을 모아서 보내지 않도록 합니다.
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 # 일기 수정
 @router.put("/{diary_id}", response_model=DiaryOut)
 async def update_diary(
-    diary_id: int, data: DiaryUpdate, current_user: User = Depends(get_current_user)
+    diary_id: int,
+    data: DiaryUpdate,
+    current_user: AuthenticatedUser = Depends(get_current_user),
 ):
     return await update_diary_service(diary_id, data, current_user.id)
 
 
 # 일기 삭제
 @router.delete("/{diary_id}")
-async def delete_diary(diary_id: int, current_user: User = Depends(get_current_user)):
+async def delete_diary(
+    diary_id: int, current_user: AuthenticatedUser = Depends(get_current_user)
+):
     await delete_diary_service(diary_id, current_user.id)
     return {"message": "일기가 성공적으로 삭제되었습니다."}
@@ -0,0 +1,68 @@
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.models.emotion_keyword import EmotionType
+from app.schemas.emotion_keyword import (
+    EmotionKeywordCreate,
+    EmotionKeywordResponse,
+    EmotionKeywordUpdate,
+)
+from app.services.emotion_service import (
+    create_emotion_keyword_service,
+    delete_emotion_keyword_service,
+    get_emotion_keywords_service,
+    update_emotion_keyword_service,
+)
+from app.utils.security import AuthenticatedUser, get_current_user
+
+router = APIRouter(prefix="/api/v1/emotion-keywords", tags=["emotion-keyword"])
+
+
+def require_staff(
+    current_user: AuthenticatedUser = Depends(get_current_user),
+) -> AuthenticatedUser:
+    if not (current_user.is_staff or current_user.is_admin):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자만 접근할 수 있습니다.",
+        )
+    return current_user
+
+
+# 감정 키워드 목록 조회 (emotion_type으로 필터링 가능)
+@router.get("/", response_model=List[EmotionKeywordResponse])
+async def get_emotion_keywords(
+    emotion_type: Optional[EmotionType] = None,
+    current_user: AuthenticatedUser = Depends(get_current_user),
+):
+    return await get_emotion_keywords_service(emotion_type)
+
+
+# 감정 키워드 추가 (관리자 전용)
+@router.post(
+    "/", response_model=EmotionKeywordResponse, status_code=status.HTTP_201_CREATED
+)
+async def create_emotion_keyword(
+    data: EmotionKeywordCreate, current_user: AuthenticatedUser = Depends(require_staff)
+):
+    return await create_emotion_keyword_service(data)
+
+
+# 감정 키워드 수정 (관리자 전용)
+@router.put("/{keyword_id}", response_model=EmotionKeywordResponse)
+async def update_emotion_keyword(
+    keyword_id: int,
+    data: EmotionKeywordUpdate,
+    current_user: AuthenticatedUser = Depends(require_staff),
+):
+    return await update_emotion_keyword_service(keyword_id, data)
+
+
+# 감정 키워드 삭제 (관리자 전용)
+@router.delete("/{keyword_id}")
+async def delete_emotion_keyword(
+    keyword_id: int, current_user: AuthenticatedUser = Depends(require_staff)
+):
+    await delete_emotion_keyword_service(keyword_id)
+    return {"message": "감정 키워드가 삭제되었습니다."}
@@ -0,0 +1,35 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.services.ai_service import get_ai_service_stats
+from app.services.auth_service import token_purge_stats
+from app.services.emotion_service import emotion_classifier
+from app.services.summary_service import get_summary_cache_stats, summary_jobs
+from app.utils.security import (
+    AuthenticatedUser,
+    get_current_user,
+    password_pool,
+    revoked_tokens,
+    user_cache,
+)
+
+router = APIRouter(prefix="/api/v1", tags=["metrics"])
+
+
+# 운영 지표 조회 (관리자 전용)
+@router.get("/metrics")
+async def get_metrics(current_user: AuthenticatedUser = Depends(get_current_user)):
+    if not (current_user.is_staff or current_user.is_admin):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자만 접근할 수 있습니다.",
+        )
+    return {
+        "password_hash_pool": password_pool.stats(),
+        "revoked_tokens": revoked_tokens.stats(),
+        "user_cache": user_cache.stats(),
+        "token_purge": token_purge_stats,
+        "summary_cache": get_summary_cache_stats(),
+        "summary_jobs": summary_jobs.stats(),
+        "ai_client": get_ai_service_stats(),
+        "emotion_classifier": emotion_classifier.stats(),
+    }
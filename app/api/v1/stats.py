@@ -0,0 +1,43 @@
+from datetime import date
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query
+
+from app.schemas.stats import CalendarOut, EmotionStats
+from app.schemas.tag import TagInList
+from app.services.stats_service import (
+    get_calendar_service,
+    get_emotion_stats_service,
+    get_tag_usage_service,
+)
+from app.utils.security import AuthenticatedUser, get_current_user
+
+router = APIRouter(prefix="/api/v1/stats", tags=["stats"])
+
+
+# 날짜별 감정 분포 (미리 집계된 값 조회)
+@router.get("/emotions", response_model=EmotionStats)
+async def get_emotion_stats(
+    start_date: Optional[date] = Query(None, description="시작 날짜 (YYYY-MM-DD)"),
+    end_date: Optional[date] = Query(None, description="종료 날짜 (YYYY-MM-DD)"),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+):
+    return await get_emotion_stats_service(current_user.id, start_date, end_date)
+
+
+# 연간 달력 히트맵 (날짜별 일기 수와 대표 감정)
+@router.get("/calendar", response_model=CalendarOut)
+async def get_calendar(
+    year: int = Query(..., ge=1, le=9999, description="조회할 연도"),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+):
+    return await get_calendar_service(current_user.id, year)
+
+
+# 많이 사용한 태그 (미리 집계된 값 조회)
+@router.get("/tags", response_model=List[TagInList])
+async def get_tag_stats(
+    limit: int = Query(20, ge=1, le=100),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+):
+    return await get_tag_usage_service(current_user.id, limit)
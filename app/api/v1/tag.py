@@ -0,0 +1,67 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from app.schemas.tag import (
+    TagDeleteResponse,
+    TagDetailResponse,
+    TagListResponse,
+    TagPatchRequest,
+)
+from app.services.tag_service import (
+    delete_user_tag_service,
+    get_user_tag_detail_service,
+    get_user_tags_service,
+    rename_user_tag_service,
+)
+from app.utils.security import AuthenticatedUser, get_current_user
+
+router = APIRouter(prefix="/api/v1/tags", tags=["tag"])
+
+
+# 내 태그 목록 (사용 횟수 순, 커서 기반 페이지네이션)
+@router.get("/", response_model=TagListResponse)
+async def get_tags(
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor 값"),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+):
+    return TagListResponse(
+        data=await get_user_tags_service(current_user.id, limit, cursor)
+    )
+
+
+# 태그 상세 (사용 횟수, 최근 일기)
+@router.get("/{tag_id}", response_model=TagDetailResponse)
+async def get_tag(
+    tag_id: int, current_user: AuthenticatedUser = Depends(get_current_user)
+):
+    return TagDetailResponse(
+        data=await get_user_tag_detail_service(current_user.id, tag_id)
+    )
+
+
+# 태그 이름 변경 (내 일기에 달린 태그만)
+@router.patch("/{tag_id}", response_model=TagDetailResponse)
+async def rename_tag(
+    tag_id: int,
+    data: TagPatchRequest,
+    current_user: AuthenticatedUser = Depends(get_current_user),
+):
+    if data.name is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="태그 이름을 입력해 주세요.",
+        )
+    return TagDetailResponse(
+        data=await rename_user_tag_service(current_user.id, tag_id, data.name)
+    )
+
+
+# 태그 삭제 (내 모든 일기에서 태그 제거)
+@router.delete("/{tag_id}", response_model=TagDeleteResponse)
+async def delete_tag(
+    tag_id: int, current_user: AuthenticatedUser = Depends(get_current_user)
+):
+    await delete_user_tag_service(current_user.id, tag_id)
+    return TagDeleteResponse(message="태그가 삭제되었습니다.")
@@ -20,7 +20,11 @@ TORTOISE_ORM = {
                 "app.models.user",
                 "app.models.token_blacklist",
                 "app.models.diary",
+                "app.models.diary_ngram",
                 "app.models.tag",
+                "app.models.summary_cache",
+                "app.models.emotion_keyword",
+                "app.models.user_stats",
             ],
             "default_connection": "default",
         },
@@ -28,3 +32,67 @@ TORTOISE_ORM = {
 }
 
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-1.5-flash")
+# AI 요약 백엔드: gemini | fake (개발/벤치마크용, 외부 호출 없음)
+AI_BACKEND = os.getenv("AI_BACKEND", "gemini")
+# AI 호출 동시 실행 수, 호출당 제한 시간(초)
+AI_MAX_CONCURRENCY = int(os.getenv("AI_MAX_CONCURRENCY", "8"))
+AI_TIMEOUT_SECONDS = float(os.getenv("AI_TIMEOUT_SECONDS", "30"))
+# 연속 실패 몇 번에 회로를 열지, 연 뒤 몇 초 후에 다시 시도할지
+AI_CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("AI_CIRCUIT_FAILURE_THRESHOLD", "5"))
+AI_CIRCUIT_RESET_SECONDS = float(os.getenv("AI_CIRCUIT_RESET_SECONDS", "30"))
+
+# bcrypt 해시/검증을 처리할 전용 스레드 수
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "4"))
+
+# 로그아웃 토큰 캐시 방식: memory | bloom | db
+TOKEN_REVOCATION_BACKEND = os.getenv("TOKEN_REVOCATION_BACKEND", "memory")
+# 다른 워커의 로그아웃을 반영하는 주기(초)
+TOKEN_REVOCATION_SYNC_SECONDS = float(os.getenv("TOKEN_REVOCATION_SYNC_SECONDS", "5"))
+TOKEN_BLOOM_CAPACITY = int(os.getenv("TOKEN_BLOOM_CAPACITY", "100000"))
+# 동기화할 때 마지막으로 본 id보다 몇 개 앞에서부터 다시 읽을지 (id 순서와 다른 커밋 대비)와
+# 몇 번째 동기화마다 전체를 다시 읽을지
+TOKEN_REVOCATION_SYNC_OVERLAP = int(os.getenv("TOKEN_REVOCATION_SYNC_OVERLAP", "1000"))
+TOKEN_REVOCATION_FULL_SYNC_EVERY = int(
+    os.getenv("TOKEN_REVOCATION_FULL_SYNC_EVERY", "60")
+)
+# 다른 워커에서 바뀐 감정 키워드 사전을 반영하는 주기(초)
+EMOTION_KEYWORD_SYNC_SECONDS = float(os.getenv("EMOTION_KEYWORD_SYNC_SECONDS", "30"))
+
+# 인증된 사용자 정보 캐시 크기와 유지 시간(초)
+USER_CACHE_SIZE = int(os.getenv("USER_CACHE_SIZE", "10000"))
+USER_CACHE_TTL_SECONDS = float(os.getenv("USER_CACHE_TTL_SECONDS", "60"))
+
+# 만료된 TokenBlacklist 행 정리 주기(초)와 한 번에 삭제할 행 수
+TOKEN_PURGE_INTERVAL_SECONDS = float(os.getenv("TOKEN_PURGE_INTERVAL_SECONDS", "3600"))
+TOKEN_PURGE_BATCH_SIZE = int(os.getenv("TOKEN_PURGE_BATCH_SIZE", "1000"))
+
+# 일기 목록 페이지 크기 (기본값, 최대값)
+DIARY_PAGE_SIZE = int(os.getenv("DIARY_PAGE_SIZE", "20"))
+DIARY_PAGE_SIZE_MAX = int(os.getenv("DIARY_PAGE_SIZE_MAX", "100"))
+
+# AI 요약 메모리 캐시 크기 (영구 캐시는 summary_cache 테이블)
+SUMMARY_CACHE_SIZE = int(os.getenv("SUMMARY_CACHE_SIZE", "1000"))
+
+# AI 요약 작업 큐: 동시 실행 수, 재시도 횟수, 첫 재시도 대기 시간(초, 이후 2배씩 증가)
+SUMMARY_WORKERS = int(os.getenv("SUMMARY_WORKERS", "2"))
+SUMMARY_MAX_RETRIES = int(os.getenv("SUMMARY_MAX_RETRIES", "3"))
+SUMMARY_RETRY_BACKOFF_SECONDS = float(os.getenv("SUMMARY_RETRY_BACKOFF_SECONDS", "1"))
+
+# AI 일괄 요약: 호출 한 번에 넣을 최대 일기 수와 예상 입력 토큰 수, 동시 호출 수
+SUMMARY_BATCH_SIZE = int(os.getenv("SUMMARY_BATCH_SIZE", "20"))
+SUMMARY_BATCH_MAX_TOKENS = int(os.getenv("SUMMARY_BATCH_MAX_TOKENS", "8000"))
+SUMMARY_BACKFILL_CONCURRENCY = int(os.getenv("SUMMARY_BACKFILL_CONCURRENCY", "4"))
+
+# 일기 내보내기 시 한 번에 읽는 일기 수
+EXPORT_CHUNK_SIZE = int(os.getenv("EXPORT_CHUNK_SIZE", "1000"))
+
+# 일기 가져오기: 한 트랜잭션에 쓰는 일기 수, 응답에 담는 최대 줄 오류 수,
+# 업로드 본문을 메모리에 두는 최대 크기 (넘으면 임시 파일로)
+IMPORT_CHUNK_SIZE = int(os.getenv("IMPORT_CHUNK_SIZE", "1000"))
+IMPORT_MAX_ERRORS = int(os.getenv("IMPORT_MAX_ERRORS", "1000"))
+IMPORT_SPOOL_MEMORY = int(os.getenv("IMPORT_SPOOL_MEMORY", str(8 * 1024 * 1024)))
+
+# 일기 일괄 수정/삭제: 요청당 최대 id 수, 한 번의 IN 쿼리에 넣는 id 수
+DIARY_BULK_MAX_IDS = int(os.getenv("DIARY_BULK_MAX_IDS", "1000"))
+DIARY_BULK_CHUNK_SIZE = int(os.getenv("DIARY_BULK_CHUNK_SIZE", "500"))
@@ -1,5 +1,8 @@
 # app/main.py
 
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
 from fastapi.security import HTTPBearer
 from tortoise.contrib.fastapi import register_tortoise
@@ -7,15 +10,69 @@ from tortoise.contrib.fastapi import register_tortoise
 # 라우터 파일에서 라우터를 직접 임포트합니다.
 from .api.v1.auth import router as auth_router
 from .api.v1.diary import router as diary_router
-from .core.config import TORTOISE_ORM
+from .api.v1.emotion_keyword import router as emotion_keyword_router
+from .api.v1.metrics import router as metrics_router
+from .api.v1.stats import router as stats_router
+from .api.v1.tag import router as tag_router
+from .core.config import (
+    EMOTION_KEYWORD_SYNC_SECONDS,
+    TOKEN_PURGE_BATCH_SIZE,
+    TOKEN_PURGE_INTERVAL_SECONDS,
+    TOKEN_REVOCATION_SYNC_SECONDS,
+    TORTOISE_ORM,
+)
+from .services.auth_service import run_token_purge_loop
+from .services.emotion_service import emotion_classifier
+from .services.fulltext_service import ensure_fulltext_index
+from .services.ngram_service import ensure_ngram_index
+from .services.stats_service import ensure_user_stats
+from .services.summary_service import summary_jobs
+from .utils.security import password_pool, revoked_tokens
 
 # HTTPBearer 보안 스키마 정의
 security = HTTPBearer()
 
+
+# 앱 시작/종료 시 백그라운드 자원을 준비하고 정리합니다.
+# (register_tortoise가 이 lifespan을 감싸므로 여기서는 DB를 사용할 수 있습니다.)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    password_pool.start()
+    await ensure_fulltext_index()
+    await ensure_ngram_index()
+    await ensure_user_stats()
+    await revoked_tokens.load()
+    await emotion_classifier.load()
+    await summary_jobs.start()
+    background_tasks = [
+        asyncio.create_task(
+            revoked_tokens.run_sync_loop(TOKEN_REVOCATION_SYNC_SECONDS)
+        ),
+        asyncio.create_task(
+            run_token_purge_loop(TOKEN_PURGE_INTERVAL_SECONDS, TOKEN_PURGE_BATCH_SIZE)
+        ),
+        asyncio.create_task(
+            emotion_classifier.run_sync_loop(EMOTION_KEYWORD_SYNC_SECONDS)
+        ),
+    ]
+
+    yield
+
+    for task in background_tasks:
+        task.cancel()
+    for task in background_tasks:
+        with suppress(asyncio.CancelledError):
+            await task
+    await summary_jobs.stop()
+    revoked_tokens.reset()
+    password_pool.shutdown()
+
+
 app = FastAPI(
     title="4Bit_Diary API",
     description="4Bit Diary API with JWT Authentication",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 register_tortoise(
@@ -28,3 +85,7 @@ register_tortoise(
 # 라우터들을 한 번에 등록하고 접두사를 한 번만 적용합니다.
 app.include_router(auth_router)
 app.include_router(diary_router)
+app.include_router(metrics_router)
+app.include_router(emotion_keyword_router)
+app.include_router(stats_router)
+app.include_router(tag_router)
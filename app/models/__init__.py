@@ -1,13 +1,22 @@
 from .diary import Diary
+from .diary_ngram import DiaryNgram
 from .emotion_keyword import EmotionKeyword
+from .summary_cache import SummaryCache
 from .tag import Tag
 from .token_blacklist import TokenBlacklist
 from .user import User
+from .user_stats import UserCalendar, UserDiaryVersion, UserEmotionDaily, UserTagUsage
 
 __all__ = [
     "User",
     "Diary",
+    "DiaryNgram",
     "Tag",
     "EmotionKeyword",
+    "SummaryCache",
     "TokenBlacklist",
+    "UserCalendar",
+    "UserDiaryVersion",
+    "UserEmotionDaily",
+    "UserTagUsage",
 ]
@@ -18,14 +18,25 @@ class Diary(models.Model):
     emotional_state = fields.CharEnumField(EmotionalState, null=True)
     created_at = fields.DatetimeField(auto_now_add=True)
     updated_at = fields.DatetimeField(auto_now=True)
-    tags = fields.ManyToManyField("models.Tag")
-    # ai_summary = fields.TextField()
+    # DiaryTag 모델과 같은 diary_tags 테이블을 M2M 연결 테이블로 사용합니다.
+    tags = fields.ManyToManyField("models.Tag", through="diary_tags")
+    ai_summary = fields.TextField(null=True)
+    # 감정 키워드 사전으로 계산한 감정별 점수 {"positive": 0.5, ...}
+    emotion_scores = fields.JSONField(null=True)
+
+    class Meta:
+        # 사용자별 최신순 커서 페이지네이션용 복합 인덱스
+        indexes = (("user_id", "created_at", "id"),)
 
 
 class DiaryTag(models.Model):
     diary = fields.ForeignKeyField("models.Diary", related_name="diary_tags")
     tag = fields.ForeignKeyField("models.Tag", related_name="diary_tags")
+    # 태그별 최근 일기를 조인/정렬 없이 인덱스로 읽기 위한 비정규화 컬럼 (일기의 값과 같음)
+    user_id = fields.IntField()
+    created_at = fields.DatetimeField()
 
     class Meta:
         table = "diary_tags"
         unique_together = [("diary", "tag")]
+        indexes = (("user_id", "tag_id", "created_at"),)
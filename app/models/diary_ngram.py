@@ -0,0 +1,21 @@
+from tortoise import fields, models
+
+
+class DiaryNgram(models.Model):
+    """
+    일기 제목/본문의 2-gram 역색인 (한국어 부분 문자열 검색용)
+    한 행이 (사용자, n-gram, 필드) -> 일기 하나의 posting 항목입니다.
+    """
+
+    id = fields.IntField(primary_key=True)
+    diary = fields.ForeignKeyField(
+        "models.Diary", related_name="ngrams", on_delete=fields.CASCADE
+    )
+    user_id = fields.IntField()  # 조인 없이 사용자별로 조회하기 위한 비정규화 컬럼
+    field = fields.CharField(max_length=1)  # "t": 제목, "c": 본문
+    gram = fields.CharField(max_length=8)
+
+    class Meta:
+        table = "diary_ngram"
+        unique_together = (("diary_id", "field", "gram"),)
+        indexes = (("user_id", "gram", "field", "diary_id"),)
@@ -0,0 +1,16 @@
+from tortoise import fields, models
+
+
+class SummaryCache(models.Model):
+    """
+    AI 요약 결과 캐시 (영구 저장 계층)
+    key는 (모델 이름, 프롬프트 버전, 일기 본문)의 SHA-256 해시입니다.
+    """
+
+    key = fields.CharField(max_length=64, primary_key=True)
+    model = fields.CharField(max_length=100)
+    summary = fields.TextField()
+    created_at = fields.DatetimeField(auto_now_add=True)
+
+    class Meta:
+        table = "summary_cache"
@@ -3,7 +3,7 @@ from tortoise import fields, models
 
 class Tag(models.Model):
     id = fields.IntField(pk=True)
-    name = fields.CharField(max_length=50)
+    name = fields.CharField(max_length=50, unique=True)
 
     class Meta:
         table = "tag"
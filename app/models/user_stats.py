@@ -0,0 +1,67 @@
+from tortoise import fields, models
+
+
+class UserEmotionDaily(models.Model):
+    """
+    사용자/날짜/감정별 일기 수 (일기 작성/수정/삭제 트랜잭션 안에서 함께 갱신)
+    """
+
+    id = fields.IntField(primary_key=True)
+    user_id = fields.IntField()
+    day = fields.DateField()
+    emotional_state = fields.CharField(max_length=20)
+    count = fields.IntField(default=0)
+
+    class Meta:
+        table = "user_emotion_daily"
+        unique_together = (("user_id", "day", "emotional_state"),)
+
+
+class UserTagUsage(models.Model):
+    """
+    사용자별 태그 사용 횟수 (일기 작성/수정/삭제 트랜잭션 안에서 함께 갱신)
+    """
+
+    id = fields.IntField(primary_key=True)
+    user_id = fields.IntField()
+    tag = fields.ForeignKeyField(
+        "models.Tag", related_name="user_usages", on_delete=fields.CASCADE
+    )
+    usage_count = fields.IntField(default=0)
+    updated_at = fields.DatetimeField(auto_now=True)
+
+    class Meta:
+        table = "user_tag_usage"
+        unique_together = (("user_id", "tag_id"),)
+        # 사용 횟수 순 태그 목록 (커서 페이지네이션)용
+        indexes = (("user_id", "usage_count", "tag_id"),)
+
+
+class UserCalendar(models.Model):
+    """
+    사용자/연도별 달력. 1월 1일부터 하루에 1바이트(366바이트)이며,
+    하위 3비트는 그날의 대표 감정, 상위 5비트는 일기 수(최대 31)입니다.
+    (user_emotion_daily와 함께 일기 작성/수정/삭제 트랜잭션 안에서 갱신)
+    """
+
+    id = fields.IntField(primary_key=True)
+    user_id = fields.IntField()
+    year = fields.IntField()
+    days = fields.BinaryField()
+
+    class Meta:
+        table = "user_calendar"
+        unique_together = (("user_id", "year"),)
+
+
+class UserDiaryVersion(models.Model):
+    """
+    사용자별 일기 목록 버전. 일기 내용이 바뀌는 모든 쓰기(작성/수정/삭제, 일괄 작업,
+    태그 이름 변경, AI 요약 저장)에서 같은 트랜잭션 안에서 1씩 올립니다. (목록 ETag용)
+    """
+
+    user_id = fields.IntField(primary_key=True, generated=False)
+    version = fields.BigIntField(default=0)
+
+    class Meta:
+        table = "user_diary_version"
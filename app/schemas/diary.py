@@ -1,8 +1,15 @@
 from datetime import date, datetime
 from enum import Enum
-from typing import List, Optional
+from typing import Annotated, Dict, List, Optional
 
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    StringConstraints,
+    field_validator,
+    model_validator,
+)
 
 
 class EmotionalState(str, Enum):
@@ -20,6 +27,13 @@ class DiaryCreate(BaseModel):
     # ai_summary: Optional[str] = None
 
 
+# 일기 가져오기(NDJSON) 한 줄. DB 컬럼 길이를 넘는 값은 줄 단위 오류로 처리합니다.
+class DiaryImportRow(DiaryCreate):
+    title: str = Field(max_length=100)
+    tags: Optional[List[Annotated[str, StringConstraints(max_length=50)]]] = []
+    created_at: Optional[datetime] = None  # 원래 작성 시각 (없으면 가져온 시각)
+
+
 class DiaryUpdate(BaseModel):
     title: str | None = None
     content: str | None = None
@@ -36,6 +50,7 @@ class DiaryOut(BaseModel):
     content: str
     emotional_state: EmotionalState
     ai_summary: Optional[str] = None
+    emotion_scores: Optional[Dict[str, float]] = None
     tags: List[str] = []
     created_at: datetime
     updated_at: datetime
@@ -58,6 +73,33 @@ class DiaryOut(BaseModel):
         return v if isinstance(v, list) else []
 
 
+class DiarySearchResult(DiaryOut):
+    """검색 결과 (전문 검색일 때 일치 부분 스니펫과 관련도 점수 포함)"""
+
+    snippet: Optional[str] = None
+    rank: Optional[float] = None
+
+
+class DiaryPage(BaseModel):
+    """커서 기반 일기 목록 페이지"""
+
+    items: List[DiaryOut]
+    next_cursor: Optional[str] = (
+        None  # 다음 페이지 요청 시 cursor로 전달 (없으면 마지막)
+    )
+
+
+class SummaryJobOut(BaseModel):
+    """AI 요약 작업 상태"""
+
+    job_id: str
+    diary_id: int
+    status: str  # queued | running | retrying | succeeded | failed
+    attempts: int = 0
+    ai_summary: Optional[str] = None  # succeeded일 때 요약 결과
+    error: Optional[str] = None  # 마지막 실패 사유
+
+
 class DiarySearchParams(BaseModel):
     """일기 검색 파라미터"""
 
@@ -65,3 +107,39 @@ class DiarySearchParams(BaseModel):
     tags: Optional[List[str]] = None  # 태그 검색 (태그 이름 리스트)
     start_date: Optional[date] = None  # 시작 날짜
     end_date: Optional[date] = None  # 종료 날짜
+
+
+class DiaryBulkTarget(BaseModel):
+    """일괄 작업 대상: ids(일기 id 목록)와 filter(복합 검색 조건) 중 하나"""
+
+    ids: Optional[List[int]] = None
+    filter: Optional[DiarySearchParams] = None
+
+    @model_validator(mode="after")
+    def check_target(self):
+        if (self.ids is None) == (self.filter is None):
+            raise ValueError("ids와 filter 중 하나만 입력해 주세요.")
+        # 조건 없는 filter로 모든 일기가 바뀌지 않도록 막습니다.
+        if self.filter is not None and not any(
+            self.filter.model_dump(exclude_none=True).values()
+        ):
+            raise ValueError("filter에 조건을 하나 이상 입력해 주세요.")
+        return self
+
+
+class DiaryBulkDelete(DiaryBulkTarget):
+    pass
+
+
+class DiaryBulkUpdate(DiaryBulkTarget):
+    emotional_state: Optional[EmotionalState] = (
+        None  # 모든 대상 일기의 감정을 이 값으로
+    )
+    add_tags: List[str] = []  # 모든 대상 일기에 추가할 태그
+    remove_tags: List[str] = []  # 모든 대상 일기에서 뗄 태그
+
+
+# 일괄 작업 결과
+class DiaryBulkResult(BaseModel):
+    matched: int  # 조건에 맞은 일기 수
+    affected: int  # 실제로 바뀐(삭제된) 일기 수
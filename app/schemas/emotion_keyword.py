@@ -0,0 +1,25 @@
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from app.models.emotion_keyword import EmotionType
+
+
+class EmotionKeywordBase(BaseModel):
+    emotion_keyword: str
+    emotion_type: EmotionType
+
+
+class EmotionKeywordCreate(EmotionKeywordBase):
+    pass
+
+
+class EmotionKeywordUpdate(BaseModel):
+    emotion_keyword: Optional[str] = None
+    emotion_type: Optional[EmotionType] = None
+
+
+class EmotionKeywordResponse(EmotionKeywordBase):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
@@ -0,0 +1,28 @@
+from datetime import date
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel
+
+
+class EmotionDailyCount(BaseModel):
+    day: date
+    emotional_state: str
+    count: int
+
+
+# 감정 통계 응답 (GET /api/v1/stats/emotions)
+class EmotionStats(BaseModel):
+    daily: List[EmotionDailyCount]  # 날짜/감정별 일기 수
+    totals: Dict[str, int]  # 기간 전체 감정별 일기 수
+
+
+class CalendarDay(BaseModel):
+    day: date
+    count: int  # 그날 쓴 일기 수 (31 이상은 31)
+    emotional_state: Optional[str]  # 그날 가장 많았던 감정
+
+
+# 연간 달력 (GET /api/v1/stats/calendar)
+class CalendarOut(BaseModel):
+    year: int
+    days: List[CalendarDay]  # 일기가 있는 날만 포함
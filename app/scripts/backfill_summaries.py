@@ -0,0 +1,69 @@
+"""
+요약(ai_summary)이 없는 모든 일기의 AI 요약을 일괄 생성합니다.
+
+여러 일기를 한 번의 모델 호출로 요약하고, 응답을 해석할 수 없으면 개별 요약으로 대체합니다.
+중간에 중단해도 다시 실행하면 요약이 없는 일기부터 이어서 처리합니다.
+
+    python -m app.scripts.backfill_summaries --batch-size 20 --max-tokens 8000 --concurrency 4
+"""
+
+import argparse
+import asyncio
+
+from tortoise import Tortoise
+
+from app.core.config import (
+    SUMMARY_BACKFILL_CONCURRENCY,
+    SUMMARY_BATCH_MAX_TOKENS,
+    SUMMARY_BATCH_SIZE,
+    TORTOISE_ORM,
+)
+from app.services.summary_service import backfill_summaries, get_summary_cache_stats
+
+
+async def run(args):
+    config = TORTOISE_ORM
+    if args.db_url:
+        config = {**TORTOISE_ORM, "connections": {"default": args.db_url}}
+    await Tortoise.init(config=config)
+    try:
+        result = await backfill_summaries(
+            page_size=args.page_size,
+            batch_size=args.batch_size,
+            max_tokens=args.max_tokens,
+            concurrency=args.concurrency,
+            limit=args.limit,
+        )
+        print(result)
+        print(get_summary_cache_stats())
+    finally:
+        await Tortoise.close_connections()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--batch-size", type=int, default=SUMMARY_BATCH_SIZE, help="호출당 최대 일기 수"
+    )
+    parser.add_argument(
+        "--max-tokens",
+        type=int,
+        default=SUMMARY_BATCH_MAX_TOKENS,
+        help="호출당 최대 예상 입력 토큰 수",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=SUMMARY_BACKFILL_CONCURRENCY,
+        help="동시에 진행할 모델 호출 수",
+    )
+    parser.add_argument(
+        "--page-size", type=int, default=500, help="한 번에 읽을 일기 수"
+    )
+    parser.add_argument("--limit", type=int, default=None, help="처리할 최대 일기 수")
+    parser.add_argument("--db-url", default=None, help="기본값: TORTOISE_ORM 설정")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+사용자별 감정/태그 집계 테이블을 일기 원본에서 다시 계산합니다.
+
+집계 값이 원본과 어긋났을 때(수동 DB 수정, 배포 중 장애 등) 복구용으로 실행합니다.
+
+    python -m app.scripts.rebuild_stats            # 전체 사용자
+    python -m app.scripts.rebuild_stats --user-id 42
+"""
+
+import argparse
+import asyncio
+
+from tortoise import Tortoise
+
+from app.core.config import TORTOISE_ORM
+from app.services.stats_service import rebuild_user_stats
+
+
+async def run(args):
+    config = TORTOISE_ORM
+    if args.db_url:
+        config = {**TORTOISE_ORM, "connections": {"default": args.db_url}}
+    await Tortoise.init(config=config)
+    try:
+        emotion_rows, tag_rows = await rebuild_user_stats(args.user_id)
+        print(f"user_emotion_daily={emotion_rows} user_tag_usage={tag_rows}")
+    finally:
+        await Tortoise.close_connections()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--user-id", type=int, default=None, help="기본값: 전체")
+    parser.add_argument("--db-url", default=None, help="기본값: TORTOISE_ORM 설정")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
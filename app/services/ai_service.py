@@ -1,16 +1,26 @@
-import google.generativeai as genai
-
-from app.core.config import GEMINI_API_KEY
+import asyncio
+import json
+import time
+from typing import AsyncIterator, Awaitable, Callable, Dict, Optional, TypeVar
 
-genai.configure(api_key=GEMINI_API_KEY)
+import google.generativeai as genai
 
+from app.core.config import (
+    AI_BACKEND,
+    AI_CIRCUIT_FAILURE_THRESHOLD,
+    AI_CIRCUIT_RESET_SECONDS,
+    AI_MAX_CONCURRENCY,
+    AI_TIMEOUT_SECONDS,
+    GEMINI_API_KEY,
+    GEMINI_MODEL,
+)
+from app.utils.circuit_breaker import CircuitBreaker, CircuitOpenError
 
-class GeminiService:
-    def __init__(self):
-        self.model = genai.GenerativeModel("gemini-1.5-flash")
+T = TypeVar("T")
 
-    async def summarize_diary(self, content: str) -> str:
-        prompt = f"""
+# 프롬프트 내용을 바꾸면 버전도 올려야 기존 요약 캐시가 재사용되지 않습니다.
+SUMMARY_PROMPT_VERSION = "1"
+SUMMARY_PROMPT = """
 아래는 사용자가 작성한 일기 내용입니다. 이 일기의 핵심 내용을 간결하고 명확하게 요약해 주세요.
 
 ---
@@ -20,8 +30,334 @@ class GeminiService:
 요약은 2~3문장 이내로 작성해 주세요.
         """
 
+# 여러 일기를 한 번에 요약하는 프롬프트 (JSON 배열로 응답)
+BATCH_SUMMARY_PROMPT = """
+아래는 한 사용자가 작성한 여러 개의 일기입니다. 각 일기의 핵심 내용을 간결하고 명확하게 요약해 주세요.
+요약은 일기마다 2~3문장 이내로 작성해 주세요.
+
+입력은 {{"id": 일기 번호, "content": 일기 내용}} 형식의 JSON 배열입니다.
+반드시 [{{"id": 일기 번호, "summary": "요약"}}, ...] 형식의 JSON 배열로만 응답해 주세요.
+
+{diaries}
+"""
+
+
+def build_batch_prompt(contents: Dict[int, str]) -> str:
+    diaries = [{"id": diary_id, "content": text} for diary_id, text in contents.items()]
+    return BATCH_SUMMARY_PROMPT.format(diaries=json.dumps(diaries, ensure_ascii=False))
+
+
+def parse_batch_summaries(text: str, diary_ids) -> Dict[int, str]:
+    """
+    일괄 요약 응답(JSON 배열)을 {일기 id: 요약}으로 나눕니다.
+    요청하지 않은 id나 형식이 잘못된 항목은 버리고, 응답 전체를 해석할 수 없으면 ValueError를 냅니다.
+    """
+    text = text.strip()
+    # ```json ... ``` 코드 블록으로 감싼 응답 처리
+    if text.startswith("```"):
+        text = text.strip("`").removeprefix("json").strip()
+    try:
+        items = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"일괄 요약 응답을 해석할 수 없습니다: {e}")
+    if not isinstance(items, list):
+        raise ValueError("일괄 요약 응답이 JSON 배열이 아닙니다.")
+
+    wanted = set(diary_ids)
+    summaries = {}
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        diary_id, summary = item.get("id"), item.get("summary")
+        if diary_id in wanted and isinstance(summary, str) and summary.strip():
+            summaries[diary_id] = summary.strip()
+    return summaries
+
+
+class GeminiService:
+    def __init__(self, model_name: str = GEMINI_MODEL):
+        genai.configure(api_key=GEMINI_API_KEY)
+        self.model_name = model_name
+        self.model = genai.GenerativeModel(model_name)
+
+    async def summarize_diary(self, content: str) -> str:
+        prompt = SUMMARY_PROMPT.format(content=content)
+
         try:
             response = await self.model.generate_content_async(prompt)
             return response.text.strip()
         except Exception as e:
             raise Exception(f"AI 요약 생성 실패: {str(e)}")
+
+    async def summarize_diaries(self, contents: Dict[int, str]) -> Dict[int, str]:
+        """
+        여러 일기를 한 번의 호출로 요약합니다. ({일기 id: 본문} -> {일기 id: 요약})
+        응답에서 빠진 일기는 결과에 포함되지 않습니다.
+        """
+        prompt = build_batch_prompt(contents)
+        try:
+            response = await self.model.generate_content_async(
+                prompt, generation_config={"response_mime_type": "application/json"}
+            )
+        except Exception as e:
+            raise Exception(f"AI 일괄 요약 생성 실패: {str(e)}")
+        return parse_batch_summaries(response.text, contents)
+
+    async def stream_summary(self, content: str) -> AsyncIterator[str]:
+        """요약을 모델이 생성하는 대로 텍스트 조각 단위로 내보냅니다."""
+        prompt = SUMMARY_PROMPT.format(content=content)
+        try:
+            response = await self.model.generate_content_async(prompt, stream=True)
+            async for chunk in response:
+                if chunk.text:
+                    yield chunk.text
+        except Exception as e:
+            raise Exception(f"AI 요약 생성 실패: {str(e)}")
+
+
+class FakeGeminiService:
+    """
+    외부 API를 호출하지 않는 GeminiService 대역입니다. (개발/테스트/벤치마크용)
+    latency 초만큼 기다린 뒤 본문 앞부분을 요약으로 반환하고, 호출 횟수를 셉니다.
+    처음 failures 번의 호출은 일시적 오류를 흉내 내 실패합니다.
+    broken_batches 번의 일괄 요약은 해석할 수 없는 응답을 흉내 내 실패합니다.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "fake-gemini",
+        latency: float = 0.0,
+        failures: int = 0,
+        broken_batches: int = 0,
+    ):
+        self.model_name = model_name
+        self.latency = latency
+        self.failures = failures
+        self.broken_batches = broken_batches
+        self.calls = 0
+        self.batch_calls = 0
+
+    async def summarize_diary(self, content: str) -> str:
+        self.calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.calls <= self.failures:
+            raise Exception("AI 요약 생성 실패: 일시적인 오류 (fake)")
+        return f"요약: {content[:50].strip()}"
+
+    async def summarize_diaries(self, contents: Dict[int, str]) -> Dict[int, str]:
+        self.batch_calls += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.batch_calls <= self.broken_batches:
+            return parse_batch_summaries("요약을 만들 수 없습니다.", contents)
+        response = json.dumps(
+            [
+                {"id": diary_id, "summary": f"요약: {text[:50].strip()}"}
+                for diary_id, text in contents.items()
+            ],
+            ensure_ascii=False,
+        )
+        return parse_batch_summaries(response, contents)
+
+    async def stream_summary(self, content: str) -> AsyncIterator[str]:
+        # 요약을 단어 단위로 나눠 latency 초 간격으로 내보냅니다.
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise Exception("AI 요약 생성 실패: 일시적인 오류 (fake)")
+        for i, word in enumerate(f"요약: {content[:50].strip()}".split(" ")):
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            yield word if i == 0 else " " + word
+
+
+class AIServiceUnavailable(Exception):
+    """AI 서비스 호출이 시간 초과되었거나 회로가 열려 바로 실패한 경우"""
+
+
+class AIClient:
+    """
+    앱 전체에서 하나만 쓰는 AI 요약 클라이언트입니다. (GeminiService 등을 감쌉니다.)
+
+    - 동시에 나가는 호출을 max_concurrency 개로 제한하고, 나머지는 대기합니다.
+    - 호출마다 timeout 초가 지나면 AIServiceUnavailable로 실패합니다.
+    - 연속 실패가 쌓이면 회로를 열어 제공자가 회복될 때까지 호출 없이 바로 실패합니다.
+      (응답 형식 오류(ValueError)는 제공자는 응답한 것이므로 회로 실패로 세지 않습니다.)
+    """
+
+    def __init__(
+        self,
+        service,
+        max_concurrency: int = AI_MAX_CONCURRENCY,
+        timeout: float = AI_TIMEOUT_SECONDS,
+        failure_threshold: int = AI_CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = AI_CIRCUIT_RESET_SECONDS,
+    ):
+        self.service = service
+        self.model_name = service.model_name
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.circuit = CircuitBreaker(failure_threshold, reset_timeout)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # 메트릭
+        self.calls = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.waiting = 0
+        self.total_latency_seconds = 0.0
+        self.max_latency_seconds = 0.0
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # 세마포어는 이벤트 루프에 묶이므로 루프가 바뀌면(테스트 등) 새로 만듭니다.
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+        return self._semaphore
+
+    async def _call(self, func: Callable[..., Awaitable[T]], *args) -> T:
+        semaphore = self._get_semaphore()
+        self.waiting += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            self.waiting -= 1
+
+        # 슬롯을 얻은 뒤에 회로를 확인해야 대기 중인 호출이 시험 호출 자리를 차지하지 않습니다.
+        try:
+            trial = self.circuit.before_call()
+        except CircuitOpenError as e:
+            semaphore.release()
+            raise AIServiceUnavailable(str(e))
+
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        started = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(func(*args), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            self.timeouts += 1
+            self.errors += 1
+            self.circuit.record_failure()
+            raise AIServiceUnavailable(
+                f"AI 서비스 응답 시간이 초과되었습니다. ({self.timeout}초)"
+            )
+        except ValueError:
+            self.errors += 1
+            self.circuit.record_success()
+            raise
+        except Exception:
+            self.errors += 1
+            self.circuit.record_failure()
+            raise
+        except BaseException:
+            # 취소된 호출 (제공자 실패가 아님)
+            self.circuit.record_cancelled(trial)
+            raise
+        else:
+            self.circuit.record_success()
+            return result
+        finally:
+            latency = time.perf_counter() - started
+            self.total_latency_seconds += latency
+            self.max_latency_seconds = max(self.max_latency_seconds, latency)
+            self.in_flight -= 1
+            semaphore.release()
+
+    async def summarize_diary(self, content: str) -> str:
+        return await self._call(self.service.summarize_diary, content)
+
+    async def summarize_diaries(self, contents: Dict[int, str]) -> Dict[int, str]:
+        return await self._call(self.service.summarize_diaries, contents)
+
+    async def stream_summary(self, content: str) -> AsyncIterator[str]:
+        """
+        스트리밍 요약. 스트림이 끝날 때까지 동시 실행 슬롯을 차지하며,
+        제한 시간은 조각 하나를 기다리는 시간에 적용됩니다.
+        """
+        async with self._get_semaphore():
+            try:
+                trial = self.circuit.before_call()
+            except CircuitOpenError as e:
+                raise AIServiceUnavailable(str(e))
+
+            self.calls += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            started = time.perf_counter()
+            stream = self.service.stream_summary(content)
+            try:
+                while True:
+                    try:
+                        chunk = await asyncio.wait_for(
+                            anext(stream), timeout=self.timeout
+                        )
+                    except StopAsyncIteration:
+                        break
+                    yield chunk
+            except asyncio.TimeoutError:
+                self.timeouts += 1
+                self.errors += 1
+                self.circuit.record_failure()
+                raise AIServiceUnavailable(
+                    f"AI 서비스 응답 시간이 초과되었습니다. ({self.timeout}초)"
+                )
+            except Exception:
+                self.errors += 1
+                self.circuit.record_failure()
+                raise
+            except BaseException:
+                # 클라이언트가 연결을 끊었거나 취소된 경우 (제공자 실패가 아님)
+                self.circuit.record_cancelled(trial)
+                raise
+            else:
+                self.circuit.record_success()
+            finally:
+                await stream.aclose()
+                latency = time.perf_counter() - started
+                self.total_latency_seconds += latency
+                self.max_latency_seconds = max(self.max_latency_seconds, latency)
+                self.in_flight -= 1
+
+    def stats(self) -> dict:
+        return {
+            "model": self.model_name,
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "waiting": self.waiting,
+            "calls": self.calls,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "avg_latency_ms": (
+                round(self.total_latency_seconds / self.calls * 1000, 3)
+                if self.calls
+                else 0.0
+            ),
+            "max_latency_ms": round(self.max_latency_seconds * 1000, 3),
+            "circuit": self.circuit.stats(),
+        }
+
+
+_ai_service: Optional[AIClient] = None
+
+
+def get_ai_service() -> AIClient:
+    """AI_BACKEND 설정에 맞는 요약 클라이언트를 반환합니다. (프로세스당 하나)"""
+    global _ai_service
+    if _ai_service is None:
+        if AI_BACKEND == "fake":
+            _ai_service = AIClient(FakeGeminiService())
+        else:
+            _ai_service = AIClient(GeminiService())
+    return _ai_service
+
+
+def get_ai_service_stats() -> Optional[dict]:
+    # 아직 한 번도 사용하지 않았다면 클라이언트를 만들지 않습니다.
+    return _ai_service.stats() if _ai_service is not None else None
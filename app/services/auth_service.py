@@ -1,28 +1,55 @@
+import asyncio
+import logging
+import time
 from datetime import datetime, timedelta
 
 from jose import JWTError, jwt
 from pydantic import ValidationError
 from tortoise.exceptions import DoesNotExist, IntegrityError
+from tortoise.transactions import in_transaction
 
 from ..core.config import (
     ACCESS_TOKEN_EXPIRE_MINUTES,
     ALGORITHM,
+    DIARY_BULK_CHUNK_SIZE,
     REFRESH_TOKEN_EXPIRE_DAYS,
     SECRET_KEY,
 )
-from ..models import User
+from ..models import (
+    Diary,
+    User,
+    UserCalendar,
+    UserDiaryVersion,
+    UserEmotionDaily,
+    UserTagUsage,
+)
 from ..models.token_blacklist import TokenBlacklist
 from ..utils.security import (
     create_access_token,
     create_refresh_token,
-    hash_password,
-    verify_password,
+    hash_password_async,
+    invalidate_user_cache,
+    revoked_tokens,
+    verify_password_async,
 )
+from .fulltext_service import unindex_diaries
+
+logger = logging.getLogger(__name__)
+
+# 만료 토큰 정리 작업의 누적 지표
+token_purge_stats = {
+    "runs": 0,
+    "total_deleted": 0,
+    "last_deleted": 0,
+    "last_batches": 0,
+    "last_duration_ms": 0.0,
+    "last_run_at": None,
+}
 
 
 async def register_user_service(user_data: dict):
     try:
-        hashed_password = hash_password(user_data["password"])
+        hashed_password = await hash_password_async(user_data["password"])
         new_user = await User.create(
             email=user_data["email"],
             password=hashed_password,
@@ -41,7 +68,9 @@ async def register_user_service(user_data: dict):
 async def login_user_service(user_data: dict):
     try:
         user = await User.get_or_none(email=user_data["email"])
-        if not user or not verify_password(user_data["password"], user.password):
+        if not user or not await verify_password_async(
+            user_data["password"], user.password
+        ):
             return {"error": "이메일 또는 비밀번호가 잘못되었습니다."}
 
         access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
@@ -71,6 +100,7 @@ async def logout_user_service(token: str):
             await TokenBlacklist.create(
                 jti=jti, exp=datetime.fromtimestamp(payload.get("exp"))
             )
+            revoked_tokens.add(jti, payload.get("exp"))
             return {"message": "로그아웃 성공"}
         return {"error": "유효하지 않은 토큰입니다."}
     except JWTError:
@@ -82,8 +112,58 @@ async def logout_user_service(token: str):
 
 
 async def is_token_revoked(jti: str) -> bool:
-    token = await TokenBlacklist.get_or_none(jti=jti)
-    return token is not None
+    return await revoked_tokens.is_revoked(jti)
+
+
+async def purge_expired_tokens_service(batch_size: int = 1000) -> dict:
+    """
+    만료된 블랙리스트 토큰을 batch_size 개씩 나누어 삭제합니다.
+    만료된 토큰은 JWT 검증에서 이미 거부되므로 더 보관할 필요가 없습니다.
+    한 번에 삭제하는 범위를 작게 유지해 긴 잠금을 피합니다.
+    """
+    started = time.perf_counter()
+    now = datetime.now()
+    deleted = 0
+    batches = 0
+
+    while True:
+        ids = (
+            await TokenBlacklist.filter(exp__lte=now)
+            .limit(batch_size)
+            .values_list("id", flat=True)
+        )
+        if not ids:
+            break
+        deleted += await TokenBlacklist.filter(id__in=ids).delete()
+        batches += 1
+        # 다른 요청이 DB를 사용할 수 있도록 배치 사이에 양보합니다.
+        await asyncio.sleep(0)
+
+    duration_ms = round((time.perf_counter() - started) * 1000, 3)
+    token_purge_stats["runs"] += 1
+    token_purge_stats["total_deleted"] += deleted
+    token_purge_stats["last_deleted"] = deleted
+    token_purge_stats["last_batches"] = batches
+    token_purge_stats["last_duration_ms"] = duration_ms
+    token_purge_stats["last_run_at"] = now.isoformat()
+    return {"deleted": deleted, "batches": batches, "duration_ms": duration_ms}
+
+
+async def run_token_purge_loop(interval: float, batch_size: int) -> None:
+    """interval 초마다 만료 토큰을 정리합니다. lifespan에서 태스크로 실행합니다."""
+    while True:
+        try:
+            result = await purge_expired_tokens_service(batch_size)
+            if result["deleted"]:
+                logger.info(
+                    "만료 토큰 %d개 삭제 (%d 배치, %.1fms)",
+                    result["deleted"],
+                    result["batches"],
+                    result["duration_ms"],
+                )
+        except Exception as e:
+            logger.warning("만료 토큰 정리 실패: %s", e)
+        await asyncio.sleep(interval)
 
 
 async def get_user_profile_service(current_user_id: str) -> dict:
@@ -108,10 +188,11 @@ async def update_user_profile_service(current_user_id: str, new_data: dict) -> d
             user.email = new_data["email"]
 
         if "password" in new_data:
-            hashed_password = hash_password(new_data["password"])
+            hashed_password = await hash_password_async(new_data["password"])
             user.password = hashed_password
 
         await user.save()
+        invalidate_user_cache(user.id)
         return {"message": "프로필이 성공적으로 업데이트되었습니다."}
     except DoesNotExist:
         return {"error": "사용자를 찾을 수 없습니다."}
@@ -122,9 +203,31 @@ async def update_user_profile_service(current_user_id: str, new_data: dict) -> d
 
 
 async def delete_user_service(current_user_id: str) -> dict:
+    """
+    사용자를 삭제합니다. 일기와 diary_tags는 FK로 함께 지워지고, FK가 없는
+    집계 테이블과 검색 색인은 같은 트랜잭션 안에서 직접 지웁니다.
+    """
     try:
-        user = await User.get(id=current_user_id)
-        await user.delete()
+        async with in_transaction() as conn:
+            user = await User.get(id=current_user_id).using_db(conn)
+            diary_ids = (
+                await Diary.filter(user_id=user.id)
+                .using_db(conn)
+                .values_list("id", flat=True)
+            )
+            for start in range(0, len(diary_ids), DIARY_BULK_CHUNK_SIZE):
+                await unindex_diaries(
+                    diary_ids[start : start + DIARY_BULK_CHUNK_SIZE], using_db=conn
+                )
+            for model in (
+                UserEmotionDaily,
+                UserTagUsage,
+                UserCalendar,
+                UserDiaryVersion,
+            ):
+                await model.filter(user_id=user.id).using_db(conn).delete()
+            await user.delete(using_db=conn)
+        invalidate_user_cache(user.id)
         return {"message": "사용자가 성공적으로 삭제되었습니다."}
     except DoesNotExist:
         return {"error": "사용자를 찾을 수 없습니다."}
@@ -0,0 +1,190 @@
+# app/services/bulk_service.py
+
+from collections import Counter
+from typing import Iterator, List, Sequence
+
+from fastapi import HTTPException, status
+from tortoise import timezone
+from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.queryset import QuerySet
+from tortoise.transactions import in_transaction
+
+from app.core.config import DIARY_BULK_CHUNK_SIZE, DIARY_BULK_MAX_IDS
+from app.models.diary import Diary, DiaryTag, EmotionalState
+from app.models.tag import Tag
+from app.schemas.diary import (
+    DiaryBulkDelete,
+    DiaryBulkResult,
+    DiaryBulkTarget,
+    DiaryBulkUpdate,
+)
+from app.services.fulltext_service import unindex_diaries
+from app.services.search_service import combined_search_conditions
+from app.services.stats_service import apply_stats_deltas, bump_diary_version
+from app.services.tag_service import normalize_tag_names, resolve_tags
+
+
+def _chunks(items: Sequence[int], size: int) -> Iterator[Sequence[int]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def bulk_target_query(user_id: int, target: DiaryBulkTarget) -> QuerySet:
+    """
+    일괄 작업 대상 일기 쿼리를 만듭니다.
+    ids든 filter든 소유권 조건(user_id)을 항상 같은 쿼리에 넣습니다.
+    """
+    query = Diary.filter(user_id=user_id)
+    if target.ids is not None:
+        if len(target.ids) > DIARY_BULK_MAX_IDS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"ids는 최대 {DIARY_BULK_MAX_IDS}개까지 입력할 수 있습니다.",
+            )
+        return query.filter(id__in=target.ids)
+    for condition in combined_search_conditions(user_id, target.filter):
+        query = query.filter(condition)
+    return query
+
+
+async def _lock_targets(
+    user_id: int, target: DiaryBulkTarget, conn: BaseDBAsyncClient
+) -> List[Diary]:
+    """대상 일기의 id/created_at/emotional_state만 행 잠금과 함께 읽습니다."""
+    if target.ids is not None and not target.ids:
+        return []
+    return await (
+        bulk_target_query(user_id, target)
+        .using_db(conn)
+        .select_for_update()
+        .order_by("id")
+        .only("id", "created_at", "emotional_state")
+    )
+
+
+async def bulk_delete_diaries_service(
+    user_id: int, data: DiaryBulkDelete
+) -> DiaryBulkResult:
+    """
+    대상 일기를 한꺼번에 삭제합니다.
+    diary_tags, 검색 색인, 통계 집계도 DIARY_BULK_CHUNK_SIZE 개씩 IN 쿼리로 함께 정리합니다.
+    """
+    async with in_transaction() as conn:
+        diaries = await _lock_targets(user_id, data, conn)
+        ids = [diary.id for diary in diaries]
+
+        emotions: Counter = Counter()
+        for diary in diaries:
+            emotions[(diary.created_at.date(), diary.emotional_state)] -= 1
+        tag_usage: Counter = Counter()
+
+        for chunk in _chunks(ids, DIARY_BULK_CHUNK_SIZE):
+            diary_tags = DiaryTag.filter(user_id=user_id, diary_id__in=chunk).using_db(
+                conn
+            )
+            tag_usage.subtract(await diary_tags.values_list("tag_id", flat=True))
+            await diary_tags.delete()
+            await unindex_diaries(list(chunk), using_db=conn)
+            await Diary.filter(user_id=user_id, id__in=chunk).using_db(conn).delete()
+
+        await apply_stats_deltas(user_id, emotions, tag_usage, using_db=conn)
+        if ids:
+            await bump_diary_version(user_id, using_db=conn)
+    return DiaryBulkResult(matched=len(ids), affected=len(ids))
+
+
+async def bulk_update_diaries_service(
+    user_id: int, data: DiaryBulkUpdate
+) -> DiaryBulkResult:
+    """
+    대상 일기의 감정을 바꾸거나 태그를 추가/제거합니다.
+    UPDATE/INSERT/DELETE를 DIARY_BULK_CHUNK_SIZE 개씩 IN 쿼리로 실행하고,
+    실제로 바뀐 일기만 updated_at을 갱신합니다.
+    """
+    add_names = normalize_tag_names(data.add_tags)
+    remove_names = normalize_tag_names(data.remove_tags)
+    if set(add_names) & set(remove_names):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="같은 태그를 추가하면서 제거할 수 없습니다.",
+        )
+
+    async with in_transaction() as conn:
+        diaries = await _lock_targets(user_id, data, conn)
+        created_at = {diary.id: diary.created_at for diary in diaries}
+        now = timezone.now()
+
+        emotions: Counter = Counter()
+        state_changed = []
+        if data.emotional_state:
+            new_state = EmotionalState(data.emotional_state.value)
+            for diary in diaries:
+                if diary.emotional_state != new_state:
+                    day = diary.created_at.date()
+                    emotions[(day, diary.emotional_state)] -= 1
+                    emotions[(day, new_state)] += 1
+                    state_changed.append(diary.id)
+            for chunk in _chunks(state_changed, DIARY_BULK_CHUNK_SIZE):
+                await (
+                    Diary.filter(user_id=user_id, id__in=chunk)
+                    .using_db(conn)
+                    .update(emotional_state=new_state, updated_at=now)
+                )
+
+        add_tag_ids = [tag.id for tag in await resolve_tags(add_names, using_db=conn)]
+        remove_tag_ids = []
+        if remove_names:
+            remove_tag_ids = await (
+                Tag.filter(name__in=remove_names)
+                .using_db(conn)
+                .values_list("id", flat=True)
+            )
+
+        tag_usage: Counter = Counter()
+        tag_changed = set()
+        for chunk in _chunks(list(created_at), DIARY_BULK_CHUNK_SIZE):
+            if remove_tag_ids:
+                removed = DiaryTag.filter(
+                    user_id=user_id, diary_id__in=chunk, tag_id__in=remove_tag_ids
+                ).using_db(conn)
+                pairs = await removed.values_list("diary_id", "tag_id")
+                if pairs:
+                    await removed.delete()
+                    tag_usage.subtract(tag_id for _, tag_id in pairs)
+                    tag_changed.update(diary_id for diary_id, _ in pairs)
+            if add_tag_ids:
+                existing = set(
+                    await DiaryTag.filter(diary_id__in=chunk, tag_id__in=add_tag_ids)
+                    .using_db(conn)
+                    .values_list("diary_id", "tag_id")
+                )
+                added = [
+                    DiaryTag(
+                        diary_id=diary_id,
+                        tag_id=tag_id,
+                        user_id=user_id,
+                        created_at=created_at[diary_id],
+                    )
+                    for diary_id in chunk
+                    for tag_id in add_tag_ids
+                    if (diary_id, tag_id) not in existing
+                ]
+                if added:
+                    await DiaryTag.bulk_create(added, using_db=conn)
+                    tag_usage.update(diary_tag.tag_id for diary_tag in added)
+                    tag_changed.update(diary_tag.diary_id for diary_tag in added)
+
+        # 태그만 바뀐 일기의 수정 시각
+        tag_only = sorted(tag_changed.difference(state_changed))
+        for chunk in _chunks(tag_only, DIARY_BULK_CHUNK_SIZE):
+            await (
+                Diary.filter(user_id=user_id, id__in=chunk)
+                .using_db(conn)
+                .update(updated_at=now)
+            )
+
+        await apply_stats_deltas(user_id, emotions, tag_usage, using_db=conn)
+        affected = len(tag_changed.union(state_changed))
+        if affected:
+            await bump_diary_version(user_id, using_db=conn)
+    return DiaryBulkResult(matched=len(diaries), affected=affected)
@@ -1,19 +1,117 @@
 # app/services/diary_service.py
 
-from typing import List
+import base64
+import binascii
+import json
+import logging
+from datetime import datetime
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple
 
 from fastapi import HTTPException, status
+from tortoise.expressions import Q
+from tortoise.transactions import in_transaction
 
-from app.models import User
-from app.models.diary import Diary, EmotionalState
-from app.models.tag import Tag
-from app.schemas.diary import DiaryCreate, DiaryOut, DiaryUpdate
-from app.services.ai_service import GeminiService
+from app.models.diary import Diary, DiaryTag, EmotionalState
+from app.schemas.diary import (
+    DiaryCreate,
+    DiaryOut,
+    DiaryPage,
+    DiaryUpdate,
+    SummaryJobOut,
+)
+from app.services.emotion_service import diary_emotion_scores
+from app.services.fulltext_service import index_diary, unindex_diary
+from app.services.ngram_service import index_diary_ngrams
+from app.services.stats_service import (
+    bump_diary_version,
+    record_diary_created,
+    record_diary_deleted,
+    record_diary_updated,
+)
+from app.services.summary_service import (
+    stream_diary_summary,
+    summarize_diary_job,
+    summary_jobs,
+)
+from app.services.tag_service import make_diary_tags, resolve_tags, sync_diary_tags
+from app.utils.job_queue import Job
+from app.utils.security import AuthenticatedUser
 
+logger = logging.getLogger(__name__)
 
-async def create_diary_service(user: User, diary_data: DiaryCreate) -> Diary:
+
+async def load_tag_names(diary_ids: Iterable[int]) -> Dict[int, List[str]]:
+    """
+    여러 일기의 태그 이름을 diary_tags-tag 조인 쿼리 한 번으로 가져옵니다.
+    일기 수와 상관없이 쿼리 수가 일정합니다.
+    """
+    tag_names: Dict[int, List[str]] = {diary_id: [] for diary_id in diary_ids}
+    if not tag_names:
+        return tag_names
+
+    rows = (
+        await DiaryTag.filter(diary_id__in=list(tag_names))
+        .order_by("id")
+        .values_list("diary_id", "tag__name")
+    )
+    for diary_id, name in rows:
+        tag_names[diary_id].append(name)
+    return tag_names
+
+
+def to_diary_out(diary: Diary, tag_names: List[str]) -> DiaryOut:
+    return DiaryOut(
+        id=diary.id,
+        user_id=diary.user_id,
+        title=diary.title,
+        content=diary.content,
+        emotional_state=diary.emotional_state,
+        ai_summary=diary.ai_summary,
+        emotion_scores=diary.emotion_scores,
+        tags=tag_names,
+        created_at=diary.created_at,
+        updated_at=diary.updated_at,
+    )
+
+
+def diary_to_dict(diary: Diary, tag_names: List[str]) -> dict:
+    """
+    DiaryOut과 같은 모양의 dict를 만듭니다. (응답을 바로 직렬화하는 목록 API용)
+    DB에서 읽은 값은 이미 검증된 값이므로 DiaryOut 생성/검증을 건너뜁니다.
+    """
+    return {
+        "id": diary.id,
+        "user_id": diary.user_id,
+        "title": diary.title,
+        "content": diary.content,
+        "emotional_state": diary.emotional_state,
+        "ai_summary": diary.ai_summary,
+        "emotion_scores": diary.emotion_scores,
+        "tags": tag_names,
+        "created_at": diary.created_at,
+        "updated_at": diary.updated_at,
+    }
+
+
+async def diaries_to_dicts(diaries: List[Diary]) -> List[dict]:
+    tag_names = await load_tag_names(diary.id for diary in diaries)
+    return [diary_to_dict(diary, tag_names[diary.id]) for diary in diaries]
+
+
+async def serialize_diaries(diaries: List[Diary]) -> List[DiaryOut]:
+    """일기 목록을 태그와 함께 DiaryOut으로 변환합니다. (태그 조회는 한 번)"""
+    tag_names = await load_tag_names(diary.id for diary in diaries)
+    return [to_diary_out(diary, tag_names[diary.id]) for diary in diaries]
+
+
+async def serialize_diary(diary: Diary) -> DiaryOut:
+    return (await serialize_diaries([diary]))[0]
+
+
+async def create_diary_service(
+    user: AuthenticatedUser, diary_data: DiaryCreate
+) -> Diary:
     try:
-        print(f"user 타입: {type(user)}, user: {user}")  # 추가
         # emotional_state를 Enum으로 변환
         try:
             emotional_state = EmotionalState(diary_data.emotional_state)
@@ -23,27 +121,35 @@ async def create_diary_service(user: User, diary_data: DiaryCreate) -> Diary:
                 detail="유효하지 않은 emotional_state 값입니다.",
             )
 
-        # Diary 인스턴스 생성
-        print("Diary 생성 시작")  # 추가
-        new_diary = await Diary.create(
-            user=user,
-            title=diary_data.title,
-            content=diary_data.content,
-            emotional_state=emotional_state,  # Enum 값 사용
-            # ai_summary=diary_data.ai_summary,
-        )
-        print(f"Diary 생성 완료: {type(new_diary)}")  # 추가
-
-        # 태그 처리
-        if diary_data.tags:
-            tag_list = []
-            for tag_name in diary_data.tags:
-                tag, _ = await Tag.get_or_create(name=tag_name)
-                tag_list.append(tag)
-            await new_diary.tags.add(*tag_list)
-
-        # 태그 관계 포함
-        await new_diary.fetch_related("tags")
+        async with in_transaction() as conn:
+            # Diary 인스턴스 생성
+            new_diary = await Diary.create(
+                user_id=user.id,
+                title=diary_data.title,
+                content=diary_data.content,
+                emotional_state=emotional_state,  # Enum 값 사용
+                emotion_scores=diary_emotion_scores(
+                    diary_data.title, diary_data.content
+                ),
+                using_db=conn,
+            )
+
+            # 태그 처리: 태그 조회/생성과 연결을 각각 한 번에 처리합니다.
+            tags = await resolve_tags(diary_data.tags, using_db=conn)
+            if tags:
+                await DiaryTag.bulk_create(
+                    make_diary_tags(new_diary, [tag.id for tag in tags]),
+                    using_db=conn,
+                )
+
+            # 전문 검색 / n-gram 색인, 통계 집계, 목록 버전 갱신
+            await index_diary(new_diary, using_db=conn)
+            await index_diary_ngrams(new_diary, using_db=conn)
+            await record_diary_created(
+                new_diary, [tag.id for tag in tags], using_db=conn
+            )
+            await bump_diary_version(user.id, using_db=conn)
+
         return new_diary
 
     except Exception as e:
@@ -54,9 +160,54 @@ async def create_diary_service(user: User, diary_data: DiaryCreate) -> Diary:
         )
 
 
-async def get_all_diaries_service(user_id: int) -> List[DiaryOut]:
-    diaries = await Diary.filter(user_id=user_id).order_by("-created_at")
-    return [DiaryOut.model_validate(d) for d in diaries]
+def encode_cursor(diary: Diary) -> str:
+    """마지막으로 내려준 일기의 (created_at, id)를 불투명한 문자열로 만듭니다."""
+    raw = json.dumps([diary.created_at.isoformat(), diary.id])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, diary_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), int(diary_id)
+    except (binascii.Error, ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="유효하지 않은 cursor 값입니다.",
+        )
+
+
+async def fetch_diary_page(
+    user_id: int, limit: int = 20, cursor: Optional[str] = None
+) -> Tuple[List[Diary], Optional[str]]:
+    """
+    최신순 일기 목록을 (created_at, id) 커서 기준으로 limit 개씩 반환합니다.
+    (user_id, created_at, id) 인덱스를 타므로 뒤쪽 페이지도 첫 페이지와 비용이 같습니다.
+
+    반환값: (일기 목록, 다음 페이지 cursor)
+    """
+    query = Diary.filter(user_id=user_id)
+    if cursor:
+        created_at, last_id = decode_cursor(cursor)
+        query = query.filter(
+            Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=last_id)
+        )
+
+    # 다음 페이지 존재 여부를 알기 위해 하나 더 조회합니다.
+    diaries = await query.order_by("-created_at", "-id").limit(limit + 1)
+    next_cursor = None
+    if len(diaries) > limit:
+        diaries = diaries[:limit]
+        next_cursor = encode_cursor(diaries[-1])
+    return diaries, next_cursor
+
+
+async def get_all_diaries_service(
+    user_id: int, limit: int = 20, cursor: Optional[str] = None
+) -> DiaryPage:
+    diaries, next_cursor = await fetch_diary_page(user_id, limit, cursor)
+    return DiaryPage(items=await serialize_diaries(diaries), next_cursor=next_cursor)
 
 
 async def get_diary_by_id_service(diary_id: int, user_id: int) -> DiaryOut:
@@ -66,7 +217,16 @@ async def get_diary_by_id_service(diary_id: int, user_id: int) -> DiaryOut:
             status_code=status.HTTP_404_NOT_FOUND,
             detail="해당 일기를 찾을 수 없거나 권한이 없습니다.",
         )
-    return DiaryOut.model_validate(diary)
+    return await serialize_diary(diary)
+
+
+async def get_diary_updated_at(diary_id: int, user_id: int) -> Optional[datetime]:
+    """일기의 updated_at만 읽습니다. (ETag 확인용, 없거나 권한이 없으면 None)"""
+    return await (
+        Diary.filter(id=diary_id, user_id=user_id)
+        .first()
+        .values_list("updated_at", flat=True)
+    )
 
 
 async def update_diary_service(
@@ -80,76 +240,125 @@ async def update_diary_service(
         )
 
     # tags와 emotional_state를 제외한 나머지 필드 업데이트
-    # M2M 관계인 tags는 update_from_dict로 업데이트할 수 없음
+    # 실제로 값이 바뀐 필드만 기록해 두었다가 저장합니다.
+    changed_fields = []
     update_data = diary_data.model_dump(
         exclude_unset=True, exclude={"tags", "emotional_state"}
     )
-    await diary.update_from_dict(update_data)
+    for field, value in update_data.items():
+        if value is not None and getattr(diary, field) != value:
+            setattr(diary, field, value)
+            changed_fields.append(field)
+
+    # 제목/본문이 바뀌면 감정 점수를 다시 계산합니다.
+    if "title" in changed_fields or "content" in changed_fields:
+        diary.emotion_scores = diary_emotion_scores(diary.title, diary.content)
+        changed_fields.append("emotion_scores")
 
     # emotional_state 업데이트 (선택적)
+    previous_state = diary.emotional_state
     if diary_data.emotional_state:
         try:
             emotional_state = EmotionalState(diary_data.emotional_state)
-            diary.emotional_state = emotional_state
         except ValueError:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="유효하지 않은 emotional_state 값입니다.",
             )
+        if diary.emotional_state != emotional_state:
+            diary.emotional_state = emotional_state
+            changed_fields.append("emotional_state")
+
+    async with in_transaction() as conn:
+        # tags 업데이트: 요청에 tags가 있을 때만 기존 태그와의 차이만 반영합니다.
+        added, removed = [], []
+        if "tags" in diary_data.model_fields_set and diary_data.tags is not None:
+            added, removed = await sync_diary_tags(
+                diary, diary_data.tags, using_db=conn
+            )
+        tags_changed = bool(added or removed)
 
-    # tags 업데이트 (M2M 매니저 사용)
-    if diary_data.tags is not None:
-        # 기존 태그 관계 삭제
-        await diary.tags.clear()
+        # 바뀐 내용이 없으면 저장 쿼리를 생략합니다.
+        if changed_fields or tags_changed:
+            await diary.save(
+                update_fields=changed_fields + ["updated_at"], using_db=conn
+            )
+            await bump_diary_version(user_id, using_db=conn)
 
-        if diary_data.tags:
-            tag_list = []
-            for tag_name in diary_data.tags:
-                tag, _ = await Tag.get_or_create(name=tag_name)
-                tag_list.append(tag)
-            await diary.tags.add(*tag_list)
+        if "title" in changed_fields or "content" in changed_fields:
+            await index_diary(diary, using_db=conn)
+            await index_diary_ngrams(diary, using_db=conn)
 
-    await diary.save()
-    await diary.fetch_related("tags")
+        await record_diary_updated(diary, previous_state, added, removed, using_db=conn)
 
-    return DiaryOut.model_validate(diary)
+    return await serialize_diary(diary)
 
 
-async def summarize_diary_service(diary_id: int, user_id: int) -> Diary:
+def to_summary_job_out(job: Job) -> SummaryJobOut:
+    return SummaryJobOut(
+        job_id=job.id,
+        diary_id=job.args[0],
+        status=job.status,
+        attempts=job.attempts,
+        ai_summary=job.result,
+        error=job.error,
+    )
+
+
+async def summarize_diary_service(diary_id: int, user_id: int) -> SummaryJobOut:
     """
-    일기 AI 요약 서비스
+    일기 AI 요약 작업을 큐에 넣고 바로 반환합니다.
+    같은 일기의 요약 작업이 이미 대기/실행 중이면 그 작업을 반환합니다.
     """
     # 일기 조회 및 권한 확인
-    diary = await Diary.filter(id=diary_id, user_id=user_id).first()
-
-    if not diary:
+    if not await Diary.filter(id=diary_id, user_id=user_id).exists():
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="일기를 찾을 수 없습니다."
         )
 
-    # 이미 요약이 있는 경우 확인
-    # if diary.ai_summary:
-    #     raise HTTPException(
-    #         status_code=status.HTTP_400_BAD_REQUEST, detail="이미 요약이 존재합니다."
-    #     )
+    job = summary_jobs.submit(
+        ("summarize", diary_id), summarize_diary_job, diary_id, owner_id=user_id
+    )
+    return to_summary_job_out(job)
 
-    try:
-        # Gemini 서비스로 요약 생성
-        gemini_service = GeminiService()
-        summary = await gemini_service.summarize_diary(diary.content)
 
-        # 요약 저장
-        diary.ai_summary = summary
-        await diary.save()
+async def get_summary_job_service(job_id: str, user_id: int) -> SummaryJobOut:
+    job = summary_jobs.get(job_id)
+    if job is None or job.owner_id != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="요약 작업을 찾을 수 없습니다.",
+        )
+    return to_summary_job_out(job)
 
-        return diary
 
-    except Exception as e:
-        print(f"요약 생성 중 오류: {e}")
+def format_sse(event: str, data: dict) -> str:
+    """Server-Sent Events 형식의 메시지 하나를 만듭니다."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def _summary_events(diary: Diary) -> AsyncIterator[str]:
+    try:
+        async for chunk in stream_diary_summary(diary):
+            yield format_sse("token", {"text": chunk})
+    except Exception:
+        logger.exception("일기 %s 요약 스트리밍 중 오류", diary.id)
+        yield format_sse("error", {"detail": "AI 요약 생성에 실패했습니다."})
+        return
+    yield format_sse("done", {"diary_id": diary.id, "ai_summary": diary.ai_summary})
+
+
+async def stream_summary_service(diary_id: int, user_id: int) -> AsyncIterator[str]:
+    """
+    일기 AI 요약을 생성되는 대로 SSE 이벤트로 내보내는 스트림을 반환합니다.
+    (token 이벤트 여러 번 -> done 또는 error 이벤트 한 번)
+    """
+    diary = await Diary.filter(id=diary_id, user_id=user_id).first()
+    if not diary:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="AI 요약 생성에 실패했습니다.",
+            status_code=status.HTTP_404_NOT_FOUND, detail="일기를 찾을 수 없습니다."
         )
+    return _summary_events(diary)
 
 
 async def delete_diary_service(diary_id: int, user_id: int):
@@ -159,4 +368,13 @@ async def delete_diary_service(diary_id: int, user_id: int):
             status_code=status.HTTP_404_NOT_FOUND,
             detail="해당 일기를 찾을 수 없거나 권한이 없습니다.",
         )
-    await diary.delete()
+    async with in_transaction() as conn:
+        tag_ids = (
+            await DiaryTag.filter(diary_id=diary.id)
+            .using_db(conn)
+            .values_list("tag_id", flat=True)
+        )
+        await record_diary_deleted(diary, tag_ids, using_db=conn)
+        await bump_diary_version(user_id, using_db=conn)
+        await unindex_diary(diary.id, using_db=conn)
+        await diary.delete(using_db=conn)
@@ -0,0 +1,184 @@
+# app/services/emotion_service.py
+
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional
+
+from fastapi import HTTPException, status
+from tortoise.exceptions import IntegrityError
+
+from app.models.emotion_keyword import EmotionKeyword, EmotionType
+from app.schemas.emotion_keyword import EmotionKeywordCreate, EmotionKeywordUpdate
+from app.utils.aho_corasick import AhoCorasick
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_keyword(keyword: str) -> str:
+    return keyword.strip().lower()
+
+
+class EmotionClassifier:
+    """
+    EmotionKeyword 사전으로 일기 본문의 감정 점수를 계산합니다. (외부 API 호출 없음)
+
+    키워드를 Aho-Corasick 오토마톤에 올려 두고 본문을 한 번만 훑어 감정별 일치 횟수를 셉니다.
+    점수는 감정별 일치 횟수의 비율이며, 일치하는 키워드가 없으면 모두 0입니다.
+
+    다른 워커에서 바뀐 키워드는 sync()가 주기적으로 사전을 다시 읽어 반영합니다.
+    """
+
+    def __init__(self):
+        self.automaton = AhoCorasick()
+        self.loaded = False
+        self._keywords: Dict[str, str] = {}
+
+        # 메트릭
+        self.scanned_chars = 0
+        self.scan_seconds = 0.0
+        self.reloads = 0
+
+    async def _read_keywords(self) -> Dict[str, str]:
+        rows = await EmotionKeyword.all().values_list("emotion_keyword", "emotion_type")
+        return {
+            normalize_keyword(keyword): EmotionType(emotion_type).value
+            for keyword, emotion_type in rows
+        }
+
+    def _build(self, keywords: Dict[str, str]) -> None:
+        automaton = AhoCorasick()
+        for keyword, emotion_type in keywords.items():
+            automaton.add(keyword, emotion_type)
+        self.automaton = automaton
+        self._keywords = keywords
+
+    async def load(self) -> None:
+        self._build(await self._read_keywords())
+        self.loaded = True
+
+    async def sync(self) -> None:
+        """사전을 다시 읽어, 이 워커의 오토마톤과 다르면 새로 만듭니다."""
+        keywords = await self._read_keywords()
+        if keywords != self._keywords:
+            self._build(keywords)
+            self.reloads += 1
+        self.loaded = True
+
+    async def run_sync_loop(self, interval: float) -> None:
+        """interval 초마다 sync()를 호출합니다. lifespan에서 태스크로 실행합니다."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.sync()
+            except Exception as e:
+                logger.warning("감정 키워드 사전 동기화 실패: %s", e)
+
+    def add_keyword(self, keyword: str, emotion_type: EmotionType) -> None:
+        keyword = normalize_keyword(keyword)
+        self.automaton.add(keyword, EmotionType(emotion_type).value)
+        self._keywords[keyword] = EmotionType(emotion_type).value
+
+    def remove_keyword(self, keyword: str) -> None:
+        keyword = normalize_keyword(keyword)
+        self.automaton.remove(keyword)
+        self._keywords.pop(keyword, None)
+
+    def scores(self, text: str) -> Dict[str, float]:
+        started = time.perf_counter()
+        counts = {emotion_type.value: 0 for emotion_type in EmotionType}
+        for _, emotion_type in self.automaton.iter(text.lower()):
+            counts[emotion_type] += 1
+        self.scanned_chars += len(text)
+        self.scan_seconds += time.perf_counter() - started
+
+        total = sum(counts.values())
+        return {
+            emotion_type: round(count / total, 4) if total else 0.0
+            for emotion_type, count in counts.items()
+        }
+
+    def stats(self) -> dict:
+        return {
+            "keywords": len(self.automaton),
+            "nodes": self.automaton.node_count,
+            "reloads": self.reloads,
+            "scanned_chars": self.scanned_chars,
+            "chars_per_second": (
+                round(self.scanned_chars / self.scan_seconds)
+                if self.scan_seconds
+                else 0
+            ),
+        }
+
+
+# 앱 시작 시 EmotionKeyword 테이블에서 로드합니다.
+emotion_classifier = EmotionClassifier()
+
+
+def diary_emotion_scores(title: str, content: str) -> Dict[str, float]:
+    return emotion_classifier.scores(f"{title}\n{content}")
+
+
+async def create_emotion_keyword_service(data: EmotionKeywordCreate) -> EmotionKeyword:
+    try:
+        keyword = await EmotionKeyword.create(
+            emotion_keyword=normalize_keyword(data.emotion_keyword),
+            emotion_type=data.emotion_type,
+        )
+    except IntegrityError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="이미 등록된 감정 키워드입니다.",
+        )
+    emotion_classifier.add_keyword(keyword.emotion_keyword, keyword.emotion_type)
+    return keyword
+
+
+async def get_emotion_keywords_service(
+    emotion_type: Optional[EmotionType] = None,
+) -> List[EmotionKeyword]:
+    query = EmotionKeyword.all()
+    if emotion_type:
+        query = query.filter(emotion_type=emotion_type)
+    return await query.order_by("id")
+
+
+async def _get_keyword_or_404(keyword_id: int) -> EmotionKeyword:
+    keyword = await EmotionKeyword.get_or_none(id=keyword_id)
+    if not keyword:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="감정 키워드를 찾을 수 없습니다.",
+        )
+    return keyword
+
+
+async def update_emotion_keyword_service(
+    keyword_id: int, data: EmotionKeywordUpdate
+) -> EmotionKeyword:
+    keyword = await _get_keyword_or_404(keyword_id)
+    previous = keyword.emotion_keyword
+
+    if data.emotion_keyword is not None:
+        keyword.emotion_keyword = normalize_keyword(data.emotion_keyword)
+    if data.emotion_type is not None:
+        keyword.emotion_type = data.emotion_type
+    try:
+        await keyword.save()
+    except IntegrityError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="이미 등록된 감정 키워드입니다.",
+        )
+
+    # 바뀐 키워드만 오토마톤에 반영합니다.
+    emotion_classifier.remove_keyword(previous)
+    emotion_classifier.add_keyword(keyword.emotion_keyword, keyword.emotion_type)
+    return keyword
+
+
+async def delete_emotion_keyword_service(keyword_id: int) -> None:
+    keyword = await _get_keyword_or_404(keyword_id)
+    await keyword.delete()
+    emotion_classifier.remove_keyword(keyword.emotion_keyword)
@@ -0,0 +1,111 @@
+# app/services/export_service.py
+
+import csv
+import io
+import json
+from typing import AsyncIterator, List
+
+from tortoise.expressions import Q
+
+from app.core.config import EXPORT_CHUNK_SIZE
+from app.models.diary import Diary
+from app.services.diary_service import load_tag_names
+
+# 형식별 Content-Type
+EXPORT_FORMATS = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+EXPORT_FIELDS = (
+    "id",
+    "title",
+    "content",
+    "emotional_state",
+    "tags",
+    "ai_summary",
+    "emotion_scores",
+    "created_at",
+    "updated_at",
+)
+_COLUMNS = [field for field in EXPORT_FIELDS if field != "tags"]
+# 스프레드시트가 수식으로 해석하는 첫 글자 (CSV/수식 인젝션 방지)
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+async def iter_diary_chunks(
+    user_id: int, chunk_size: int = EXPORT_CHUNK_SIZE
+) -> AsyncIterator[List[dict]]:
+    """
+    사용자의 일기를 오래된 순으로 chunk_size 개씩 태그와 함께 읽습니다.
+    (user_id, created_at, id) 인덱스를 키셋 조건으로 이어 읽으므로
+    일기가 몇 개이든 한 번에 chunk_size 개만 메모리에 올라갑니다.
+    """
+    query = Diary.filter(user_id=user_id)
+    last = None
+    while True:
+        chunk = query
+        if last is not None:
+            created_at, diary_id = last
+            chunk = chunk.filter(
+                Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=diary_id)
+            )
+        rows = (
+            await chunk.order_by("created_at", "id").limit(chunk_size).values(*_COLUMNS)
+        )
+        if not rows:
+            return
+        last = rows[-1]["created_at"], rows[-1]["id"]
+
+        tag_names = await load_tag_names(row["id"] for row in rows)
+        for row in rows:
+            state = row["emotional_state"]
+            row["emotional_state"] = getattr(state, "value", state)
+            row["tags"] = tag_names[row["id"]]
+            row["created_at"] = row["created_at"].isoformat()
+            row["updated_at"] = row["updated_at"].isoformat()
+        yield rows
+
+        if len(rows) < chunk_size:
+            return
+
+
+async def export_ndjson(user_id: int) -> AsyncIterator[str]:
+    """한 줄에 일기 하나씩 JSON으로 내보냅니다. (청크마다 한 번에 씁니다.)"""
+    async for rows in iter_diary_chunks(user_id):
+        yield "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows)
+
+
+def csv_cell(value):
+    """수식으로 시작하는 문자열 셀은 앞에 '를 붙여 엑셀이 텍스트로 읽도록 합니다."""
+    if isinstance(value, str) and value.startswith(_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+async def export_csv(user_id: int) -> AsyncIterator[str]:
+    """
+    헤더 한 줄 뒤에 일기 하나씩 CSV로 내보냅니다.
+    tags는 "|"로 이어 붙이고, emotion_scores는 JSON 문자열로 씁니다.
+    =, +, -, @ 등으로 시작하는 셀은 앞에 '를 붙입니다. (csv_cell)
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # 엑셀에서 한글이 깨지지 않도록 UTF-8 BOM을 붙입니다.
+    buffer.write("\ufeff")
+    writer.writerow(EXPORT_FIELDS)
+    yield buffer.getvalue()
+
+    async for rows in iter_diary_chunks(user_id):
+        buffer.seek(0)
+        buffer.truncate()
+        for row in rows:
+            row["tags"] = "|".join(row["tags"])
+            if row["emotion_scores"] is not None:
+                row["emotion_scores"] = json.dumps(
+                    row["emotion_scores"], ensure_ascii=False
+                )
+            writer.writerow([csv_cell(row[field]) for field in EXPORT_FIELDS])
+        yield buffer.getvalue()
+
+
+def export_diaries(user_id: int, export_format: str) -> AsyncIterator[str]:
+    if export_format == "csv":
+        return export_csv(user_id)
+    return export_ndjson(user_id)
@@ -0,0 +1,207 @@
+# app/services/fulltext_service.py
+
+import html
+from typing import List, Optional, Tuple
+
+from tortoise import Tortoise
+from tortoise.backends.base.client import BaseDBAsyncClient
+
+from app.models.diary import Diary
+
+# 검색 결과 스니펫에서 일치 부분을 감싸는 표시
+SNIPPET_START = "<mark>"
+SNIPPET_END = "</mark>"
+# DB가 스니펫을 만들 때 쓰는 임시 표시 (유니코드 사용자 영역 문자)
+# 본문을 HTML 이스케이프한 뒤에 <mark>로 바꿔야 본문 속 태그가 실행되지 않습니다.
+_RAW_START = "\ue000"
+_RAW_END = "\ue001"
+
+# PostgreSQL: 한국어 사전이 없으므로 형태소 분석 없이 공백 단위로 나누는 simple 설정 사용
+# 제목(A)에 본문(B)보다 높은 가중치를 줍니다.
+_PG_DOCUMENT = (
+    "setweight(to_tsvector('simple', {title}), 'A') || "
+    "setweight(to_tsvector('simple', {content}), 'B')"
+)
+
+
+def _get_connection(using_db: Optional[BaseDBAsyncClient]) -> BaseDBAsyncClient:
+    return using_db or Tortoise.get_connection("default")
+
+
+def _is_postgres(conn: BaseDBAsyncClient) -> bool:
+    return conn.capabilities.dialect == "postgres"
+
+
+def _fts5_query(query: str) -> str:
+    # 사용자 입력을 FTS5 문법으로 해석하지 않도록 단어마다 큰따옴표로 감쌉니다. (AND 검색)
+    terms = [term.replace('"', '""') for term in query.split()]
+    return " ".join(f'"{term}"' for term in terms)
+
+
+async def ensure_fulltext_index(using_db: Optional[BaseDBAsyncClient] = None) -> None:
+    """
+    전문 검색 인덱스를 준비합니다. (앱 시작 시 호출)
+
+    - SQLite(테스트/로컬): FTS5 가상 테이블 diary_fts (rowid = diary.id)
+    - PostgreSQL(운영): tsvector 컬럼을 가진 diary_fts 테이블 + GIN 인덱스
+    """
+    conn = _get_connection(using_db)
+    if _is_postgres(conn):
+        await conn.execute_script(
+            """
+            CREATE TABLE IF NOT EXISTS diary_fts (
+                diary_id INT PRIMARY KEY REFERENCES diary (id) ON DELETE CASCADE,
+                user_id INT NOT NULL,
+                document TSVECTOR NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_diary_fts_document
+                ON diary_fts USING GIN (document);
+            CREATE INDEX IF NOT EXISTS idx_diary_fts_user_id ON diary_fts (user_id);
+            """
+        )
+    else:
+        await conn.execute_script(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS diary_fts "
+            "USING fts5(title, content, user_id UNINDEXED, tokenize='unicode61');"
+        )
+
+    # 기존 일기가 있는데 인덱스가 비어 있으면 (처음 도입한 경우) 전체를 색인합니다.
+    _, rows = await conn.execute_query("SELECT COUNT(*) FROM diary_fts")
+    if rows[0][0] == 0 and await Diary.all().using_db(conn).exists():
+        await rebuild_fulltext_index(conn)
+
+
+async def rebuild_fulltext_index(using_db: Optional[BaseDBAsyncClient] = None) -> None:
+    conn = _get_connection(using_db)
+    await conn.execute_script("DELETE FROM diary_fts;")
+    if _is_postgres(conn):
+        await conn.execute_script(
+            "INSERT INTO diary_fts (diary_id, user_id, document) "
+            f"SELECT id, user_id, {_PG_DOCUMENT.format(title='title', content='content')} "
+            "FROM diary;"
+        )
+    else:
+        await conn.execute_script(
+            "INSERT INTO diary_fts (rowid, title, content, user_id) "
+            "SELECT id, title, content, user_id FROM diary;"
+        )
+
+
+async def index_diary(
+    diary: Diary, using_db: Optional[BaseDBAsyncClient] = None
+) -> None:
+    """일기 생성/수정 시 검색 인덱스를 갱신합니다."""
+    conn = _get_connection(using_db)
+    if _is_postgres(conn):
+        await conn.execute_query(
+            "INSERT INTO diary_fts (diary_id, user_id, document) "
+            f"VALUES ($1, $2, {_PG_DOCUMENT.format(title='$3', content='$4')}) "
+            "ON CONFLICT (diary_id) DO UPDATE SET document = EXCLUDED.document",
+            [diary.id, diary.user_id, diary.title, diary.content],
+        )
+    else:
+        await conn.execute_query("DELETE FROM diary_fts WHERE rowid = ?", [diary.id])
+        await conn.execute_query(
+            "INSERT INTO diary_fts (rowid, title, content, user_id) "
+            "VALUES (?, ?, ?, ?)",
+            [diary.id, diary.title, diary.content, diary.user_id],
+        )
+
+
+async def index_diaries(
+    diaries: List[Diary], using_db: Optional[BaseDBAsyncClient] = None
+) -> None:
+    """새로 만든 일기 여러 개를 한 번에 색인합니다. (기존 색인이 없다고 가정)"""
+    if not diaries:
+        return
+    conn = _get_connection(using_db)
+    if _is_postgres(conn):
+        await conn.execute_many(
+            "INSERT INTO diary_fts (diary_id, user_id, document) "
+            f"VALUES ($1, $2, {_PG_DOCUMENT.format(title='$3', content='$4')})",
+            [[d.id, d.user_id, d.title, d.content] for d in diaries],
+        )
+    else:
+        await conn.execute_many(
+            "INSERT INTO diary_fts (rowid, title, content, user_id) "
+            "VALUES (?, ?, ?, ?)",
+            [[d.id, d.title, d.content, d.user_id] for d in diaries],
+        )
+
+
+async def unindex_diary(
+    diary_id: int, using_db: Optional[BaseDBAsyncClient] = None
+) -> None:
+    """일기 삭제 시 검색 인덱스에서 제거합니다."""
+    conn = _get_connection(using_db)
+    if _is_postgres(conn):
+        await conn.execute_query(
+            "DELETE FROM diary_fts WHERE diary_id = $1", [diary_id]
+        )
+    else:
+        await conn.execute_query("DELETE FROM diary_fts WHERE rowid = ?", [diary_id])
+
+
+async def unindex_diaries(
+    diary_ids: List[int], using_db: Optional[BaseDBAsyncClient] = None
+) -> None:
+    """일기 여러 개를 삭제할 때 검색 인덱스에서 한 번에 제거합니다."""
+    if not diary_ids:
+        return
+    conn = _get_connection(using_db)
+    if _is_postgres(conn):
+        await conn.execute_query(
+            "DELETE FROM diary_fts WHERE diary_id = ANY($1::int[])", [diary_ids]
+        )
+    else:
+        placeholders = ", ".join("?" for _ in diary_ids)
+        await conn.execute_query(
+            f"DELETE FROM diary_fts WHERE rowid IN ({placeholders})", diary_ids
+        )
+
+
+def render_snippet(raw: str) -> str:
+    """DB가 만든 스니펫의 본문은 HTML 이스케이프하고 일치 부분만 <mark>로 감쌉니다."""
+    return (
+        html.escape(raw)
+        .replace(_RAW_START, SNIPPET_START)
+        .replace(_RAW_END, SNIPPET_END)
+    )
+
+
+async def search_fulltext(
+    user_id: int, query: str, limit: int = 20, offset: int = 0
+) -> List[Tuple[int, str, float]]:
+    """
+    제목/본문 전문 검색. 관련도 순으로 (diary_id, 스니펫, 점수) 목록을 반환합니다.
+    점수는 클수록 관련도가 높습니다. 스니펫은 HTML 이스케이프된 본문 조각입니다.
+    """
+    conn = _get_connection(None)
+    if _is_postgres(conn):
+        _, rows = await conn.execute_query(
+            "SELECT f.diary_id, "
+            "ts_headline('simple', d.content, q, "
+            f"'StartSel={_RAW_START}, StopSel={_RAW_END}, "
+            "MaxFragments=1, MaxWords=20, MinWords=5') AS snippet, "
+            "ts_rank(f.document, q) AS rank "
+            "FROM diary_fts f JOIN diary d ON d.id = f.diary_id, "
+            "plainto_tsquery('simple', $2) q "
+            "WHERE f.user_id = $1 AND f.document @@ q "
+            "ORDER BY rank DESC, f.diary_id DESC LIMIT $3 OFFSET $4",
+            [user_id, query, limit, offset],
+        )
+        return [(row[0], render_snippet(row[1]), float(row[2])) for row in rows]
+
+    match = _fts5_query(query)
+    if not match:
+        return []
+    _, rows = await conn.execute_query(
+        "SELECT rowid, "
+        f"snippet(diary_fts, -1, '{_RAW_START}', '{_RAW_END}', '…', 16), "
+        "bm25(diary_fts, 2.0, 1.0) AS rank "
+        "FROM diary_fts WHERE diary_fts MATCH ? AND user_id = ? "
+        "ORDER BY rank, rowid DESC LIMIT ? OFFSET ?",
+        [match, user_id, limit, offset],
+    )
+    # bm25는 작을수록 관련도가 높으므로 부호를 바꿉니다.
+    return [(row[0], render_snippet(row[1]), -float(row[2])) for row in rows]
@@ -0,0 +1,198 @@
+# app/services/import_service.py
+
+import json
+import logging
+import tempfile
+from typing import AsyncIterator, BinaryIO, Dict, Iterable, Iterator, List, Tuple
+
+from pydantic import ValidationError
+from tortoise import timezone
+from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.transactions import in_transaction
+
+from app.core.config import IMPORT_CHUNK_SIZE, IMPORT_MAX_ERRORS, IMPORT_SPOOL_MEMORY
+from app.models.diary import Diary, DiaryTag, EmotionalState
+from app.schemas.diary import DiaryImportRow
+from app.services.emotion_service import diary_emotion_scores
+from app.services.fulltext_service import index_diaries
+from app.services.ngram_service import index_diaries_ngrams
+from app.services.stats_service import bump_diary_version, record_diaries_created
+from app.services.tag_service import make_diary_tags, normalize_tag_names, resolve_tags
+
+logger = logging.getLogger(__name__)
+
+
+async def spool_upload(stream: AsyncIterator[bytes]) -> BinaryIO:
+    """
+    업로드 본문을 받는 대로 임시 파일에 씁니다.
+    IMPORT_SPOOL_MEMORY까지는 메모리에, 넘으면 디스크에 두므로 업로드 크기와 상관없이
+    메모리 사용량이 일정합니다.
+    """
+    file = tempfile.SpooledTemporaryFile(max_size=IMPORT_SPOOL_MEMORY)
+    async for data in stream:
+        file.write(data)
+    file.seek(0)
+    return file
+
+
+def _error_detail(e: ValidationError) -> str:
+    error = e.errors()[0]
+    loc = ".".join(str(part) for part in error["loc"])
+    return f"{loc}: {error['msg']}" if loc else error["msg"]
+
+
+def parse_import_lines(
+    lines: Iterable[bytes],
+) -> Iterator[Tuple[int, DiaryImportRow | None, str | None]]:
+    """NDJSON을 한 줄씩 검증합니다. (줄 번호, 일기 또는 None, 오류 또는 None) 빈 줄은 건너뜁니다."""
+    for line_no, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            yield line_no, DiaryImportRow.model_validate_json(line), None
+        except ValidationError as e:
+            yield line_no, None, _error_detail(e)
+
+
+async def reserve_diary_ids(count: int, conn: BaseDBAsyncClient) -> List[int]:
+    """
+    bulk_create는 만든 행의 id를 돌려주지 않으므로 id를 미리 정해서 넣습니다.
+
+    - PostgreSQL: id 시퀀스에서 count개를 받습니다.
+    - SQLite: 트랜잭션이 연결 잠금을 잡고 있으므로 마지막 id 다음 값부터 씁니다.
+      (AUTOINCREMENT 시퀀스도 함께 봐서 삭제된 id를 다시 쓰지 않습니다.)
+    """
+    if conn.capabilities.dialect == "postgres":
+        _, rows = await conn.execute_query(
+            "SELECT nextval(pg_get_serial_sequence('diary', 'id')) AS id "
+            "FROM generate_series(1, $1)",
+            [count],
+        )
+        return [row["id"] for row in rows]
+
+    _, rows = await conn.execute_query(
+        "SELECT MAX("
+        "COALESCE((SELECT seq FROM sqlite_sequence WHERE name = 'diary'), 0), "
+        "COALESCE((SELECT MAX(id) FROM diary), 0)) AS id"
+    )
+    start = rows[0]["id"] + 1
+    return list(range(start, start + count))
+
+
+async def write_import_chunk(user_id: int, rows: List[DiaryImportRow]) -> int:
+    """
+    검증된 일기를 한 트랜잭션으로 씁니다. 일기/태그/diary_tags/색인/통계 모두
+    일기 수와 상관없이 bulk 쿼리 몇 번으로 처리합니다.
+    """
+    async with in_transaction() as conn:
+        tag_names = [normalize_tag_names(row.tags) for row in rows]
+        tags = await resolve_tags(
+            {name for names in tag_names for name in names}, using_db=conn
+        )
+        tag_ids = {tag.name: tag.id for tag in tags}
+
+        ids = await reserve_diary_ids(len(rows), conn)
+        now = timezone.now()
+        diaries = [
+            Diary(
+                id=diary_id,
+                user_id=user_id,
+                title=row.title,
+                content=row.content,
+                emotional_state=EmotionalState(row.emotional_state.value),
+                emotion_scores=diary_emotion_scores(row.title, row.content),
+                created_at=row.created_at or now,
+            )
+            for diary_id, row in zip(ids, rows)
+        ]
+        await Diary.bulk_create(diaries, batch_size=500, using_db=conn)
+
+        diary_tag_ids: Dict[int, List[int]] = {
+            diary.id: [tag_ids[name] for name in names]
+            for diary, names in zip(diaries, tag_names)
+        }
+        diary_tags = [
+            diary_tag
+            for diary in diaries
+            for diary_tag in make_diary_tags(diary, diary_tag_ids[diary.id])
+        ]
+        if diary_tags:
+            await DiaryTag.bulk_create(diary_tags, batch_size=1000, using_db=conn)
+
+        await index_diaries(diaries, using_db=conn)
+        await index_diaries_ngrams(diaries, using_db=conn)
+        await record_diaries_created(user_id, diaries, diary_tag_ids, using_db=conn)
+        await bump_diary_version(user_id, using_db=conn)
+    return len(diaries)
+
+
+async def import_diaries(
+    user_id: int, lines: Iterable[bytes], chunk_size: int = IMPORT_CHUNK_SIZE
+) -> AsyncIterator[dict]:
+    """
+    NDJSON 줄을 검증하면서 chunk_size 줄마다 올바른 일기를 한 트랜잭션으로 씁니다.
+    진행 상황을 이벤트로 내보냅니다.
+
+    - {"event": "progress", "processed", "imported", "failed", "errors"}: 청크마다
+      (errors는 이번 청크의 줄 오류 [{"line", "detail"}], 전체 IMPORT_MAX_ERRORS 개까지)
+    - {"event": "done", ...}: 끝나면 한 번
+    - {"event": "error", "line", "detail", ...}: 청크 쓰기에 실패하면 한 번 후 중단
+      (이미 커밋된 이전 청크는 유지됩니다.)
+    """
+    processed = imported = failed = reported = 0
+    rows: List[DiaryImportRow] = []
+    errors: List[dict] = []
+    first_line = None
+
+    def progress(event: str) -> dict:
+        return {
+            "event": event,
+            "processed": processed,
+            "imported": imported,
+            "failed": failed,
+            "errors": errors,
+        }
+
+    async def flush() -> None:
+        nonlocal imported, rows, first_line
+        if rows:
+            imported += await write_import_chunk(user_id, rows)
+        rows, first_line = [], None
+
+    try:
+        for line_no, row, error in parse_import_lines(lines):
+            processed += 1
+            if row is not None:
+                rows.append(row)
+                first_line = first_line or line_no
+            else:
+                failed += 1
+                if reported < IMPORT_MAX_ERRORS:
+                    reported += 1
+                    errors.append({"line": line_no, "detail": error})
+
+            if processed % chunk_size == 0:
+                await flush()
+                yield progress("progress")
+                errors = []
+        await flush()
+    except Exception:
+        logger.exception(
+            "사용자 %s 일기 가져오기 중 오류 (%s번째 줄부터)", user_id, first_line
+        )
+        yield {
+            **progress("error"),
+            "line": first_line,
+            "detail": "일기를 저장하지 못했습니다. 이 줄부터 다시 가져와 주세요.",
+        }
+        return
+    yield progress("done")
+
+
+async def import_events(user_id: int, file: BinaryIO) -> AsyncIterator[str]:
+    """import_diaries 이벤트를 NDJSON 줄로 내보내고, 끝나면 임시 파일을 닫습니다."""
+    try:
+        async for event in import_diaries(user_id, file):
+            yield json.dumps(event, ensure_ascii=False) + "\n"
+    finally:
+        file.close()
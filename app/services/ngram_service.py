@@ -0,0 +1,163 @@
+# app/services/ngram_service.py
+
+from typing import Iterable, List, Optional, Set, Tuple
+
+from tortoise import Tortoise
+from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.expressions import Q, Subquery
+from tortoise.functions import Count
+from tortoise.queryset import QuerySet
+
+from app.models.diary import Diary
+from app.models.diary_ngram import DiaryNgram
+
+NGRAM_SIZE = 2
+TITLE = "t"
+CONTENT = "c"
+_BATCH_SIZE = 1000
+
+
+def extract_ngrams(text: str) -> Set[str]:
+    """
+    공백으로 나눈 각 단어에서 2글자 n-gram을 뽑습니다. (소문자로 정규화)
+    예) "좋은 하루" -> {"좋은", "하루"}, "행복했다" -> {"행복", "복했", "했다"}
+    """
+    grams = set()
+    for word in text.lower().split():
+        for i in range(len(word) - NGRAM_SIZE + 1):
+            grams.add(word[i : i + NGRAM_SIZE])
+    return grams
+
+
+def _diary_grams(title: str, content: str) -> Set[Tuple[str, str]]:
+    return {(TITLE, gram) for gram in extract_ngrams(title)} | {
+        (CONTENT, gram) for gram in extract_ngrams(content)
+    }
+
+
+async def index_diary_ngrams(
+    diary: Diary, using_db: Optional[BaseDBAsyncClient] = None
+) -> None:
+    """
+    일기의 n-gram 색인을 갱신합니다. 전체를 다시 쓰지 않고 기존 색인과의 차이만 반영합니다.
+    (일기 삭제 시에는 FK CASCADE로 함께 삭제됩니다.)
+    """
+    target = _diary_grams(diary.title, diary.content)
+    current = set(
+        await DiaryNgram.filter(diary_id=diary.id)
+        .using_db(using_db)
+        .values_list("field", "gram")
+    )
+
+    for field in (TITLE, CONTENT):
+        removed = [gram for f, gram in current - target if f == field]
+        if removed:
+            await (
+                DiaryNgram.filter(diary_id=diary.id, field=field, gram__in=removed)
+                .using_db(using_db)
+                .delete()
+            )
+
+    added = target - current
+    if added:
+        await DiaryNgram.bulk_create(
+            [
+                DiaryNgram(
+                    diary_id=diary.id, user_id=diary.user_id, field=field, gram=gram
+                )
+                for field, gram in added
+            ],
+            batch_size=_BATCH_SIZE,
+            using_db=using_db,
+        )
+
+
+async def index_diaries_ngrams(
+    diaries: Iterable[Diary], using_db: Optional[BaseDBAsyncClient] = None
+) -> None:
+    """
+    새로 만든 일기 여러 개를 한 번에 색인합니다. (기존 색인이 없다고 가정)
+    일기마다 수십 개의 행이 생기므로 모델 객체를 만들지 않고 executemany로 넣습니다.
+    """
+    rows = [
+        [diary.id, diary.user_id, field, gram]
+        for diary in diaries
+        for field, gram in _diary_grams(diary.title, diary.content)
+    ]
+    if not rows:
+        return
+    conn = using_db or Tortoise.get_connection("default")
+    if conn.capabilities.dialect == "postgres":
+        placeholders = "$1, $2, $3, $4"
+    else:
+        placeholders = "?, ?, ?, ?"
+    query = (
+        f"INSERT INTO {DiaryNgram._meta.db_table} (diary_id, user_id, field, gram) "
+        f"VALUES ({placeholders})"
+    )
+    for start in range(0, len(rows), _BATCH_SIZE):
+        await conn.execute_many(query, rows[start : start + _BATCH_SIZE])
+
+
+async def rebuild_ngram_index(batch_size: int = 1000) -> None:
+    await DiaryNgram.all().delete()
+    last_id = 0
+    while True:
+        diaries = await Diary.filter(id__gt=last_id).order_by("id").limit(batch_size)
+        if not diaries:
+            break
+        await index_diaries_ngrams(diaries)
+        last_id = diaries[-1].id
+
+
+async def ensure_ngram_index() -> None:
+    """n-gram 색인이 비어 있는데 일기가 있으면 (처음 도입한 경우) 전체를 색인합니다."""
+    if not await DiaryNgram.exists() and await Diary.exists():
+        await rebuild_ngram_index()
+
+
+def ngram_candidates(
+    user_id: int, query: str, fields: Iterable[str] = (TITLE, CONTENT)
+) -> Optional[QuerySet]:
+    """
+    query의 모든 n-gram을 포함하는 일기 id를 posting list 교집합으로 구하는 쿼리를 만듭니다.
+    (gram IN (...) GROUP BY diary_id HAVING COUNT(DISTINCT gram) = n-gram 수)
+
+    n-gram을 만들 수 없는 짧은 검색어(1글자)는 None을 반환합니다.
+    교집합은 후보일 뿐이므로 실제 부분 문자열 일치는 호출하는 쪽에서 확인해야 합니다.
+    """
+    grams = extract_ngrams(query)
+    if not grams:
+        return None
+    return (
+        DiaryNgram.filter(user_id=user_id, field__in=list(fields), gram__in=list(grams))
+        .annotate(matched=Count("gram", distinct=True))
+        .group_by("diary_id")
+        .filter(matched=len(grams))
+        .values("diary_id")
+    )
+
+
+async def search_ngram(
+    user_id: int, query: str, fields: Iterable[str] = (TITLE, CONTENT)
+) -> Optional[List[Diary]]:
+    """
+    n-gram 색인으로 후보를 좁힌 뒤 실제 부분 문자열이 일치하는 일기만 최신순으로 반환합니다.
+    색인을 쓸 수 없는 검색어이면 None을 반환합니다.
+    """
+    fields = tuple(fields)
+    candidates = ngram_candidates(user_id, query, fields)
+    if candidates is None:
+        return None
+
+    query = query.strip()
+    diaries = Diary.filter(user_id=user_id, id__in=Subquery(candidates))
+    if fields == (TITLE,):
+        diaries = diaries.filter(title__icontains=query)
+    elif fields == (CONTENT,):
+        diaries = diaries.filter(content__icontains=query)
+    else:
+        diaries = diaries.filter(
+            Q(title__icontains=query) | Q(content__icontains=query)
+        )
+    return await diaries.order_by("-created_at", "-id")
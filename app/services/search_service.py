@@ -1,7 +1,25 @@
 from datetime import date, datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from app.models.diary import Diary
+from tortoise.expressions import Q, Subquery
+from tortoise.functions import Count
+
+from app.models.diary import Diary, DiaryTag
+from app.schemas.diary import DiarySearchParams, DiarySearchResult
+from app.services.diary_service import (
+    decode_cursor,
+    encode_cursor,
+    load_tag_names,
+    to_diary_out,
+)
+from app.services.fulltext_service import search_fulltext
+from app.services.ngram_service import (
+    CONTENT,
+    TITLE,
+    ngram_candidates,
+    search_ngram,
+)
+from app.services.tag_service import normalize_tag_names
 
 
 async def search_diary(
@@ -12,15 +30,22 @@ async def search_diary(
     end_date: Optional[date] = None,
 ) -> List[Diary]:
     """
-    일기 검색 (제목,태그,날짜)
+    일기 검색 (제목,태그,날짜,제목+본문 부분 문자열)
     """
-    base_query = Diary.filter(user_id=user_id).prefetch_related("tags")
+    # 태그는 응답 직렬화 시 serialize_diaries가 한 번에 조회합니다.
+    base_query = Diary.filter(user_id=user_id)
 
-    if search_type == "title":
+    if search_type in ("title", "text"):
         if query and query.strip():  # 검색어가 있을 때만 필터링
-            results = await base_query.filter(title__icontains=query).order_by(
-                "-created_at"
-            )
+            fields = (TITLE,) if search_type == "title" else (TITLE, CONTENT)
+            # 2글자 이상이면 n-gram 색인으로 후보를 좁혀 검색합니다.
+            results = await search_ngram(user_id, query, fields)
+            if results is None:
+                results = await base_query.filter(
+                    Q(title__icontains=query)
+                    if search_type == "title"
+                    else Q(title__icontains=query) | Q(content__icontains=query)
+                ).order_by("-created_at")
         else:
             results = await base_query.order_by("-created_at")  # 전체 반환
 
@@ -55,3 +80,115 @@ async def search_diary(
         return []
 
     return results
+
+
+async def search_diary_fulltext(
+    user_id: int, query: Optional[str], limit: int = 20, offset: int = 0
+) -> List[DiarySearchResult]:
+    """
+    일기 제목/본문 전문 검색 (관련도 순, 스니펫 포함)
+    """
+    if not query or not query.strip():
+        return []
+
+    hits = await search_fulltext(user_id, query.strip(), limit, offset)
+    if not hits:
+        return []
+
+    diary_ids = [diary_id for diary_id, _, _ in hits]
+    diaries = {
+        diary.id: diary
+        for diary in await Diary.filter(id__in=diary_ids, user_id=user_id)
+    }
+    tag_names = await load_tag_names(diaries)
+
+    results = []
+    for diary_id, snippet, rank in hits:
+        diary = diaries.get(diary_id)
+        if diary is None:
+            continue
+        results.append(
+            DiarySearchResult(
+                **to_diary_out(diary, tag_names[diary_id]).model_dump(),
+                snippet=snippet,
+                rank=rank,
+            )
+        )
+    return results
+
+
+def combined_search_conditions(user_id: int, params: DiarySearchParams) -> List[Q]:
+    """
+    복합 검색 조건을 Q 목록으로 만듭니다. (모두 AND로 적용, 실행 순서는 DB가 결정)
+
+    - date:  (user_id, created_at, id) 인덱스 범위 조건
+    - tags:  이 사용자의 diary_tags 서브쿼리 ((user_id, tag_id, created_at) 인덱스).
+             모든 태그를 가진 일기만
+    - title: n-gram 색인 서브쿼리 + 부분 문자열 확인 (1글자면 LIKE 스캔)
+    """
+    conditions = []
+
+    if params.start_date or params.end_date:
+        condition = Q()
+        if params.start_date:
+            condition &= Q(
+                created_at__gte=datetime.combine(params.start_date, datetime.min.time())
+            )
+        if params.end_date:
+            condition &= Q(
+                created_at__lte=datetime.combine(params.end_date, datetime.max.time())
+            )
+        conditions.append(condition)
+
+    tag_names = normalize_tag_names(params.tags)
+    if tag_names:
+        tagged = (
+            DiaryTag.filter(user_id=user_id, tag__name__in=tag_names)
+            .annotate(matched=Count("tag_id", distinct=True))
+            .group_by("diary_id")
+            .filter(matched=len(tag_names))
+            .values("diary_id")
+        )
+        conditions.append(Q(id__in=Subquery(tagged)))
+
+    title = (params.title or "").strip()
+    if title:
+        candidates = ngram_candidates(user_id, title, (TITLE,))
+        if candidates is not None:
+            conditions.append(
+                Q(id__in=Subquery(candidates)) & Q(title__icontains=title)
+            )
+        else:
+            conditions.append(Q(title__icontains=title))
+
+    return conditions
+
+
+async def combined_search_diary(
+    user_id: int,
+    params: DiarySearchParams,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+) -> Tuple[List[Diary], Optional[str]]:
+    """
+    제목/태그/기간 조건을 한 번에 적용하는 복합 검색.
+    모든 조건을 하나의 SQL로 만들어 최신순 커서 페이지네이션으로 반환합니다.
+
+    반환값: (일기 목록, 다음 페이지 cursor)
+    """
+    query = Diary.filter(user_id=user_id)
+    for condition in combined_search_conditions(user_id, params):
+        query = query.filter(condition)
+
+    if cursor:
+        created_at, last_id = decode_cursor(cursor)
+        query = query.filter(
+            Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=last_id)
+        )
+
+    diaries = await query.order_by("-created_at", "-id").limit(limit + 1)
+    next_cursor = None
+    if len(diaries) > limit:
+        diaries = diaries[:limit]
+        next_cursor = encode_cursor(diaries[-1])
+    return diaries, next_cursor
@@ -0,0 +1,477 @@
+# app/services/stats_service.py
+
+from collections import Counter
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.expressions import F
+from tortoise.transactions import in_transaction
+
+from app.models.diary import Diary, DiaryTag, EmotionalState
+from app.models.user_stats import (
+    UserCalendar,
+    UserDiaryVersion,
+    UserEmotionDaily,
+    UserTagUsage,
+)
+from app.schemas.stats import CalendarDay, CalendarOut, EmotionDailyCount, EmotionStats
+from app.schemas.tag import TagInList
+
+# 달력 바이트의 하위 3비트에 저장하는 감정 코드 (0은 일기 없음)
+EMOTION_CODES = {state.value: code for code, state in enumerate(EmotionalState, 1)}
+CODE_EMOTIONS = {code: state for state, code in EMOTION_CODES.items()}
+CALENDAR_DAYS = 366
+_MAX_DAY_COUNT = 31
+
+
+def _state_value(state) -> Optional[str]:
+    return getattr(state, "value", state)
+
+
+def encode_calendar_day(counts: Dict[str, int]) -> int:
+    """감정별 일기 수를 1바이트로 만듭니다. 대표 감정은 가장 많은 감정 (같으면 Enum 순서)"""
+    counts = {state: count for state, count in counts.items() if count > 0}
+    if not counts:
+        return 0
+    dominant = max(counts, key=lambda state: (counts[state], -EMOTION_CODES[state]))
+    total = min(sum(counts.values()), _MAX_DAY_COUNT)
+    return (total << 3) | EMOTION_CODES[dominant]
+
+
+def decode_calendar_day(value: int) -> Tuple[int, Optional[str]]:
+    return value >> 3, CODE_EMOTIONS.get(value & 0b111)
+
+
+async def refresh_calendar_days(
+    user_id: int, days: Iterable[date], using_db: Optional[BaseDBAsyncClient] = None
+) -> None:
+    """user_emotion_daily의 값으로 달력에서 days에 해당하는 바이트를 다시 씁니다."""
+    days = set(days)
+    if not days:
+        return
+    counts: Dict[date, Dict[str, int]] = {day: {} for day in days}
+    rows = await (
+        UserEmotionDaily.filter(user_id=user_id, day__in=list(days))
+        .using_db(using_db)
+        .values_list("day", "emotional_state", "count")
+    )
+    for day, state, count in rows:
+        counts[day][state] = count
+    values = {
+        day: encode_calendar_day(day_counts) for day, day_counts in counts.items()
+    }
+
+    new_years = sorted({day.year for day, value in values.items() if value})
+    if new_years:
+        await UserCalendar.bulk_create(
+            [
+                UserCalendar(user_id=user_id, year=year, days=bytes(CALENDAR_DAYS))
+                for year in new_years
+            ],
+            ignore_conflicts=True,
+            using_db=using_db,
+        )
+    # 같은 사용자의 동시 수정이 서로의 바이트를 덮어쓰지 않도록 행을 잠급니다.
+    calendars = await (
+        UserCalendar.filter(user_id=user_id, year__in=sorted({d.year for d in days}))
+        .using_db(using_db)
+        .select_for_update()
+    )
+    for calendar in calendars:
+        calendar_days = bytearray(calendar.days)
+        for day, value in values.items():
+            if day.year == calendar.year:
+                calendar_days[day.timetuple().tm_yday - 1] = value
+        if calendar_days != calendar.days:
+            calendar.days = bytes(calendar_days)
+            await calendar.save(update_fields=["days"], using_db=using_db)
+
+
+async def refresh_calendar_day(
+    user_id: int, day: date, using_db: Optional[BaseDBAsyncClient] = None
+) -> None:
+    await refresh_calendar_days(user_id, [day], using_db)
+
+
+async def bump_emotion(
+    user_id: int,
+    day: date,
+    emotional_state,
+    delta: int,
+    using_db: Optional[BaseDBAsyncClient] = None,
+) -> None:
+    """(사용자, 날짜, 감정) 일기 수를 delta만큼 바꿉니다. 0이 된 행은 지웁니다."""
+    state = _state_value(emotional_state)
+    if not state or not delta:
+        return
+    if delta > 0:
+        # 행이 없으면 0으로 만든 뒤 더합니다. (동시에 만들어도 unique 충돌을 무시)
+        await UserEmotionDaily.bulk_create(
+            [UserEmotionDaily(user_id=user_id, day=day, emotional_state=state)],
+            ignore_conflicts=True,
+            using_db=using_db,
+        )
+    query = UserEmotionDaily.filter(
+        user_id=user_id, day=day, emotional_state=state
+    ).using_db(using_db)
+    await query.update(count=F("count") + delta)
+    if delta < 0:
+        await query.filter(count__lte=0).delete()
+
+
+async def bump_tag_usage(
+    user_id: int,
+    tag_ids: Iterable[int],
+    delta: int,
+    using_db: Optional[BaseDBAsyncClient] = None,
+) -> None:
+    """사용자의 태그별 사용 횟수를 delta만큼 바꿉니다. 태그 수와 상관없이 최대 2번의 쿼리"""
+    tag_ids = list(tag_ids)
+    if not tag_ids or not delta:
+        return
+    if delta > 0:
+        await UserTagUsage.bulk_create(
+            [UserTagUsage(user_id=user_id, tag_id=tag_id) for tag_id in tag_ids],
+            ignore_conflicts=True,
+            using_db=using_db,
+        )
+    query = UserTagUsage.filter(user_id=user_id, tag_id__in=tag_ids).using_db(using_db)
+    await query.update(usage_count=F("usage_count") + delta)
+    if delta < 0:
+        await query.filter(usage_count__lte=0).delete()
+
+
+async def bump_diary_versions(
+    user_ids: Iterable[int], using_db: Optional[BaseDBAsyncClient] = None
+) -> None:
+    """사용자들의 일기 목록 버전을 1씩 올립니다. 사용자 수와 상관없이 2번의 쿼리"""
+    user_ids = sorted(set(user_ids))
+    if not user_ids:
+        return
+    await UserDiaryVersion.bulk_create(
+        [UserDiaryVersion(user_id=user_id) for user_id in user_ids],
+        ignore_conflicts=True,
+        using_db=using_db,
+    )
+    await (
+        UserDiaryVersion.filter(user_id__in=user_ids)
+        .using_db(using_db)
+        .update(version=F("version") + 1)
+    )
+
+
+async def bump_diary_version(
+    user_id: int, using_db: Optional[BaseDBAsyncClient] = None
+) -> None:
+    await bump_diary_versions([user_id], using_db)
+
+
+async def get_diary_version(user_id: int) -> int:
+    """사용자의 일기 목록 버전 (아직 쓰기가 없었으면 0)"""
+    version = await (
+        UserDiaryVersion.filter(user_id=user_id)
+        .first()
+        .values_list("version", flat=True)
+    )
+    return version or 0
+
+
+async def bump_emotions(
+    user_id: int,
+    deltas: Dict[Tuple[date, str], int],
+    using_db: Optional[BaseDBAsyncClient] = None,
+) -> None:
+    """
+    여러 (날짜, 감정)의 일기 수를 한 번에 바꿉니다. (일기를 한꺼번에 추가/삭제할 때)
+    키 수와 상관없이 행 보장 1번 + id 조회 1번 + delta 종류마다 갱신/정리 쿼리
+    """
+    deltas = {
+        (day, _state_value(state)): delta
+        for (day, state), delta in deltas.items()
+        if _state_value(state) and delta
+    }
+    if not deltas:
+        return
+    created = [key for key, delta in deltas.items() if delta > 0]
+    if created:
+        await UserEmotionDaily.bulk_create(
+            [
+                UserEmotionDaily(user_id=user_id, day=day, emotional_state=state)
+                for day, state in created
+            ],
+            ignore_conflicts=True,
+            using_db=using_db,
+        )
+    rows = await (
+        UserEmotionDaily.filter(user_id=user_id, day__in=list({d for d, _ in deltas}))
+        .using_db(using_db)
+        .values_list("id", "day", "emotional_state")
+    )
+    ids_by_delta: Dict[int, List[int]] = {}
+    for row_id, day, state in rows:
+        delta = deltas.get((day, state))
+        if delta:
+            ids_by_delta.setdefault(delta, []).append(row_id)
+    for delta, ids in ids_by_delta.items():
+        query = UserEmotionDaily.filter(id__in=ids).using_db(using_db)
+        await query.update(count=F("count") + delta)
+        if delta < 0:
+            await query.filter(count__lte=0).delete()
+
+
+async def bump_tag_usages(
+    user_id: int, deltas: Dict[int, int], using_db: Optional[BaseDBAsyncClient] = None
+) -> None:
+    """태그마다 다른 delta로 사용 횟수를 바꿉니다. (delta 종류마다 bump_tag_usage 한 번)"""
+    tag_ids_by_delta: Dict[int, List[int]] = {}
+    for tag_id, delta in deltas.items():
+        if delta:
+            tag_ids_by_delta.setdefault(delta, []).append(tag_id)
+    for delta, tag_ids in tag_ids_by_delta.items():
+        await bump_tag_usage(user_id, tag_ids, delta, using_db)
+
+
+async def record_diaries_created(
+    user_id: int,
+    diaries: Iterable[Diary],
+    tag_ids: Dict[int, List[int]],
+    using_db: Optional[BaseDBAsyncClient] = None,
+) -> None:
+    """
+    한 사용자의 일기 여러 개를 한꺼번에 만든 뒤 집계를 반영합니다.
+    tag_ids: {diary_id: [tag_id, ...]}
+    """
+    emotions: Counter = Counter(
+        (diary.created_at.date(), diary.emotional_state) for diary in diaries
+    )
+    tag_usage: Counter = Counter(
+        tag_id for diary_tag_ids in tag_ids.values() for tag_id in diary_tag_ids
+    )
+    await apply_stats_deltas(user_id, emotions, tag_usage, using_db)
+
+
+async def apply_stats_deltas(
+    user_id: int,
+    emotions: Dict[Tuple[date, str], int],
+    tag_usage: Dict[int, int],
+    using_db: Optional[BaseDBAsyncClient] = None,
+) -> None:
+    """
+    일기를 한꺼번에 추가/수정/삭제한 뒤 집계를 반영합니다.
+    emotions: {(날짜, 감정): 일기 수 변화}, tag_usage: {tag_id: 사용 횟수 변화}
+    """
+    await bump_emotions(user_id, emotions, using_db)
+    await refresh_calendar_days(
+        user_id, (day for (day, _), delta in emotions.items() if delta), using_db
+    )
+    await bump_tag_usages(user_id, tag_usage, using_db)
+
+
+async def record_diary_created(
+    diary: Diary, tag_ids: List[int], using_db: Optional[BaseDBAsyncClient] = None
+) -> None:
+    day = diary.created_at.date()
+    await bump_emotion(diary.user_id, day, diary.emotional_state, 1, using_db)
+    await refresh_calendar_day(diary.user_id, day, using_db)
+    await bump_tag_usage(diary.user_id, tag_ids, 1, using_db)
+
+
+async def record_diary_updated(
+    diary: Diary,
+    previous_state,
+    added_tag_ids: List[int],
+    removed_tag_ids: List[int],
+    using_db: Optional[BaseDBAsyncClient] = None,
+) -> None:
+    if _state_value(previous_state) != _state_value(diary.emotional_state):
+        day = diary.created_at.date()
+        await bump_emotion(diary.user_id, day, previous_state, -1, using_db)
+        await bump_emotion(diary.user_id, day, diary.emotional_state, 1, using_db)
+        await refresh_calendar_day(diary.user_id, day, using_db)
+    await bump_tag_usage(diary.user_id, added_tag_ids, 1, using_db)
+    await bump_tag_usage(diary.user_id, removed_tag_ids, -1, using_db)
+
+
+async def record_diary_deleted(
+    diary: Diary, tag_ids: List[int], using_db: Optional[BaseDBAsyncClient] = None
+) -> None:
+    day = diary.created_at.date()
+    await bump_emotion(diary.user_id, day, diary.emotional_state, -1, using_db)
+    await refresh_calendar_day(diary.user_id, day, using_db)
+    await bump_tag_usage(diary.user_id, tag_ids, -1, using_db)
+
+
+async def get_emotion_stats_service(
+    user_id: int, start_date: Optional[date] = None, end_date: Optional[date] = None
+) -> EmotionStats:
+    """집계 테이블만 읽습니다. (기간 내 날짜 수 x 감정 수 이하의 행)"""
+    query = UserEmotionDaily.filter(user_id=user_id)
+    if start_date:
+        query = query.filter(day__gte=start_date)
+    if end_date:
+        query = query.filter(day__lte=end_date)
+    rows = await query.order_by("day", "emotional_state").values_list(
+        "day", "emotional_state", "count"
+    )
+
+    totals: Dict[str, int] = Counter()
+    for _, state, count in rows:
+        totals[state] += count
+    return EmotionStats(
+        daily=[
+            EmotionDailyCount(day=day, emotional_state=state, count=count)
+            for day, state, count in rows
+        ],
+        totals=dict(totals),
+    )
+
+
+async def get_calendar_service(user_id: int, year: int) -> CalendarOut:
+    """달력 행 하나(366바이트)만 읽어 일기가 있는 날을 반환합니다."""
+    days = await (
+        UserCalendar.filter(user_id=user_id, year=year)
+        .first()
+        .values_list("days", flat=True)
+    )
+    result = []
+    for index, value in enumerate(days or b""):
+        if not value:
+            continue
+        count, state = decode_calendar_day(value)
+        result.append(
+            CalendarDay(
+                day=date(year, 1, 1) + timedelta(days=index),
+                count=count,
+                emotional_state=state,
+            )
+        )
+    return CalendarOut(year=year, days=result)
+
+
+def build_calendars(emotions: Dict[Tuple[int, date, str], int]) -> List[UserCalendar]:
+    """(user_id, 날짜, 감정)별 일기 수로 달력 행을 만듭니다."""
+    per_day: Dict[Tuple[int, date], Dict[str, int]] = {}
+    for (owner_id, day, state), count in emotions.items():
+        per_day.setdefault((owner_id, day), {})[state] = count
+
+    calendars: Dict[Tuple[int, int], bytearray] = {}
+    for (owner_id, day), counts in per_day.items():
+        days = calendars.get((owner_id, day.year))
+        if days is None:
+            days = calendars[(owner_id, day.year)] = bytearray(CALENDAR_DAYS)
+        days[day.timetuple().tm_yday - 1] = encode_calendar_day(counts)
+    return [
+        UserCalendar(user_id=owner_id, year=year, days=bytes(days))
+        for (owner_id, year), days in calendars.items()
+    ]
+
+
+async def get_tag_usage_service(user_id: int, limit: int = 20) -> List[TagInList]:
+    rows = (
+        await UserTagUsage.filter(user_id=user_id)
+        .order_by("-usage_count", "tag_id")
+        .limit(limit)
+        .values_list("tag_id", "tag__name", "usage_count")
+    )
+    return [
+        TagInList(tag_id=tag_id, name=name, usage_count=count)
+        for tag_id, name, count in rows
+    ]
+
+
+async def ensure_user_stats() -> None:
+    """
+    집계 테이블이 비어 있는데 집계할 일기/태그가 있으면 (처음 도입했거나 마이그레이션
+    직후) 전체를 한 번 다시 계산합니다. (앱 시작 시 호출)
+    """
+    if await UserEmotionDaily.exists() or await UserTagUsage.exists():
+        return
+    if (
+        await Diary.filter(emotional_state__isnull=False).exists()
+        or await DiaryTag.exists()
+    ):
+        await rebuild_user_stats()
+
+
+async def rebuild_user_stats(
+    user_id: Optional[int] = None, batch_size: int = 5000
+) -> Tuple[int, int]:
+    """
+    집계 테이블(감정/태그/달력)을 일기/diary_tags 원본에서 다시 계산합니다. (어긋난 값 복구용)
+    user_id를 주면 그 사용자만 다시 계산합니다.
+
+    반환값: (감정 집계 행 수, 태그 사용 집계 행 수)
+    """
+    emotions: Counter = Counter()
+    last_id = 0
+    while True:
+        query = Diary.filter(id__gt=last_id)
+        if user_id is not None:
+            query = query.filter(user_id=user_id)
+        rows = (
+            await query.order_by("id")
+            .limit(batch_size)
+            .values_list("id", "user_id", "created_at", "emotional_state")
+        )
+        if not rows:
+            break
+        for _, owner_id, created_at, state in rows:
+            state = _state_value(state)
+            if state:
+                emotions[(owner_id, created_at.date(), state)] += 1
+        last_id = rows[-1][0]
+
+    tag_usage: Counter = Counter()
+    last_id = 0
+    while True:
+        query = DiaryTag.filter(id__gt=last_id)
+        if user_id is not None:
+            query = query.filter(user_id=user_id)
+        rows = (
+            await query.order_by("id")
+            .limit(batch_size)
+            .values_list("id", "user_id", "tag_id")
+        )
+        if not rows:
+            break
+        for _, owner_id, tag_id in rows:
+            tag_usage[(owner_id, tag_id)] += 1
+        last_id = rows[-1][0]
+
+    async with in_transaction() as conn:
+        emotion_query = UserEmotionDaily.all().using_db(conn)
+        tag_query = UserTagUsage.all().using_db(conn)
+        calendar_query = UserCalendar.all().using_db(conn)
+        if user_id is not None:
+            emotion_query = emotion_query.filter(user_id=user_id)
+            tag_query = tag_query.filter(user_id=user_id)
+            calendar_query = calendar_query.filter(user_id=user_id)
+        await emotion_query.delete()
+        await tag_query.delete()
+        await calendar_query.delete()
+
+        if emotions:
+            await UserEmotionDaily.bulk_create(
+                [
+                    UserEmotionDaily(
+                        user_id=owner_id, day=day, emotional_state=state, count=count
+                    )
+                    for (owner_id, day, state), count in emotions.items()
+                ],
+                batch_size=1000,
+                using_db=conn,
+            )
+        calendars = build_calendars(emotions)
+        if calendars:
+            await UserCalendar.bulk_create(calendars, batch_size=1000, using_db=conn)
+        if tag_usage:
+            await UserTagUsage.bulk_create(
+                [
+                    UserTagUsage(user_id=owner_id, tag_id=tag_id, usage_count=count)
+                    for (owner_id, tag_id), count in tag_usage.items()
+                ],
+                batch_size=1000,
+                using_db=conn,
+            )
+    return len(emotions), len(tag_usage)
@@ -0,0 +1,356 @@
+# app/services/summary_service.py
+
+import asyncio
+import hashlib
+import logging
+import time
+from typing import AsyncIterator, Dict, List, Optional
+
+from tortoise import timezone
+from tortoise.exceptions import IntegrityError
+from tortoise.expressions import Q
+from tortoise.transactions import in_transaction
+
+from app.core.config import (
+    SUMMARY_BACKFILL_CONCURRENCY,
+    SUMMARY_BATCH_MAX_TOKENS,
+    SUMMARY_BATCH_SIZE,
+    SUMMARY_CACHE_SIZE,
+    SUMMARY_MAX_RETRIES,
+    SUMMARY_RETRY_BACKOFF_SECONDS,
+    SUMMARY_WORKERS,
+)
+from app.models.diary import Diary
+from app.models.summary_cache import SummaryCache
+from app.services.ai_service import (
+    SUMMARY_PROMPT_VERSION,
+    AIServiceUnavailable,
+    get_ai_service,
+)
+from app.services.stats_service import bump_diary_versions
+from app.utils.cache import LRUCache
+from app.utils.job_queue import JobQueue, PermanentJobError
+
+logger = logging.getLogger(__name__)
+
+# 요약 캐시 메모리 계층 (key -> summary)
+summary_memory_cache = LRUCache(maxsize=SUMMARY_CACHE_SIZE)
+
+summary_cache_stats = {"memory_hits": 0, "db_hits": 0, "misses": 0}
+summary_batch_stats = {"batch_calls": 0, "fallback_calls": 0, "failed": 0}
+
+# 요약 작업 큐 (앱 시작 시 워커 실행)
+summary_jobs = JobQueue(
+    workers=SUMMARY_WORKERS,
+    max_retries=SUMMARY_MAX_RETRIES,
+    retry_backoff=SUMMARY_RETRY_BACKOFF_SECONDS,
+)
+
+
+def summary_cache_key(model_name: str, content: str) -> str:
+    """(모델 이름, 프롬프트 버전, 본문)이 같으면 같은 요약을 재사용합니다."""
+    raw = "\0".join((model_name, SUMMARY_PROMPT_VERSION, content))
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+async def _get_cached_summary(key: str) -> Optional[str]:
+    summary: Optional[str] = summary_memory_cache.get(key)
+    if summary is not None:
+        summary_cache_stats["memory_hits"] += 1
+        return summary
+
+    cached = (
+        await SummaryCache.filter(key=key).first().values_list("summary", flat=True)
+    )
+    if cached is not None:
+        summary_cache_stats["db_hits"] += 1
+        summary_memory_cache.set(key, cached)
+    return cached
+
+
+async def _store_summary(key: str, model_name: str, summary: str) -> None:
+    try:
+        await SummaryCache.create(key=key, model=model_name, summary=summary)
+    except IntegrityError:
+        # 동시에 같은 본문을 요약한 요청이 먼저 저장한 경우
+        pass
+    summary_memory_cache.set(key, summary)
+
+
+async def get_or_create_summary(content: str, ai_service=None) -> str:
+    """
+    본문 요약을 메모리 캐시 -> summary_cache 테이블 -> AI 모델 순으로 찾습니다.
+    새로 만든 요약은 두 계층에 모두 저장합니다.
+    """
+    ai_service = ai_service or get_ai_service()
+    key = summary_cache_key(ai_service.model_name, content)
+
+    summary = await _get_cached_summary(key)
+    if summary is not None:
+        return summary
+
+    summary_cache_stats["misses"] += 1
+    summary = await ai_service.summarize_diary(content)
+    await _store_summary(key, ai_service.model_name, summary)
+    return summary
+
+
+def get_summary_cache_stats() -> dict:
+    return {
+        **summary_cache_stats,
+        "memory": summary_memory_cache.stats(),
+        "batch": summary_batch_stats,
+    }
+
+
+def estimate_tokens(text: str) -> int:
+    """입력 토큰 수를 대략 추정합니다. (한국어는 대략 1~2글자에 1토큰)"""
+    return len(text) // 2 + 1
+
+
+def pack_batches(
+    contents: Dict[int, str],
+    batch_size: int,
+    max_tokens: int,
+    owners: Optional[Dict[int, int]] = None,
+) -> List[Dict[int, str]]:
+    """
+    일기들을 호출당 최대 batch_size 개, 예상 토큰 max_tokens 이하로 묶습니다.
+    혼자서 max_tokens를 넘는 일기는 단독 묶음이 됩니다.
+    owners({일기 id: user_id})를 주면 작성자가 다른 일기는 같은 묶음에 넣지 않습니다.
+    (한 프롬프트에 다른 사용자의 일기가 섞이지 않도록, contents는 작성자 순으로 전달)
+    """
+    owners = owners or {}
+    batches: List[Dict[int, str]] = []
+    current: Dict[int, str] = {}
+    current_owner = None
+    tokens = 0
+    for diary_id, content in contents.items():
+        cost = estimate_tokens(content)
+        owner = owners.get(diary_id)
+        if current and (
+            len(current) >= batch_size
+            or tokens + cost > max_tokens
+            or owner != current_owner
+        ):
+            batches.append(current)
+            current, tokens = {}, 0
+        current[diary_id] = content
+        current_owner = owner
+        tokens += cost
+    if current:
+        batches.append(current)
+    return batches
+
+
+async def _summarize_batch(ai_service, batch: Dict[int, str]) -> Dict[int, str]:
+    """한 묶음을 일괄 요약하고, 응답에서 빠지거나 해석에 실패한 일기는 하나씩 요약합니다."""
+    summary_batch_stats["batch_calls"] += 1
+    try:
+        summaries = await ai_service.summarize_diaries(batch)
+    except AIServiceUnavailable as e:
+        # 제공자 장애 시에는 개별 요약도 실패하므로 바로 포기합니다. (다음 실행에서 재시도)
+        summary_batch_stats["failed"] += len(batch)
+        logger.warning("일괄 요약 실패: %s", e)
+        return {}
+    except Exception as e:
+        logger.warning("일괄 요약 실패, 개별 요약으로 대체합니다: %s", e)
+        summaries = {}
+
+    for diary_id, content in batch.items():
+        if diary_id in summaries:
+            continue
+        summary_batch_stats["fallback_calls"] += 1
+        try:
+            summaries[diary_id] = await ai_service.summarize_diary(content)
+        except Exception as e:
+            summary_batch_stats["failed"] += 1
+            logger.warning("일기 %s 요약 실패: %s", diary_id, e)
+    return summaries
+
+
+async def summarize_many(
+    contents: Dict[int, str],
+    ai_service=None,
+    batch_size: int = SUMMARY_BATCH_SIZE,
+    max_tokens: int = SUMMARY_BATCH_MAX_TOKENS,
+    concurrency: int = SUMMARY_BACKFILL_CONCURRENCY,
+    owners: Optional[Dict[int, int]] = None,
+) -> Dict[int, str]:
+    """
+    여러 일기({일기 id: 본문})를 요약합니다. ({일기 id: 요약}, 실패한 일기는 빠짐)
+
+    캐시에 있는 본문은 모델을 호출하지 않고, 나머지는 묶음 단위로 최대 concurrency 개씩
+    동시에 요약합니다. 같은 본문은 한 번만 요약합니다.
+    owners({일기 id: user_id})를 주면 묶음마다 한 사용자의 일기만 넣습니다.
+    """
+    ai_service = ai_service or get_ai_service()
+    keys = {
+        diary_id: summary_cache_key(ai_service.model_name, content)
+        for diary_id, content in contents.items()
+    }
+
+    found: Dict[str, str] = {}
+    for key in set(keys.values()):
+        summary = summary_memory_cache.get(key)
+        if summary is not None:
+            found[key] = summary
+    summary_cache_stats["memory_hits"] += len(found)
+
+    missing_keys = set(keys.values()) - found.keys()
+    if missing_keys:
+        rows = await SummaryCache.filter(key__in=list(missing_keys)).values_list(
+            "key", "summary"
+        )
+        summary_cache_stats["db_hits"] += len(rows)
+        for key, summary in rows:
+            found[key] = summary
+            summary_memory_cache.set(key, summary)
+
+    # 캐시에 없는 본문만 (같은 본문은 하나만) 모델로 보냅니다.
+    pending: Dict[int, str] = {}
+    pending_keys = set()
+    for diary_id, key in keys.items():
+        if key not in found and key not in pending_keys:
+            pending[diary_id] = contents[diary_id]
+            pending_keys.add(key)
+    summary_cache_stats["misses"] += len(pending)
+
+    if pending:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(batch):
+            async with semaphore:
+                return await _summarize_batch(ai_service, batch)
+
+        results = await asyncio.gather(
+            *(
+                run(batch)
+                for batch in pack_batches(pending, batch_size, max_tokens, owners)
+            )
+        )
+        created = {}
+        for summaries in results:
+            for diary_id, summary in summaries.items():
+                created[keys[diary_id]] = summary
+        if created:
+            await SummaryCache.bulk_create(
+                [
+                    SummaryCache(key=key, model=ai_service.model_name, summary=summary)
+                    for key, summary in created.items()
+                ],
+                ignore_conflicts=True,
+            )
+            for key, summary in created.items():
+                summary_memory_cache.set(key, summary)
+        found.update(created)
+
+    return {diary_id: found[key] for diary_id, key in keys.items() if key in found}
+
+
+async def save_summaries(diaries: List[Diary]) -> None:
+    """
+    ai_summary를 바꾼 일기를 저장합니다. 응답 ETag가 바뀌도록 updated_at과
+    사용자별 일기 목록 버전도 같은 트랜잭션에서 갱신합니다.
+    """
+    if not diaries:
+        return
+    now = timezone.now()
+    for diary in diaries:
+        diary.updated_at = now
+    async with in_transaction() as conn:
+        await Diary.bulk_update(
+            diaries, fields=["ai_summary", "updated_at"], using_db=conn
+        )
+        await bump_diary_versions((diary.user_id for diary in diaries), using_db=conn)
+
+
+async def backfill_summaries(
+    ai_service=None,
+    page_size: int = 500,
+    batch_size: int = SUMMARY_BATCH_SIZE,
+    max_tokens: int = SUMMARY_BATCH_MAX_TOKENS,
+    concurrency: int = SUMMARY_BACKFILL_CONCURRENCY,
+    limit: Optional[int] = None,
+) -> dict:
+    """
+    요약이 없는 일기를 (user_id, id) 순으로 page_size 개씩 읽어 일괄 요약하고 저장합니다.
+    한 번의 모델 호출에는 한 사용자의 일기만 넣습니다. (다른 사용자의 일기가 프롬프트에
+    함께 노출되거나, 일기 본문으로 다른 사용자의 요약을 조작하지 못하도록)
+    실패한 일기는 요약이 없는 채로 남으므로 다시 실행하면 이어서 처리됩니다.
+    """
+    started = time.perf_counter()
+    result = {"diaries": 0, "summarized": 0, "failed": 0}
+    last_user_id, last_id = 0, 0
+    while limit is None or result["diaries"] < limit:
+        size = page_size if limit is None else min(page_size, limit - result["diaries"])
+        diaries = (
+            await Diary.filter(ai_summary__isnull=True)
+            .filter(
+                Q(user_id__gt=last_user_id) | Q(user_id=last_user_id, id__gt=last_id)
+            )
+            .order_by("user_id", "id")
+            .limit(size)
+        )
+        if not diaries:
+            break
+        last_user_id, last_id = diaries[-1].user_id, diaries[-1].id
+        result["diaries"] += len(diaries)
+
+        summaries = await summarize_many(
+            {diary.id: diary.content for diary in diaries},
+            ai_service,
+            batch_size=batch_size,
+            max_tokens=max_tokens,
+            concurrency=concurrency,
+            owners={diary.id: diary.user_id for diary in diaries},
+        )
+        updated = []
+        for diary in diaries:
+            if diary.id in summaries:
+                diary.ai_summary = summaries[diary.id]
+                updated.append(diary)
+        await save_summaries(updated)
+        result["summarized"] += len(updated)
+        result["failed"] += len(diaries) - len(updated)
+
+    result["duration_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    return result
+
+
+async def summarize_diary_job(diary_id: int, ai_service=None) -> str:
+    """요약 작업 본체. 일기 요약을 만들어 저장하고 요약 문자열을 반환합니다."""
+    diary = await Diary.get_or_none(id=diary_id)
+    if diary is None:
+        # 작업이 대기하는 동안 일기가 삭제된 경우 (재시도해도 소용없음)
+        raise PermanentJobError("일기를 찾을 수 없습니다.")
+    summary = await get_or_create_summary(diary.content, ai_service)
+    if diary.ai_summary != summary:
+        diary.ai_summary = summary
+        await save_summaries([diary])
+    return summary
+
+
+async def stream_diary_summary(diary: Diary, ai_service=None) -> AsyncIterator[str]:
+    """
+    일기 요약을 모델이 생성하는 대로 조각(chunk) 단위로 내보냅니다.
+    캐시에 있으면 한 번에 내보내고, 스트림이 끝나면 요약을 캐시와 일기에 저장합니다.
+    """
+    ai_service = ai_service or get_ai_service()
+    key = summary_cache_key(ai_service.model_name, diary.content)
+
+    summary = await _get_cached_summary(key)
+    if summary is None:
+        summary_cache_stats["misses"] += 1
+        chunks = []
+        async for chunk in ai_service.stream_summary(diary.content):
+            chunks.append(chunk)
+            yield chunk
+        summary = "".join(chunks).strip()
+        await _store_summary(key, ai_service.model_name, summary)
+    else:
+        yield summary
+
+    if diary.ai_summary != summary:
+        diary.ai_summary = summary
+        await save_summaries([diary])
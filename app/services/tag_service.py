@@ -0,0 +1,288 @@
+# app/services/tag_service.py
+
+import base64
+import binascii
+import json
+from typing import Iterable, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from tortoise import timezone
+from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.expressions import Q
+from tortoise.transactions import in_transaction
+
+from app.models.diary import Diary, DiaryTag
+from app.models.tag import Tag
+from app.models.user_stats import UserTagUsage
+from app.schemas.tag import RecentDiary, TagDetailData, TagInList
+from app.services.stats_service import bump_diary_version, bump_tag_usage
+
+
+def normalize_tag_names(names: Optional[Iterable[str]]) -> List[str]:
+    """앞뒤 공백을 제거하고 빈 값과 중복을 없앱니다. (입력 순서 유지)"""
+    normalized = []
+    seen = set()
+    for name in names or []:
+        name = name.strip()
+        if name and name not in seen:
+            seen.add(name)
+            normalized.append(name)
+    return normalized
+
+
+async def resolve_tags(
+    names: Optional[Iterable[str]], using_db: Optional[BaseDBAsyncClient] = None
+) -> List[Tag]:
+    """
+    태그 이름 목록을 Tag 객체로 바꿉니다. 없는 태그는 한 번에 생성합니다.
+
+    1. 이름 정규화
+    2. 기존 태그를 IN 쿼리 한 번으로 조회
+    3. 없는 태그만 bulk insert (동시에 같은 이름이 생성되면 unique 인덱스 충돌을 무시)
+       후 다시 한 번 조회
+
+    태그 개수와 상관없이 최대 3번의 쿼리로 끝납니다.
+    """
+    names = normalize_tag_names(names)
+    if not names:
+        return []
+
+    tags = {
+        tag.name: tag for tag in await Tag.filter(name__in=names).using_db(using_db)
+    }
+    missing = [name for name in names if name not in tags]
+    if missing:
+        await Tag.bulk_create(
+            [Tag(name=name) for name in missing],
+            ignore_conflicts=True,
+            using_db=using_db,
+        )
+        for tag in await Tag.filter(name__in=missing).using_db(using_db):
+            tags[tag.name] = tag
+
+    return [tags[name] for name in names]
+
+
+def make_diary_tags(diary: Diary, tag_ids: Iterable[int]) -> List[DiaryTag]:
+    return [
+        DiaryTag(
+            diary_id=diary.id,
+            tag_id=tag_id,
+            user_id=diary.user_id,
+            created_at=diary.created_at,
+        )
+        for tag_id in tag_ids
+    ]
+
+
+async def sync_diary_tags(
+    diary: Diary,
+    names: Optional[Iterable[str]],
+    using_db: Optional[BaseDBAsyncClient] = None,
+) -> Tuple[List[int], List[int]]:
+    """
+    일기의 태그를 names로 맞춥니다. 전체 삭제 후 재삽입하지 않고
+    기존 태그와의 차이만 삭제/추가합니다.
+
+    반환값: (추가된 tag_id 목록, 삭제된 tag_id 목록)
+    """
+    tags = await resolve_tags(names, using_db=using_db)
+    current = set(
+        await DiaryTag.filter(diary_id=diary.id)
+        .using_db(using_db)
+        .values_list("tag_id", flat=True)
+    )
+    target = [tag.id for tag in tags]
+
+    added = [tag_id for tag_id in target if tag_id not in current]
+    removed = sorted(current - set(target))
+
+    if removed:
+        await (
+            DiaryTag.filter(diary_id=diary.id, tag_id__in=removed)
+            .using_db(using_db)
+            .delete()
+        )
+    if added:
+        await DiaryTag.bulk_create(make_diary_tags(diary, added), using_db=using_db)
+    return added, removed
+
+
+def encode_tag_cursor(usage_count: int, tag_id: int) -> str:
+    raw = json.dumps([usage_count, tag_id])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_tag_cursor(cursor: str) -> Tuple[int, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        usage_count, tag_id = json.loads(base64.urlsafe_b64decode(padded))
+        return int(usage_count), int(tag_id)
+    except (binascii.Error, ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="유효하지 않은 cursor 값입니다.",
+        )
+
+
+async def touch_diaries(
+    user_id: int, diary_ids: List[int], using_db: Optional[BaseDBAsyncClient] = None
+) -> None:
+    """
+    태그 이름이 바뀐 일기의 updated_at과 사용자의 일기 목록 버전을 갱신합니다.
+    (일기/목록 응답의 ETag가 바뀌도록)
+    """
+    if not diary_ids:
+        return
+    await (
+        Diary.filter(user_id=user_id, id__in=diary_ids)
+        .using_db(using_db)
+        .update(updated_at=timezone.now())
+    )
+    await bump_diary_version(user_id, using_db=using_db)
+
+
+async def get_user_tags_service(
+    user_id: int, limit: int = 50, cursor: Optional[str] = None
+) -> dict:
+    """
+    사용자의 태그를 사용 횟수 순으로 limit 개씩 반환합니다.
+    미리 집계된 user_tag_usage를 (user_id, usage_count, tag_id) 인덱스 순서대로 읽으므로
+    태그가 많아도 페이지마다 비용이 같습니다.
+    """
+    query = UserTagUsage.filter(user_id=user_id)
+    if cursor:
+        usage_count, tag_id = decode_tag_cursor(cursor)
+        query = query.filter(
+            Q(usage_count__lt=usage_count)
+            | Q(usage_count=usage_count, tag_id__gt=tag_id)
+        )
+    rows = (
+        await query.order_by("-usage_count", "tag_id")
+        .limit(limit + 1)
+        .values_list("tag_id", "tag__name", "usage_count")
+    )
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_tag_cursor(rows[-1][2], rows[-1][0])
+    return {
+        "tags": [
+            TagInList(tag_id=tag_id, name=name, usage_count=usage_count)
+            for tag_id, name, usage_count in rows
+        ],
+        "next_cursor": next_cursor,
+    }
+
+
+async def _get_usage_or_404(
+    user_id: int, tag_id: int, using_db: Optional[BaseDBAsyncClient] = None
+) -> UserTagUsage:
+    usage = await (
+        UserTagUsage.filter(user_id=user_id, tag_id=tag_id)
+        .using_db(using_db)
+        .select_related("tag")
+        .first()
+    )
+    if not usage:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="해당 태그를 찾을 수 없습니다.",
+        )
+    return usage
+
+
+async def get_user_tag_detail_service(
+    user_id: int, tag_id: int, recent_limit: int = 5
+) -> TagDetailData:
+    """
+    태그 정보와 그 태그가 달린 최근 일기를 반환합니다.
+    최근 일기는 diary_tags의 (user_id, tag_id, created_at) 인덱스 순서대로 읽습니다.
+    """
+    usage = await _get_usage_or_404(user_id, tag_id)
+    rows = (
+        await DiaryTag.filter(user_id=user_id, tag_id=tag_id)
+        .order_by("-created_at", "-diary_id")
+        .limit(recent_limit)
+        .values_list("diary_id", "diary__title", "created_at")
+    )
+    return TagDetailData(
+        tag_id=tag_id,
+        name=usage.tag.name,
+        usage_count=usage.usage_count,
+        recent_diaries=[
+            RecentDiary(
+                diary_id=diary_id, title=title, created_at=created_at.isoformat()
+            )
+            for diary_id, title, created_at in rows
+        ],
+    )
+
+
+async def rename_user_tag_service(
+    user_id: int, tag_id: int, new_name: str
+) -> TagDetailData:
+    """
+    사용자의 일기에 달린 태그 이름을 바꿉니다.
+    태그는 모든 사용자가 공유하므로 Tag 행을 고치지 않고, 이 사용자의 diary_tags만
+    새 이름의 태그로 옮깁니다. (이미 새 태그가 달린 일기는 기존 태그만 제거)
+    """
+    names = normalize_tag_names([new_name])
+    if not names:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="태그 이름을 입력해 주세요.",
+        )
+
+    async with in_transaction() as conn:
+        await _get_usage_or_404(user_id, tag_id, using_db=conn)
+        [target] = await resolve_tags(names, using_db=conn)
+        if target.id != tag_id:
+            diary_ids = await (
+                DiaryTag.filter(user_id=user_id, tag_id=tag_id)
+                .using_db(conn)
+                .values_list("diary_id", flat=True)
+            )
+            duplicated = await (
+                DiaryTag.filter(
+                    user_id=user_id, tag_id=target.id, diary_id__in=diary_ids
+                )
+                .using_db(conn)
+                .values_list("diary_id", flat=True)
+            )
+            if duplicated:
+                await (
+                    DiaryTag.filter(tag_id=tag_id, diary_id__in=duplicated)
+                    .using_db(conn)
+                    .delete()
+                )
+            await (
+                DiaryTag.filter(user_id=user_id, tag_id=tag_id)
+                .using_db(conn)
+                .update(tag_id=target.id)
+            )
+            await bump_tag_usage(
+                user_id, [target.id], len(diary_ids) - len(duplicated), using_db=conn
+            )
+            await (
+                UserTagUsage.filter(user_id=user_id, tag_id=tag_id)
+                .using_db(conn)
+                .delete()
+            )
+            await touch_diaries(user_id, diary_ids, using_db=conn)
+
+    return await get_user_tag_detail_service(user_id, target.id)
+
+
+async def delete_user_tag_service(user_id: int, tag_id: int) -> None:
+    """사용자의 모든 일기에서 태그를 뗍니다. (다른 사용자의 태그는 그대로)"""
+    async with in_transaction() as conn:
+        await _get_usage_or_404(user_id, tag_id, using_db=conn)
+        diary_tags = DiaryTag.filter(user_id=user_id, tag_id=tag_id).using_db(conn)
+        diary_ids = await diary_tags.values_list("diary_id", flat=True)
+        await diary_tags.delete()
+        await touch_diaries(user_id, diary_ids, using_db=conn)
+        await (
+            UserTagUsage.filter(user_id=user_id, tag_id=tag_id).using_db(conn).delete()
+        )
@@ -1,9 +1,15 @@
+import logging
+
 import pytest
 from fastapi.testclient import TestClient
 from tortoise import Tortoise
 
 from app.core.config import TORTOISE_ORM
 from app.main import app
+from app.services.emotion_service import emotion_classifier
+from app.services.fulltext_service import ensure_fulltext_index
+from app.services.summary_service import summary_memory_cache
+from app.utils.security import user_cache
 
 
 # 각 테스트마다 새로운 DB 초기화
@@ -21,6 +27,11 @@ async def initialize_db():
 
     await Tortoise.init(config=test_db_config)
     await Tortoise.generate_schemas()
+    await ensure_fulltext_index()
+    # 테스트마다 DB가 새로 만들어지므로 사용자 캐시도 비웁니다.
+    user_cache.clear()
+    summary_memory_cache.clear()
+    await emotion_classifier.load()
 
     yield
 
@@ -32,3 +43,36 @@ async def initialize_db():
 def client():
     with TestClient(app) as c:
         yield c
+
+
+class QueryCounter(logging.Handler):
+    """tortoise.db_client 로그를 이용해 실행된 SQL 쿼리 수를 셉니다."""
+
+    def __init__(self):
+        super().__init__(level=logging.DEBUG)
+        self.queries = []
+
+    def emit(self, record):
+        query = str(record.args[0] if record.args else record.msg).lstrip()
+        if query.split(" ", 1)[0].upper() in ("SELECT", "INSERT", "UPDATE", "DELETE"):
+            self.queries.append(query)
+
+    @property
+    def count(self):
+        return len(self.queries)
+
+    def reset(self):
+        self.queries.clear()
+
+
+# 쿼리 수 검증용 픽스처
+@pytest.fixture
+def query_counter():
+    logger = logging.getLogger("tortoise.db_client")
+    counter = QueryCounter()
+    previous_level = logger.level
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(counter)
+    yield counter
+    logger.removeHandler(counter)
+    logger.setLevel(previous_level)
@@ -1,7 +1,21 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta
+
 import pytest
 from fastapi.testclient import TestClient
 
 from app.main import app
+from app.models.token_blacklist import TokenBlacklist
+from app.services.auth_service import purge_expired_tokens_service
+from app.utils.password_pool import PasswordHashPool
+from app.utils.security import (
+    hash_password_async,
+    password_pool,
+    verify_password_async,
+)
+from app.utils.token_cache import RevokedTokenCache
 
 
 # 1. 의존성 오버라이드
@@ -15,7 +29,9 @@ def dummy_get_current_user():
 
 
 # 2. 테스트 클라이언트 픽스처
-@pytest.fixture(scope="session")
+# (module 범위: 앱의 백그라운드 작업이 다른 모듈의 테스트 DB에 접근하지 않도록
+#  이 모듈이 끝나면 클라이언트를 닫습니다.)
+@pytest.fixture(scope="module")
 def client():
     with TestClient(app) as c:
         yield c
@@ -82,3 +98,111 @@ def test_full_auth_lifecycle(client):
     # ----------------------------------------------------
     response = client.get("/api/v1/profile", headers=headers)
     assert response.status_code == 401
+
+
+def test_logout_revokes_token(client):
+    test_user = {
+        "email": "logout_user@example.com",
+        "password": "testpassword123",
+        "nickname": "LogoutUser",
+        "name": "Logout User",
+    }
+    client.post("/api/v1/register", json=test_user)
+    response = client.post(
+        "/api/v1/login",
+        json={"email": test_user["email"], "password": test_user["password"]},
+    )
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    response = client.post("/api/v1/logout", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["message"] == "로그아웃 성공"
+
+    # 로그아웃한 토큰은 캐시에서 바로 거부되어야 합니다.
+    response = client.get("/api/v1/profile", headers=headers)
+    assert response.status_code == 401
+
+
+async def test_purge_expired_tokens():
+    now = datetime.now()
+    for i in range(5):
+        await TokenBlacklist.create(jti=f"expired-{i}", exp=now - timedelta(minutes=1))
+    await TokenBlacklist.create(jti="alive", exp=now + timedelta(minutes=30))
+
+    result = await purge_expired_tokens_service(batch_size=2)
+
+    assert result["deleted"] == 5
+    assert result["batches"] == 3
+    assert await TokenBlacklist.filter(jti="alive").exists()
+    assert await TokenBlacklist.all().count() == 1
+
+
+@pytest.mark.parametrize("backend", ["memory", "bloom"])
+async def test_revoked_token_sync_picks_up_rows_committed_out_of_id_order(backend):
+    exp = datetime.now() + timedelta(minutes=30)
+    cache = RevokedTokenCache(backend=backend, sync_overlap=10, full_sync_every=100)
+    await cache.load()
+
+    # 다른 워커의 로그아웃이 id 순서와 다르게 커밋된 경우
+    await TokenBlacklist.create(id=2, jti="later", exp=exp)
+    await cache.sync()
+    await TokenBlacklist.create(id=1, jti="earlier", exp=exp)
+    await cache.sync()
+    assert await cache.is_revoked("later")
+    assert await cache.is_revoked("earlier")
+
+    # 겹쳐 읽는 범위를 벗어난 행은 full_sync_every 번째 동기화에서 전체를 다시 읽습니다.
+    cache = RevokedTokenCache(backend=backend, sync_overlap=0, full_sync_every=3)
+    await cache.load()
+    await TokenBlacklist.create(id=20, jti="far-later", exp=exp)
+    await cache.sync()
+    await TokenBlacklist.create(id=10, jti="far-earlier", exp=exp)
+    await cache.sync()
+    assert not await cache.is_revoked("far-earlier")
+    await cache.sync()
+    assert await cache.is_revoked("far-earlier")
+    assert await cache.is_revoked("far-later")
+
+
+async def test_password_pool_limits_concurrent_hashing():
+    pool = PasswordHashPool(max_workers=2)
+    lock = threading.Lock()
+    active = peak = 0
+
+    def slow_hash(value: str) -> str:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        return value.upper()
+
+    try:
+        results = await asyncio.gather(
+            *(pool.run(slow_hash, f"pw{i}") for i in range(6))
+        )
+    finally:
+        pool.shutdown()
+
+    assert results == [f"PW{i}" for i in range(6)]
+    assert peak == 2
+    stats = pool.stats()
+    assert (stats["submitted"], stats["completed"], stats["failed"]) == (6, 6, 0)
+    assert stats["max_waiting"] > 0
+    assert (stats["running"], stats["waiting"]) == (0, 0)
+
+
+async def test_password_hash_and_verify_run_in_pool():
+    before = password_pool.stats()
+
+    hashed = await hash_password_async("correct-password")
+    assert hashed != "correct-password"
+    assert await verify_password_async("correct-password", hashed)
+    assert not await verify_password_async("wrong-password", hashed)
+
+    after = password_pool.stats()
+    assert after["submitted"] - before["submitted"] == 3
+    assert after["completed"] - before["completed"] == 3
+    assert after["failed"] == before["failed"]
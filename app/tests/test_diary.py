@@ -1,4 +1,8 @@
+import json
+
 from app.models.diary import EmotionalState
+from app.services import ai_service
+from app.services.ai_service import AIClient, FakeGeminiService
 
 
 def test_full_diary_lifecycle(client):
@@ -45,7 +49,7 @@ def test_full_diary_lifecycle(client):
     # ----------------------------------------------------
     response = client.get("/api/v1/diary/inquiry", headers=headers)
     assert response.status_code == 200
-    diaries = response.json()
+    diaries = response.json()["items"]
     assert len(diaries) > 0
 
     # ----------------------------------------------------
@@ -82,3 +86,216 @@ def test_full_diary_lifecycle(client):
     # 삭제 후 다시 조회하여 존재하지 않는지 확인합니다.
     response = client.get(f"/api/v1/diary/{diary_id}", headers=headers)
     assert response.status_code == 404  # Not Found
+
+
+def test_diary_inquiry_cursor_pagination(client):
+    test_user = {
+        "email": "diary_page_user@example.com",
+        "password": "testpassword123",
+        "nickname": "PageUser",
+        "name": "Page User",
+    }
+    client.post("/api/v1/register", json=test_user)
+    response = client.post(
+        "/api/v1/login",
+        json={"email": test_user["email"], "password": test_user["password"]},
+    )
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    created_ids = []
+    for i in range(5):
+        response = client.post(
+            "/api/v1/diary/create",
+            json={
+                "title": f"페이지 {i}",
+                "content": "페이지네이션 테스트",
+                "emotional_state": EmotionalState.NEUTRAL.value,
+            },
+            headers=headers,
+        )
+        created_ids.append(response.json()["id"])
+
+    # limit=2로 끝까지 넘기면 모든 일기를 최신순으로 한 번씩 받아야 합니다.
+    seen_ids = []
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/api/v1/diary/inquiry", params=params, headers=headers)
+        assert response.status_code == 200
+        page = response.json()
+        assert len(page["items"]) <= 2
+        seen_ids.extend(item["id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen_ids == list(reversed(created_ids))
+
+    response = client.get(
+        "/api/v1/diary/inquiry", params={"cursor": "invalid"}, headers=headers
+    )
+    assert response.status_code == 400
+
+
+def test_diary_summary_stream(client, monkeypatch):
+    # 외부 API 대신 가짜 모델을 사용합니다.
+    monkeypatch.setattr(ai_service, "_ai_service", AIClient(FakeGeminiService()))
+    test_user = {
+        "email": "diary_stream_user@example.com",
+        "password": "testpassword123",
+        "nickname": "StreamUser",
+        "name": "Stream User",
+    }
+    client.post("/api/v1/register", json=test_user)
+    response = client.post(
+        "/api/v1/login",
+        json={"email": test_user["email"], "password": test_user["password"]},
+    )
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    response = client.post(
+        "/api/v1/diary/create",
+        json={
+            "title": "스트리밍",
+            "content": "오늘은 비가 와서 집에서 책을 읽었다",
+            "emotional_state": EmotionalState.NEUTRAL.value,
+        },
+        headers=headers,
+    )
+    diary_id = response.json()["id"]
+
+    with client.stream(
+        "POST", f"/api/v1/diary/{diary_id}/summarize/stream", headers=headers
+    ) as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [
+            (block.split("\n")[0], json.loads(block.split("\n")[1][len("data: ") :]))
+            for block in response.read().decode().strip().split("\n\n")
+        ]
+
+    tokens = [data["text"] for event, data in events if event == "event: token"]
+    assert len(tokens) > 1
+    assert events[-1] == (
+        "event: done",
+        {"diary_id": diary_id, "ai_summary": "".join(tokens)},
+    )
+
+    # 완료된 요약은 일기에 저장됩니다.
+    response = client.get(f"/api/v1/diary/{diary_id}", headers=headers)
+    assert response.json()["ai_summary"] == "요약: 오늘은 비가 와서 집에서 책을 읽었다"
+
+
+def test_diary_import_then_export(client):
+    test_user = {
+        "email": "diary_import_user@example.com",
+        "password": "testpassword123",
+        "nickname": "ImportUser",
+        "name": "Import User",
+    }
+    client.post("/api/v1/register", json=test_user)
+    response = client.post(
+        "/api/v1/login",
+        json={"email": test_user["email"], "password": test_user["password"]},
+    )
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    rows = [
+        {
+            "title": f"옮겨온 일기 {i}",
+            "content": "다른 앱에서 쓴 일기",
+            "emotional_state": EmotionalState.NEUTRAL.value,
+            "tags": ["이전"],
+            "created_at": f"2020-01-0{i + 1}T12:00:00",
+        }
+        for i in range(3)
+    ]
+    body = "\n".join(json.dumps(row, ensure_ascii=False) for row in rows)
+    response = client.post(
+        "/api/v1/diary/import",
+        content=(body + "\n{}\n").encode(),
+        headers={**headers, "Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 200
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert events[-1]["event"] == "done"
+    assert events[-1]["imported"] == 3
+    assert [error["line"] for error in events[-1]["errors"]] == [4]
+
+    # 내보내기는 오래된 순으로 모든 일기를 돌려줍니다.
+    response = client.get(
+        "/api/v1/diary/export", params={"format": "ndjson"}, headers=headers
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    exported = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["title"] for row in exported] == [row["title"] for row in rows]
+    assert exported[0]["tags"] == ["이전"]
+
+
+def test_diary_conditional_get(client):
+    test_user = {
+        "email": "diary_etag_user@example.com",
+        "password": "testpassword123",
+        "nickname": "EtagUser",
+        "name": "Etag User",
+    }
+    client.post("/api/v1/register", json=test_user)
+    response = client.post(
+        "/api/v1/login",
+        json={"email": test_user["email"], "password": test_user["password"]},
+    )
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    response = client.post(
+        "/api/v1/diary/create",
+        json={
+            "title": "ETag 일기",
+            "content": "조건부 요청 테스트",
+            "emotional_state": EmotionalState.NEUTRAL.value,
+            "tags": ["조건부"],
+        },
+        headers=headers,
+    )
+    diary_id = response.json()["id"]
+
+    # 단건/목록 모두 ETag를 주고, 같은 ETag로 다시 요청하면 본문 없이 304
+    urls = [f"/api/v1/diary/{diary_id}", "/api/v1/diary/inquiry"]
+    etags = {}
+    for url in urls:
+        response = client.get(url, headers=headers)
+        assert response.status_code == 200
+        etags[url] = response.headers["etag"]
+        response = client.get(
+            url, headers={**headers, "If-None-Match": f'"x", W/{etags[url]}'}
+        )
+        assert response.status_code == 304
+        assert response.headers["etag"] == etags[url]
+        assert response.content == b""
+
+    # 목록 ETag는 limit/cursor마다 다릅니다.
+    response = client.get(
+        "/api/v1/diary/inquiry",
+        params={"limit": 1},
+        headers={**headers, "If-None-Match": etags["/api/v1/diary/inquiry"]},
+    )
+    assert response.status_code == 200
+
+    # 수정과 태그 이름 변경 뒤에는 이전 ETag로 요청해도 새 본문을 받습니다.
+    tags = client.get("/api/v1/tags/", headers=headers).json()["data"]["tags"]
+    tag_id = tags[0]["tag_id"]
+    for change in (
+        lambda: client.put(
+            f"/api/v1/diary/{diary_id}", json={"title": "바뀐 제목"}, headers=headers
+        ),
+        lambda: client.patch(
+            f"/api/v1/tags/{tag_id}", json={"name": "바뀐 태그"}, headers=headers
+        ),
+    ):
+        assert change().status_code == 200
+        for url in urls:
+            response = client.get(url, headers={**headers, "If-None-Match": etags[url]})
+            assert response.status_code == 200
+            assert response.headers["etag"] != etags[url]
+            etags[url] = response.headers["etag"]
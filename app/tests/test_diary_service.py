@@ -0,0 +1,789 @@
+import asyncio
+import csv
+import io
+import json
+
+import pytest
+from tortoise import Tortoise
+
+from app.models import User
+from app.models.diary import Diary, EmotionalState
+from app.models.emotion_keyword import EmotionKeyword
+from app.models.summary_cache import SummaryCache
+from app.models.tag import Tag
+from app.models.user_stats import (
+    UserCalendar,
+    UserDiaryVersion,
+    UserEmotionDaily,
+    UserTagUsage,
+)
+from app.schemas.diary import (
+    DiaryBulkDelete,
+    DiaryBulkUpdate,
+    DiaryCreate,
+    DiarySearchParams,
+    DiaryUpdate,
+)
+from app.schemas.emotion_keyword import EmotionKeywordCreate
+from app.services.ai_service import AIClient, AIServiceUnavailable, FakeGeminiService
+from app.services.auth_service import delete_user_service
+from app.services.bulk_service import (
+    bulk_delete_diaries_service,
+    bulk_update_diaries_service,
+)
+from app.services.diary_service import (
+    create_diary_service,
+    delete_diary_service,
+    diaries_to_dicts,
+    get_all_diaries_service,
+    get_diary_by_id_service,
+    update_diary_service,
+)
+from app.services.emotion_service import (
+    create_emotion_keyword_service,
+    diary_emotion_scores,
+    emotion_classifier,
+)
+from app.services.export_service import export_csv, iter_diary_chunks
+from app.services.import_service import import_diaries
+from app.services.search_service import (
+    combined_search_diary,
+    search_diary,
+    search_diary_fulltext,
+)
+from app.services.stats_service import (
+    ensure_user_stats,
+    get_calendar_service,
+    get_emotion_stats_service,
+    get_tag_usage_service,
+    rebuild_user_stats,
+)
+from app.services.summary_service import (
+    backfill_summaries,
+    get_or_create_summary,
+    pack_batches,
+    summarize_diary_job,
+    summary_memory_cache,
+)
+from app.services.tag_service import (
+    delete_user_tag_service,
+    get_user_tag_detail_service,
+    get_user_tags_service,
+    rename_user_tag_service,
+)
+from app.utils.aho_corasick import AhoCorasick
+from app.utils.job_queue import JobQueue
+from app.utils.responses import FastJSONResponse
+from app.utils.security import AuthenticatedUser
+
+
+async def create_user(email: str) -> AuthenticatedUser:
+    user = await User.create(email=email, password="x", nickname="n", name="n")
+    return AuthenticatedUser(id=user.id, is_active=True, is_staff=False, is_admin=False)
+
+
+async def create_diaries(user: AuthenticatedUser, count: int):
+    diaries = []
+    for i in range(count):
+        diary = await create_diary_service(
+            user,
+            DiaryCreate(
+                title=f"일기 {i}",
+                content="내용",
+                emotional_state=EmotionalState.HAPPY,
+                tags=[f"태그{i}", "공통"],
+            ),
+        )
+        diaries.append(diary)
+    return diaries
+
+
+async def test_diary_list_tag_loading_uses_constant_queries(query_counter):
+    few_user = await create_user("few@example.com")
+    many_user = await create_user("many@example.com")
+    await create_diaries(few_user, 2)
+    await create_diaries(many_user, 10)
+
+    query_counter.reset()
+    few = await get_all_diaries_service(few_user.id, limit=50)
+    few_queries = query_counter.count
+
+    query_counter.reset()
+    many = await get_all_diaries_service(many_user.id, limit=50)
+    many_queries = query_counter.count
+
+    assert len(few.items) == 2
+    assert len(many.items) == 10
+    # 일기 목록 1번 + 태그 조인 1번
+    assert few_queries == many_queries == 2
+    assert all(
+        sorted(d.tags) == sorted([d.title.replace("일기 ", "태그"), "공통"])
+        for d in many.items
+    )
+
+
+async def test_diary_detail_includes_tags():
+    user = await create_user("detail@example.com")
+    [diary] = await create_diaries(user, 1)
+
+    result = await get_diary_by_id_service(diary.id, user.id)
+
+    assert sorted(result.tags) == ["공통", "태그0"]
+
+
+async def test_create_diary_tag_queries_do_not_grow_with_tag_count(query_counter):
+    user = await create_user("tags@example.com")
+
+    async def count_create_queries(tags):
+        query_counter.reset()
+        await create_diary_service(
+            user,
+            DiaryCreate(
+                title="태그 많은 일기",
+                content="내용",
+                emotional_state=EmotionalState.HAPPY,
+                tags=tags,
+            ),
+        )
+        return query_counter.count
+
+    one_tag = await count_create_queries(["하나"])
+    twenty_tags = await count_create_queries([f"새태그{i}" for i in range(20)])
+    # 이미 있는 태그와 새 태그, 중복/공백이 섞여도 쿼리 수는 같아야 합니다.
+    mixed_tags = await count_create_queries(
+        ["하나", " 새태그1 ", "새태그1", "", "또다른태그"]
+    )
+
+    assert one_tag == twenty_tags == mixed_tags
+    assert await Tag.filter(name="새태그1").count() == 1
+
+
+async def test_update_diary_applies_only_tag_differences(query_counter):
+    user = await create_user("update@example.com")
+    [diary] = await create_diaries(user, 1)
+
+    # 같은 태그로 수정하면 diary_tags와 diary에 쓰기가 없어야 합니다.
+    query_counter.reset()
+    result = await update_diary_service(
+        diary.id, DiaryUpdate(tags=["공통", "태그0"]), user.id
+    )
+    writes = [q for q in query_counter.queries if not q.upper().startswith("SELECT")]
+    assert writes == []
+    assert sorted(result.tags) == ["공통", "태그0"]
+
+    # 하나만 바꾸면 삭제 1건, 추가 1건만 실행됩니다.
+    query_counter.reset()
+    result = await update_diary_service(
+        diary.id, DiaryUpdate(tags=["공통", "새태그"]), user.id
+    )
+    tag_writes = [
+        q
+        for q in query_counter.queries
+        if "diary_tags" in q and not q.upper().startswith("SELECT")
+    ]
+    assert len(tag_writes) == 2
+    assert sorted(result.tags) == ["공통", "새태그"]
+
+    # tags를 보내지 않으면 기존 태그가 유지됩니다.
+    result = await update_diary_service(diary.id, DiaryUpdate(title="제목만"), user.id)
+    assert result.title == "제목만"
+    assert sorted(result.tags) == ["공통", "새태그"]
+
+
+async def test_fulltext_search_ranks_and_tracks_writes():
+    user = await create_user("fulltext@example.com")
+    other = await create_user("fulltext-other@example.com")
+
+    async def write(owner, title, content):
+        return await create_diary_service(
+            owner,
+            DiaryCreate(
+                title=title, content=content, emotional_state=EmotionalState.HAPPY
+            ),
+        )
+
+    best = await write(user, "바다 여행", "오늘은 바다 에 갔다. 바다 가 아름다웠다.")
+    weaker = await write(user, "일상", "점심을 먹고 바다 사진을 봤다.")
+    await write(user, "공부", "수학 문제를 풀었다.")
+    await write(other, "바다", "다른 사람의 바다 일기")
+
+    results = await search_diary_fulltext(user.id, "바다")
+    assert [r.id for r in results] == [best.id, weaker.id]
+    assert results[0].rank > results[1].rank
+    assert "<mark>바다</mark>" in results[0].snippet
+
+    # 본문의 HTML은 이스케이프되고 일치 부분만 <mark>로 감쌉니다.
+    html_diary = await write(user, "메모", "<script>alert(1)</script> 파도 소리")
+    [hit] = await search_diary_fulltext(user.id, "파도")
+    assert hit.id == html_diary.id
+    assert "&lt;script&gt;" in hit.snippet and "<script>" not in hit.snippet
+    assert "<mark>파도</mark>" in hit.snippet
+    await delete_diary_service(html_diary.id, user.id)
+
+    # 수정하면 새 내용으로, 삭제하면 결과에서 빠져야 합니다.
+    await update_diary_service(weaker.id, DiaryUpdate(content="산에 올랐다."), user.id)
+    await delete_diary_service(best.id, user.id)
+    assert await search_diary_fulltext(user.id, "바다") == []
+    assert [r.id for r in await search_diary_fulltext(user.id, "산에")] == [weaker.id]
+
+
+async def test_ngram_search_matches_korean_substrings():
+    user = await create_user("ngram@example.com")
+
+    async def write(title, content):
+        return await create_diary_service(
+            user,
+            DiaryCreate(
+                title=title, content=content, emotional_state=EmotionalState.HAPPY
+            ),
+        )
+
+    happy = await write("행복한 하루", "친구들과 맛있는 저녁을 먹어서 행복했다")
+    # n-gram은 모두 있지만 이어지지 않는 경우는 결과에서 빠져야 합니다.
+    scattered = await write("저녁", "복했다 그리고 행복")
+
+    results = await search_diary(user.id, "text", query="행복했")
+    assert [d.id for d in results] == [happy.id]
+
+    results = await search_diary(user.id, "title", query="행복")
+    assert [d.id for d in results] == [happy.id]
+
+    # 한 글자 검색어는 색인 없이 기존 방식으로 검색합니다.
+    results = await search_diary(user.id, "title", query="녁")
+    assert [d.id for d in results] == [scattered.id]
+
+    await update_diary_service(happy.id, DiaryUpdate(content="조용한 밤"), user.id)
+    assert await search_diary(user.id, "text", query="행복했") == []
+
+
+async def test_combined_search_runs_one_query(query_counter):
+    user = await create_user("combined@example.com")
+
+    async def write(title, tags):
+        return await create_diary_service(
+            user,
+            DiaryCreate(
+                title=title,
+                content="내용",
+                emotional_state=EmotionalState.HAPPY,
+                tags=tags,
+            ),
+        )
+
+    match = await write("제주도 여행 첫째 날", ["여행", "제주"])
+    await write("제주도 여행 둘째 날", ["여행"])
+    await write("서울 여행", ["여행", "제주"])
+
+    today = match.created_at.date()
+    params = DiarySearchParams(
+        title="제주도", tags=["여행", "제주"], start_date=today, end_date=today
+    )
+
+    query_counter.reset()
+    diaries, next_cursor = await combined_search_diary(user.id, params)
+
+    assert query_counter.count == 1
+    assert [d.id for d in diaries] == [match.id]
+    assert next_cursor is None
+
+
+async def test_summary_cache_skips_model_for_same_content():
+    fake = FakeGeminiService()
+
+    first = await get_or_create_summary("오늘은 바다를 보러 갔다.", fake)
+    second = await get_or_create_summary("오늘은 바다를 보러 갔다.", fake)
+    assert first == second
+    assert fake.calls == 1
+
+    # 메모리 계층이 비어도 summary_cache 테이블에서 찾습니다. (재시작 후)
+    summary_memory_cache.clear()
+    assert await get_or_create_summary("오늘은 바다를 보러 갔다.", fake) == first
+    assert fake.calls == 1
+    assert await SummaryCache.all().count() == 1
+
+    # 본문이 바뀌면 새로 요약합니다.
+    await get_or_create_summary("오늘은 산에 올랐다.", fake)
+    assert fake.calls == 2
+
+
+async def test_summary_job_retries_and_deduplicates():
+    user = await create_user("summary-job@example.com")
+    [diary] = await create_diaries(user, 1)
+    fake = FakeGeminiService(failures=1)
+    queue = JobQueue(workers=2, max_retries=2, retry_backoff=0.01)
+    await queue.start()
+
+    job = queue.submit(
+        ("summarize", diary.id), summarize_diary_job, diary.id, fake, owner_id=user.id
+    )
+    # 같은 일기의 작업이 진행 중이면 기존 작업을 돌려줍니다.
+    duplicate = queue.submit(
+        ("summarize", diary.id), summarize_diary_job, diary.id, fake, owner_id=user.id
+    )
+    assert duplicate is job
+
+    await asyncio.wait_for(job.done.wait(), timeout=2)
+    await queue.stop()
+
+    # 첫 호출은 실패하고 재시도에서 성공합니다.
+    assert job.status == "succeeded"
+    assert job.attempts == 2
+    assert fake.calls == 2
+    assert (await Diary.get(id=diary.id)).ai_summary == job.result
+    assert queue.stats()["retries"] == 1
+    assert queue.stats()["deduplicated"] == 1
+
+
+async def test_summary_job_for_deleted_diary_fails_without_retry():
+    user = await create_user("summary-deleted@example.com")
+    [diary] = await create_diaries(user, 1)
+    await delete_diary_service(diary.id, user.id)
+    fake = FakeGeminiService()
+    queue = JobQueue(workers=1, max_retries=3, retry_backoff=0.01)
+    await queue.start()
+
+    job = queue.submit(("summarize", diary.id), summarize_diary_job, diary.id, fake)
+    await asyncio.wait_for(job.done.wait(), timeout=2)
+    await queue.stop()
+
+    assert job.status == "failed"
+    assert job.attempts == 1
+    assert fake.calls == 0
+    assert queue.stats()["retries"] == 0
+
+
+def test_pack_batches_respects_size_and_token_budget():
+    contents = {1: "가" * 10, 2: "나" * 10, 3: "다" * 10, 4: "라" * 400}
+    assert [list(b) for b in pack_batches(contents, 2, 100)] == [[1, 2], [3], [4]]
+    assert [list(b) for b in pack_batches(contents, 10, 20)] == [[1, 2, 3], [4]]
+    # 작성자가 바뀌면 새 묶음을 시작합니다.
+    owners = {1: 7, 2: 8, 3: 8, 4: 8}
+    assert [list(b) for b in pack_batches(contents, 10, 1000, owners)] == [
+        [1],
+        [2, 3, 4],
+    ]
+
+
+async def test_backfill_summaries_batches_and_falls_back():
+    user = await create_user("backfill@example.com")
+    diaries = await create_diaries(user, 5)
+    for i, diary in enumerate(diaries):
+        diary.content = f"{i}번째 일기 내용"
+        await diary.save(update_fields=["content"])
+    # 첫 번째 일괄 응답은 해석할 수 없어 개별 요약으로 대체됩니다.
+    fake = FakeGeminiService(broken_batches=1)
+
+    result = await backfill_summaries(fake, batch_size=2)
+
+    assert result["diaries"] == result["summarized"] == 5
+    assert result["failed"] == 0
+    assert fake.batch_calls == 3
+    assert fake.calls == 2
+    for diary in diaries:
+        saved = await Diary.get(id=diary.id)
+        assert saved.ai_summary == f"요약: {diary.content}"
+
+    # 다시 실행하면 남은 일기가 없으므로 모델을 호출하지 않습니다.
+    assert (await backfill_summaries(fake))["diaries"] == 0
+    assert fake.batch_calls == 3
+
+
+async def test_backfill_summaries_never_mixes_users_in_a_batch():
+    users = [await create_user(f"backfill{i}@example.com") for i in range(2)]
+    owners = {}
+    # 두 사용자의 일기를 번갈아 만들어 id 순으로는 섞이도록 합니다.
+    for i in range(3):
+        for user in users:
+            [diary] = await create_diaries(user, 1)
+            diary.content = f"{user.id}번 사용자의 {i}번째 일기"
+            await diary.save(update_fields=["content"])
+            owners[diary.id] = user.id
+
+    batches = []
+    fake = FakeGeminiService()
+    summarize_diaries = fake.summarize_diaries
+
+    async def record_batch(contents):
+        batches.append(set(contents))
+        return await summarize_diaries(contents)
+
+    fake.summarize_diaries = record_batch
+    result = await backfill_summaries(fake, batch_size=10)
+
+    assert result["summarized"] == 6
+    assert len(batches) == 2
+    for batch in batches:
+        assert len({owners[diary_id] for diary_id in batch}) == 1
+
+
+async def test_ai_client_limits_concurrency():
+    client = AIClient(FakeGeminiService(latency=0.02), max_concurrency=2)
+
+    summaries = await asyncio.gather(
+        *(client.summarize_diary(f"{i}번째 일기") for i in range(6))
+    )
+
+    assert len(summaries) == 6
+    assert client.max_in_flight == 2
+    assert client.stats()["calls"] == 6
+
+
+async def test_ai_client_circuit_breaker_fails_fast():
+    fake = FakeGeminiService(latency=0.2)
+    client = AIClient(fake, timeout=0.01, failure_threshold=2, reset_timeout=0.05)
+
+    # 시간 초과가 연속 2번 나면 회로가 열립니다.
+    for _ in range(2):
+        with pytest.raises(AIServiceUnavailable):
+            await client.summarize_diary("일기")
+    assert client.stats()["circuit"]["state"] == "open"
+
+    # 열린 동안에는 모델을 호출하지 않고 바로 실패합니다.
+    with pytest.raises(AIServiceUnavailable):
+        await client.summarize_diary("일기")
+    assert fake.calls == 2
+
+    # reset_timeout이 지나면 시험 호출이 성공해 회로가 닫힙니다.
+    await asyncio.sleep(0.06)
+    fake.latency = 0
+    assert await client.summarize_diary("일기") == "요약: 일기"
+    assert client.stats()["circuit"]["state"] == "closed"
+    assert client.stats()["timeouts"] == 2
+
+
+async def test_ai_client_cancelled_trial_frees_half_open_slot():
+    fake = FakeGeminiService(latency=0.2)
+    client = AIClient(fake, timeout=0.01, failure_threshold=1, reset_timeout=0.02)
+    with pytest.raises(AIServiceUnavailable):
+        await client.summarize_diary("일기")
+    await asyncio.sleep(0.03)
+
+    # half_open 시험 호출이 취소되어도 다음 호출이 다시 시험할 수 있어야 합니다.
+    client.timeout = 1
+    trial = asyncio.create_task(client.summarize_diary("일기"))
+    await asyncio.sleep(0.01)
+    trial.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await trial
+
+    # 스트리밍 도중 연결이 끊긴 경우도 마찬가지입니다.
+    fake.latency = 0.01
+    stream = client.stream_summary("오늘 일기 내용")
+    await anext(stream)
+    await stream.aclose()
+
+    fake.latency = 0
+    assert await client.summarize_diary("일기") == "요약: 일기"
+    assert client.stats()["circuit"]["state"] == "closed"
+    assert client.stats()["circuit"]["rejected"] == 0
+
+
+def test_aho_corasick_finds_overlapping_keywords():
+    automaton = AhoCorasick()
+    for keyword in ("행복", "행복해", "복해", "슬퍼"):
+        automaton.add(keyword, keyword)
+
+    assert [v for _, v in automaton.iter("너무 행복해요")] == ["행복", "행복해", "복해"]
+
+    # 삭제/추가는 기존 키워드를 다시 넣지 않고 반영됩니다.
+    automaton.remove("행복해")
+    automaton.add("해요", "해요")
+    assert [v for _, v in automaton.iter("너무 행복해요")] == ["행복", "복해", "해요"]
+    assert [v for _, v in automaton.iter("슬퍼서 행")] == ["슬퍼"]
+
+
+async def test_diary_emotion_scores_follow_keywords():
+    for keyword, emotion_type in (("행복", "positive"), ("즐거", "positive")):
+        await create_emotion_keyword_service(
+            EmotionKeywordCreate(emotion_keyword=keyword, emotion_type=emotion_type)
+        )
+    user = await create_user("emotion@example.com")
+    diary = await create_diary_service(
+        user,
+        DiaryCreate(
+            title="하루",
+            content="행복하고 즐거웠지만 조금 우울했다",
+            emotional_state=EmotionalState.HAPPY,
+        ),
+    )
+    assert diary.emotion_scores == {"positive": 1.0, "negative": 0.0, "neutral": 0.0}
+
+    # 키워드가 추가되면 이후 작성/수정되는 일기에 바로 반영됩니다.
+    await create_emotion_keyword_service(
+        EmotionKeywordCreate(emotion_keyword="우울", emotion_type="negative")
+    )
+    updated = await update_diary_service(
+        diary.id, DiaryUpdate(content="행복했지만 우울했다"), user.id
+    )
+    assert updated.emotion_scores == {"positive": 0.5, "negative": 0.5, "neutral": 0.0}
+
+    # 다른 워커가 바꾼 사전은 sync()로 반영됩니다. (바뀐 게 없으면 다시 만들지 않음)
+    await EmotionKeyword.filter(emotion_keyword="즐거").delete()
+    await EmotionKeyword.create(emotion_keyword="지루", emotion_type="neutral")
+    reloads = emotion_classifier.reloads
+    await emotion_classifier.sync()
+    await emotion_classifier.sync()
+    assert emotion_classifier.reloads == reloads + 1
+    assert diary_emotion_scores("", "즐거웠고 지루했다") == {
+        "positive": 0.0,
+        "negative": 0.0,
+        "neutral": 1.0,
+    }
+
+
+async def test_user_stats_follow_diary_writes_and_match_rebuild():
+    user = await create_user("stats@example.com")
+    diaries = await create_diaries(user, 3)
+    await update_diary_service(
+        diaries[0].id,
+        DiaryUpdate(emotional_state=EmotionalState.SAD, tags=["공통", "새태그"]),
+        user.id,
+    )
+    await delete_diary_service(diaries[1].id, user.id)
+
+    async def snapshot():
+        emotions = await get_emotion_stats_service(user.id)
+        tags = await get_tag_usage_service(user.id)
+        calendar = await get_calendar_service(user.id, diaries[2].created_at.year)
+        return (
+            emotions.totals,
+            {tag.name: tag.usage_count for tag in tags},
+            [(day.count, day.emotional_state) for day in calendar.days],
+        )
+
+    live = await snapshot()
+    # 같은 날 happy 1개, sad 1개 -> 동률이면 Enum 순서가 앞선 happy
+    assert live == (
+        {"happy": 1, "sad": 1},
+        {"공통": 2, "태그2": 1, "새태그": 1},
+        [(2, "happy")],
+    )
+
+    # 원본에서 다시 계산한 값과 같아야 합니다.
+    await rebuild_user_stats()
+    assert await snapshot() == live
+
+
+async def test_ensure_user_stats_fills_empty_aggregates_once():
+    user = await create_user("ensure-stats@example.com")
+    await create_diaries(user, 2)
+    # 마이그레이션 직후처럼 집계 테이블만 비어 있는 상태
+    await UserEmotionDaily.all().delete()
+    await UserTagUsage.all().delete()
+    await UserCalendar.all().delete()
+
+    await ensure_user_stats()
+
+    assert (await get_emotion_stats_service(user.id)).totals == {"happy": 2}
+    assert {t.name: t.usage_count for t in await get_tag_usage_service(user.id)}[
+        "공통"
+    ] == 2
+
+
+async def test_user_tag_list_detail_rename_and_delete():
+    user = await create_user("tags@example.com")
+    other = await create_user("tags-other@example.com")
+    diaries = await create_diaries(user, 3)
+    await create_diaries(other, 1)
+
+    first = await get_user_tags_service(user.id, limit=2)
+    rest = await get_user_tags_service(user.id, limit=2, cursor=first["next_cursor"])
+    names = [tag.name for tag in first["tags"] + rest["tags"]]
+    assert names[0] == "공통"
+    assert sorted(names) == ["공통", "태그0", "태그1", "태그2"]
+    assert rest["next_cursor"] is None
+
+    common_id = first["tags"][0].tag_id
+    detail = await get_user_tag_detail_service(user.id, common_id)
+    assert detail.usage_count == 3
+    assert [d.diary_id for d in detail.recent_diaries] == [
+        d.id for d in reversed(diaries)
+    ]
+
+    # "공통"을 "태그0"으로 바꾸면 이미 태그0이 달린 일기는 하나로 합쳐집니다.
+    renamed = await rename_user_tag_service(user.id, common_id, "태그0")
+    assert renamed.name == "태그0"
+    assert renamed.usage_count == 3
+    assert sorted((await get_diary_by_id_service(diaries[0].id, user.id)).tags) == [
+        "태그0"
+    ]
+
+    # 다른 사용자의 태그는 그대로입니다.
+    other_tags = await get_user_tags_service(other.id)
+    assert "공통" in [tag.name for tag in other_tags["tags"]]
+
+    await delete_user_tag_service(user.id, renamed.tag_id)
+    remaining = await get_user_tags_service(user.id)
+    assert sorted(tag.name for tag in remaining["tags"]) == ["태그1", "태그2"]
+    assert (await get_diary_by_id_service(diaries[0].id, user.id)).tags == []
+
+
+async def test_export_streams_all_diaries_in_chunks(query_counter):
+    user = await create_user("export@example.com")
+    other = await create_user("export_other@example.com")
+    diaries = await create_diaries(user, 5)
+    await create_diaries(other, 2)
+
+    query_counter.reset()
+    chunks = [rows async for rows in iter_diary_chunks(user.id, chunk_size=2)]
+    # 청크마다 일기 조회 + 태그 조회
+    assert [len(rows) for rows in chunks] == [2, 2, 1]
+    assert query_counter.count == 6
+    rows = [row for rows in chunks for row in rows]
+    assert [row["id"] for row in rows] == [diary.id for diary in diaries]
+    assert rows[0]["tags"] == ["태그0", "공통"]
+    assert rows[0]["emotional_state"] == "happy"
+    json.dumps(rows)  # 그대로 직렬화할 수 있어야 합니다.
+
+    text = "".join([part async for part in export_csv(user.id)]).lstrip("\ufeff")
+    records = list(csv.DictReader(io.StringIO(text)))
+    assert len(records) == 5
+    assert records[4]["title"] == "일기 4"
+    assert records[4]["tags"] == "태그4|공통"
+
+    # 수식으로 시작하는 셀은 텍스트로 내보냅니다.
+    diaries[0].title = '=HYPERLINK("http://example.com")'
+    diaries[0].content = "-1+2"
+    await diaries[0].save(update_fields=["title", "content"])
+    text = "".join([part async for part in export_csv(user.id)]).lstrip("\ufeff")
+    record = next(csv.DictReader(io.StringIO(text)))
+    assert record["title"] == """'=HYPERLINK("http://example.com")"""
+    assert record["content"] == "'-1+2"
+
+
+async def test_import_diaries_in_chunks_with_row_errors():
+    user = await create_user("import@example.com")
+    existing = await create_diaries(user, 1)
+    await delete_diary_service(
+        existing[0].id, user.id
+    )  # 삭제된 id는 다시 쓰지 않습니다.
+
+    def line(title, **extra):
+        row = {"title": title, "content": f"{title} 본문", "emotional_state": "sad"}
+        return json.dumps({**row, **extra}, ensure_ascii=False).encode()
+
+    lines = [
+        line("가져온 일기 1", tags=["이사", "여행"]),
+        b"{not json",
+        b"",
+        line("가져온 일기 2", tags=["여행"], created_at="2021-03-04T09:00:00"),
+        line("x" * 101),
+        line("가져온 일기 3", emotional_state="happy"),
+    ]
+    events = [event async for event in import_diaries(user.id, lines, chunk_size=2)]
+
+    assert [event["event"] for event in events] == ["progress", "progress", "done"]
+    assert [error["line"] for error in events[0]["errors"]] == [2]
+    assert [error["line"] for error in events[1]["errors"]] == [5]
+    assert events[-1]["processed"] == 5
+    assert events[-1]["imported"] == 3
+    assert events[-1]["failed"] == 2
+
+    diaries = await Diary.filter(user_id=user.id).order_by("id")
+    assert [diary.title for diary in diaries] == [f"가져온 일기 {i}" for i in (1, 2, 3)]
+    assert diaries[0].id > existing[0].id
+    assert diaries[1].created_at.year == 2021
+    assert (await get_diary_by_id_service(diaries[0].id, user.id)).tags == [
+        "이사",
+        "여행",
+    ]
+    results = await search_diary_fulltext(user.id, "본문", 10, 0)
+    assert len(results) == 3
+
+    # 한꺼번에 반영한 집계가 원본에서 다시 계산한 값과 같아야 합니다.
+    async def snapshot():
+        emotions = await get_emotion_stats_service(user.id)
+        tags = await get_tag_usage_service(user.id)
+        calendar = await get_calendar_service(user.id, 2021)
+        return emotions.daily, tags, calendar.days
+
+    live = await snapshot()
+    assert {tag.name: tag.usage_count for tag in live[1]} == {"여행": 2, "이사": 1}
+    await rebuild_user_stats(user.id)
+    assert await snapshot() == live
+
+
+async def test_bulk_update_and_delete_keep_tags_and_stats_in_sync():
+    user = await create_user("bulk@example.com")
+    other = await create_user("bulk_other@example.com")
+    diaries = await create_diaries(user, 4)
+    others = await create_diaries(other, 1)
+
+    # 다른 사용자의 일기 id는 같은 쿼리의 user_id 조건으로 걸러집니다.
+    result = await bulk_update_diaries_service(
+        user.id,
+        DiaryBulkUpdate(
+            ids=[diaries[0].id, diaries[1].id, others[0].id],
+            emotional_state=EmotionalState.SAD,
+            add_tags=["정리"],
+            remove_tags=["공통"],
+        ),
+    )
+    assert (result.matched, result.affected) == (2, 2)
+    updated = await get_diary_by_id_service(diaries[0].id, user.id)
+    assert updated.emotional_state == EmotionalState.SAD
+    assert sorted(updated.tags) == ["정리", "태그0"]
+    assert (await Diary.get(id=others[0].id)).emotional_state == EmotionalState.HAPPY
+
+    # "공통" 태그가 남은 일기(2, 3)만 삭제
+    result = await bulk_delete_diaries_service(
+        user.id, DiaryBulkDelete(filter=DiarySearchParams(tags=["공통"]))
+    )
+    assert (result.matched, result.affected) == (2, 2)
+    remaining = await Diary.filter(user_id=user.id).order_by("id")
+    assert [diary.id for diary in remaining] == [diaries[0].id, diaries[1].id]
+    assert len(await search_diary_fulltext(user.id, "내용", 10, 0)) == 2
+    assert len(await search_diary_fulltext(other.id, "내용", 10, 0)) == 1
+
+    async def snapshot():
+        emotions = await get_emotion_stats_service(user.id)
+        tags = await get_tag_usage_service(user.id)
+        return emotions.totals, {tag.name: tag.usage_count for tag in tags}
+
+    live = await snapshot()
+    assert live == ({"sad": 2}, {"정리": 2, "태그0": 1, "태그1": 1})
+    await rebuild_user_stats(user.id)
+    assert await snapshot() == live
+
+    with pytest.raises(ValueError):
+        DiaryBulkDelete(filter=DiarySearchParams())
+
+
+async def test_fast_json_path_matches_diary_out_serialization():
+    user = await create_user("fastjson@example.com")
+    await create_diaries(user, 3)
+    diaries = await Diary.filter(user_id=user.id).order_by("id")
+
+    expected = (await get_all_diaries_service(user.id)).model_dump(mode="json")
+    fast = FastJSONResponse(
+        {"items": await diaries_to_dicts(diaries[::-1]), "next_cursor": None}
+    )
+    assert json.loads(fast.body) == expected
+
+
+async def test_delete_user_removes_stats_and_search_index():
+    user = await create_user("leaving@example.com")
+    other = await create_user("staying@example.com")
+    await create_diaries(user, 3)
+    await create_diaries(other, 1)
+    conn = Tortoise.get_connection("default")
+
+    async def leftovers(user_id: int):
+        _, [row] = await conn.execute_query(
+            "SELECT COUNT(*) FROM diary_fts WHERE user_id = ?", [user_id]
+        )
+        return [
+            row[0],
+            await UserEmotionDaily.filter(user_id=user_id).count(),
+            await UserTagUsage.filter(user_id=user_id).count(),
+            await UserCalendar.filter(user_id=user_id).count(),
+            await UserDiaryVersion.filter(user_id=user_id).count(),
+        ]
+
+    assert all(await leftovers(user.id))
+    before = await leftovers(other.id)
+
+    assert "message" in await delete_user_service(user.id)
+    assert await leftovers(user.id) == [0, 0, 0, 0, 0]
+    assert await leftovers(other.id) == before
+    assert len(await search_diary_fulltext(other.id, "내용", 10, 0)) == 1
@@ -0,0 +1,95 @@
+# app/utils/aho_corasick.py
+
+from collections import deque
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+class AhoCorasick:
+    """
+    여러 키워드를 본문에서 한 번의 선형 탐색으로 찾는 Aho-Corasick 오토마톤입니다.
+
+    키워드 추가/삭제는 트라이에 바로 반영하고, 실패 링크는 다음 탐색 전에
+    트라이만 한 번 훑어 다시 계산합니다. (키워드 전체를 다시 넣지 않습니다.)
+    """
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Optional[Any]] = [None]
+        # 실패 링크를 따라가며 만나는 첫 번째 출력 노드 (없으면 0)
+        self._output_link: List[int] = [0]
+        self._nodes: Dict[str, int] = {}
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, keyword: str) -> bool:
+        return keyword in self._nodes
+
+    @property
+    def node_count(self) -> int:
+        return len(self._goto)
+
+    def add(self, keyword: str, value: Any) -> None:
+        if not keyword:
+            return
+        node = 0
+        for ch in keyword:
+            next_node = self._goto[node].get(ch)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(None)
+                self._output_link.append(0)
+                self._goto[node][ch] = next_node
+            node = next_node
+        self._output[node] = value
+        self._nodes[keyword] = node
+        self._dirty = True
+
+    def remove(self, keyword: str) -> None:
+        # 트라이 노드는 남겨 두고 출력만 지웁니다.
+        node = self._nodes.pop(keyword, None)
+        if node is not None:
+            self._output[node] = None
+            self._dirty = True
+
+    def _build_links(self) -> None:
+        queue = deque()
+        for node in self._goto[0].values():
+            self._fail[node] = 0
+            self._output_link[node] = 0
+            queue.append(node)
+
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(ch, 0)
+                self._fail[child] = fail
+                self._output_link[child] = (
+                    fail if self._output[fail] is not None else self._output_link[fail]
+                )
+                queue.append(child)
+        self._dirty = False
+
+    def iter(self, text: str) -> Iterator[Tuple[int, Any]]:
+        """본문에서 찾은 키워드마다 (끝 위치, 값)을 내보냅니다. 겹치는 키워드도 모두 찾습니다."""
+        if self._dirty:
+            self._build_links()
+        goto, fail = self._goto, self._fail
+        output, output_link = self._output, self._output_link
+
+        node = 0
+        for index, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            match = node if output[node] is not None else output_link[node]
+            while match:
+                yield index, output[match]
+                match = output_link[match]
@@ -0,0 +1,83 @@
+# app/utils/circuit_breaker.py
+
+import time
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """회로가 열려 있어 호출하지 않고 바로 실패한 경우"""
+
+
+class CircuitBreaker:
+    """
+    외부 서비스가 연속으로 failure_threshold 번 실패하면 회로를 열고(open)
+    reset_timeout 초 동안은 호출하지 않고 바로 실패시킵니다.
+    이후 한 번의 시험 호출(half_open)이 성공하면 다시 닫고(closed), 실패하면 다시 엽니다.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self._trial_in_progress = False
+
+        # 메트릭
+        self.opened = 0
+        self.rejected = 0
+
+    def before_call(self) -> bool:
+        """
+        호출 전에 부릅니다. 호출할 수 없으면 CircuitOpenError를 냅니다.
+        이 호출이 half_open 상태의 시험 호출이면 True를 반환합니다.
+        """
+        if self.state == OPEN:
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                self.rejected += 1
+                raise CircuitOpenError("AI 서비스가 일시적으로 응답하지 않습니다.")
+            self.state = HALF_OPEN
+        if self.state == HALF_OPEN:
+            # 시험 호출은 하나만 보냅니다.
+            if self._trial_in_progress:
+                self.rejected += 1
+                raise CircuitOpenError("AI 서비스 상태를 확인하는 중입니다.")
+            self._trial_in_progress = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self._trial_in_progress = False
+        self.consecutive_failures = 0
+        self.state = CLOSED
+
+    def record_cancelled(self, trial: bool) -> None:
+        """
+        호출이 결과 없이 끝난 경우(취소, 클라이언트 연결 끊김 등) 부릅니다.
+        제공자 상태는 알 수 없으므로 상태는 그대로 두고, 시험 호출이었다면 자리만 비웁니다.
+        """
+        if trial:
+            self._trial_in_progress = False
+
+    def record_failure(self) -> None:
+        self._trial_in_progress = False
+        self.consecutive_failures += 1
+        if (
+            self.state == HALF_OPEN
+            or self.consecutive_failures >= self.failure_threshold
+        ):
+            if self.state != OPEN:
+                self.opened += 1
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "opened": self.opened,
+            "rejected": self.rejected,
+        }
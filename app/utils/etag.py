@@ -0,0 +1,48 @@
+# app/utils/etag.py
+
+import hashlib
+from datetime import datetime
+from typing import Optional
+
+from fastapi import Response, status
+
+# 캐시는 하되 쓸 때마다 ETag로 다시 확인하도록 합니다. (사용자별 응답이므로 private)
+CACHE_CONTROL = "private, no-cache"
+
+
+def diary_etag(diary_id: int, updated_at: datetime) -> str:
+    """일기 하나의 strong ETag. 수정될 때마다 바뀌는 updated_at에서 만듭니다."""
+    return f'"{diary_id}-{int(updated_at.timestamp() * 1_000_000):x}"'
+
+
+def diary_list_etag(user_id: int, version: int, *params) -> str:
+    """
+    일기 목록 응답의 strong ETag. 사용자별 일기 버전과 요청 파라미터(limit, cursor 등)에서
+    만듭니다.
+    """
+    key = repr((user_id, version, params)).encode()
+    return f'"{version}-{hashlib.blake2b(key, digest_size=8).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    If-None-Match 헤더가 etag와 맞는지 확인합니다.
+    여러 값(쉼표로 구분)과 "*"를 지원하고, If-None-Match의 규칙대로 W/ 접두어는 무시합니다.
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def etag_headers(etag: str) -> dict:
+    return {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+
+def not_modified(etag: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED, headers=etag_headers(etag)
+    )
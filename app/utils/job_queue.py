@@ -0,0 +1,204 @@
+# app/utils/job_queue.py
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+RETRYING = "retrying"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+
+class PermanentJobError(Exception):
+    """다시 시도해도 성공할 수 없는 실패 (재시도 없이 바로 실패 처리)"""
+
+
+@dataclass
+class Job:
+    id: str
+    key: Hashable
+    owner_id: Optional[int]
+    func: Callable[..., Awaitable[Any]]
+    args: tuple
+    status: str = QUEUED
+    attempts: int = 0
+    result: Any = None
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (SUCCEEDED, FAILED)
+
+
+class JobQueue:
+    """
+    메모리 기반 비동기 작업 큐입니다.
+
+    - workers 개의 워커가 작업을 꺼내 실행하므로 동시 실행 수가 제한됩니다.
+    - 실패한 작업은 retry_backoff * 2^(시도-1)초 뒤 max_retries 번까지 다시 실행합니다.
+      (PermanentJobError는 재시도하지 않습니다.)
+    - 같은 key의 작업이 대기/실행 중이면 새로 만들지 않고 기존 작업을 반환합니다.
+    - 완료된 작업은 최근 max_history 개만 보관합니다. (프로세스 재시작 시 사라집니다.)
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        max_retries: int = 3,
+        retry_backoff: float = 1.0,
+        max_history: int = 10_000,
+    ):
+        self.workers = workers
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.max_history = max_history
+        # 큐와 워커는 이벤트 루프에 묶이므로 루프별로 따로 둡니다. (테스트 클라이언트 등)
+        self._queues: Dict[asyncio.AbstractEventLoop, asyncio.Queue] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        self._jobs: "OrderedDict[str, Job]" = OrderedDict()
+        self._inflight: Dict[Hashable, Job] = {}
+
+        # 메트릭
+        self.submitted = 0
+        self.deduplicated = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.retries = 0
+
+    def _get_queue(self) -> asyncio.Queue:
+        loop = asyncio.get_running_loop()
+        queue = self._queues.get(loop)
+        if queue is None:
+            queue = self._queues[loop] = asyncio.Queue()
+        return queue
+
+    async def start(self) -> None:
+        loop = asyncio.get_running_loop()
+        if any(task.get_loop() is loop for task in self._tasks):
+            return
+        queue = self._get_queue()
+        self._tasks += [
+            asyncio.create_task(self._worker(queue)) for _ in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        loop = asyncio.get_running_loop()
+        tasks = [task for task in self._tasks if task.get_loop() is loop]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks = [task for task in self._tasks if task not in tasks]
+        self._queues.pop(loop, None)
+        if self._tasks:
+            return
+
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
+        # 끝나지 않은 작업은 실패로 처리해 같은 key로 다시 요청할 수 있게 합니다.
+        for job in list(self._inflight.values()):
+            job.error = "서버 종료로 작업이 중단되었습니다."
+            self._finish(job, FAILED)
+
+    def submit(
+        self,
+        key: Hashable,
+        func: Callable[..., Awaitable[Any]],
+        *args,
+        owner_id: Optional[int] = None,
+    ) -> Job:
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.deduplicated += 1
+            return inflight
+
+        job = Job(id=uuid.uuid4().hex, key=key, owner_id=owner_id, func=func, args=args)
+        self._jobs[job.id] = job
+        self._inflight[key] = job
+        self.submitted += 1
+        self._get_queue().put_nowait(job)
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    async def _worker(self, queue: asyncio.Queue) -> None:
+        while True:
+            job = await queue.get()
+            try:
+                await self._run(job)
+            finally:
+                queue.task_done()
+
+    async def _run(self, job: Job) -> None:
+        job.status = RUNNING
+        job.attempts += 1
+        try:
+            job.result = await job.func(*job.args)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            job.error = str(e)
+            if job.attempts <= self.max_retries and not isinstance(
+                e, PermanentJobError
+            ):
+                self._schedule_retry(job)
+                return
+            logger.warning("작업 %s 실패 (%d회 시도): %s", job.id, job.attempts, e)
+            self.failed += 1
+            self._finish(job, FAILED)
+            return
+
+        job.error = None
+        self.succeeded += 1
+        self._finish(job, SUCCEEDED)
+
+    def _schedule_retry(self, job: Job) -> None:
+        job.status = RETRYING
+        self.retries += 1
+        delay = self.retry_backoff * 2 ** (job.attempts - 1)
+
+        def requeue():
+            self._timers.pop(job.id, None)
+            job.status = QUEUED
+            self._get_queue().put_nowait(job)
+
+        self._timers[job.id] = asyncio.get_running_loop().call_later(delay, requeue)
+
+    def _finish(self, job: Job, status: str) -> None:
+        job.status = status
+        job.finished_at = time.time()
+        self._inflight.pop(job.key, None)
+        job.done.set()
+
+        # 오래된 완료 작업부터 정리합니다.
+        while len(self._jobs) > self.max_history:
+            oldest_id, oldest = next(iter(self._jobs.items()))
+            if not oldest.finished:
+                break
+            del self._jobs[oldest_id]
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "started": bool(self._tasks),
+            "queued": sum(queue.qsize() for queue in self._queues.values()),
+            "inflight": len(self._inflight),
+            "submitted": self.submitted,
+            "deduplicated": self.deduplicated,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "retries": self.retries,
+        }
@@ -0,0 +1,100 @@
+# app/utils/password_pool.py
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class PasswordHashPool:
+    """
+    bcrypt 해시/검증을 이벤트 루프 밖의 전용 스레드 풀에서 실행합니다.
+
+    - bcrypt는 연산 중 GIL을 놓기 때문에 스레드 풀로도 병렬 처리가 됩니다.
+    - 동시에 실행되는 작업은 max_workers 개로 제한되고, 나머지는 대기열에서 기다립니다.
+    """
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # 메트릭
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.running = 0
+        self.waiting = 0
+        self.max_waiting = 0
+        self.total_wait_seconds = 0.0
+        self.total_run_seconds = 0.0
+
+    def start(self) -> None:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="password-hash"
+            )
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # 세마포어는 이벤트 루프에 묶이므로 루프가 바뀌면(테스트 등) 새로 만듭니다.
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_workers)
+            self._loop = loop
+        return self._semaphore
+
+    async def run(self, func: Callable[..., T], *args) -> T:
+        self.start()
+        semaphore = self._get_semaphore()
+
+        self.submitted += 1
+        self.waiting += 1
+        self.max_waiting = max(self.max_waiting, self.waiting)
+        queued_at = time.perf_counter()
+        try:
+            await semaphore.acquire()
+        finally:
+            self.waiting -= 1
+
+        started_at = time.perf_counter()
+        self.total_wait_seconds += started_at - queued_at
+        self.running += 1
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(
+                self._executor, func, *args
+            )
+            self.completed += 1
+            return result
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            self.running -= 1
+            self.total_run_seconds += time.perf_counter() - started_at
+            semaphore.release()
+
+    def stats(self) -> dict:
+        finished = self.completed + self.failed
+        return {
+            "max_workers": self.max_workers,
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "running": self.running,
+            "waiting": self.waiting,
+            "max_waiting": self.max_waiting,
+            "avg_wait_ms": (
+                round(self.total_wait_seconds / finished * 1000, 3) if finished else 0.0
+            ),
+            "avg_run_ms": (
+                round(self.total_run_seconds / finished * 1000, 3) if finished else 0.0
+            ),
+        }
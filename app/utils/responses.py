@@ -0,0 +1,16 @@
+# app/utils/responses.py
+
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+
+class FastJSONResponse(ORJSONResponse):
+    """
+    orjson으로 직렬화하는 JSON 응답입니다.
+    UTC datetime은 pydantic과 같게 "Z"로 끝나도록 써서 기존 응답과 형식이 같습니다.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS)
@@ -1,6 +1,7 @@
 # app/utils/security.py
 
 import uuid
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import Optional
 
@@ -13,20 +14,62 @@ from fastapi.security import (
 )
 from jose import JWTError, jwt
 from passlib.context import CryptContext
-from tortoise.exceptions import DoesNotExist
 
 # .env 파일 등에서 SECRET_KEY와 만료 시간을 가져옵니다.
 from ..core.config import (
     ACCESS_TOKEN_EXPIRE_MINUTES,
     ALGORITHM,
+    PASSWORD_HASH_WORKERS,
     REFRESH_TOKEN_EXPIRE_DAYS,
     SECRET_KEY,
+    TOKEN_BLOOM_CAPACITY,
+    TOKEN_REVOCATION_BACKEND,
+    TOKEN_REVOCATION_FULL_SYNC_EVERY,
+    TOKEN_REVOCATION_SYNC_OVERLAP,
+    USER_CACHE_SIZE,
+    USER_CACHE_TTL_SECONDS,
 )
 from ..models import User
-from ..models.token_blacklist import TokenBlacklist
+from .cache import LRUCache
+from .password_pool import PasswordHashPool
+from .token_cache import RevokedTokenCache
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt 연산은 100ms 이상 걸리므로 이벤트 루프를 막지 않도록 전용 풀에서 실행합니다.
+password_pool = PasswordHashPool(max_workers=PASSWORD_HASH_WORKERS)
+
+# 로그아웃된 토큰 캐시 (앱 시작 시 TokenBlacklist에서 로드)
+revoked_tokens = RevokedTokenCache(
+    backend=TOKEN_REVOCATION_BACKEND,
+    bloom_capacity=TOKEN_BLOOM_CAPACITY,
+    sync_overlap=TOKEN_REVOCATION_SYNC_OVERLAP,
+    full_sync_every=TOKEN_REVOCATION_FULL_SYNC_EVERY,
+)
+
+# 인증된 사용자 캐시 (user_id -> AuthenticatedUser)
+user_cache = LRUCache(maxsize=USER_CACHE_SIZE, ttl=USER_CACHE_TTL_SECONDS)
+
+
+@dataclass
+class AuthenticatedUser:
+    """
+    인가에 필요한 최소한의 사용자 정보입니다.
+    전체 User 행(이메일, 비밀번호 해시 등)이 필요하면 load()로 조회합니다.
+    """
+
+    id: int
+    is_active: bool
+    is_staff: bool
+    is_admin: bool
+
+    async def load(self) -> User:
+        return await User.get(id=self.id)
+
+
+def invalidate_user_cache(user_id) -> None:
+    user_cache.delete(int(user_id))
+
 
 # OAuth2 스키마 정의 (FastAPI의 Depends에 사용)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/login")
@@ -43,6 +86,14 @@ def verify_password(password: str, hashed_password: str) -> bool:
     return pwd_context.verify(password, hashed_password)
 
 
+async def hash_password_async(password: str) -> str:
+    return await password_pool.run(hash_password, password)
+
+
+async def verify_password_async(password: str, hashed_password: str) -> bool:
+    return await password_pool.run(verify_password, password, hashed_password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     if expires_delta:
@@ -75,14 +126,14 @@ def verify_token(token: str) -> Optional[dict]:
 
 
 # 토큰의 유효성을 검사하고, 블랙리스트를 확인한 후 사용자 정보를 반환합니다.
-async def get_user_from_token(token: str) -> Optional[User]:
+async def get_user_from_token(token: str) -> Optional[AuthenticatedUser]:
     payload = verify_token(token)
     if payload is None:
         return None
 
     # 블랙리스트에 등록된 토큰인지 확인
     jti = payload.get("jti")
-    if jti is None or await TokenBlacklist.get_or_none(jti=jti):
+    if jti is None or await revoked_tokens.is_revoked(jti):
         return None
 
     user_id = payload.get("sub")
@@ -90,16 +141,32 @@ async def get_user_from_token(token: str) -> Optional[User]:
         return None
 
     try:
-        user = await User.get(id=user_id)
+        user_id = int(user_id)
+    except ValueError:
+        return None
+
+    user = user_cache.get(user_id)
+    if user is not None:
         return user
-    except DoesNotExist:
+
+    # 비밀번호 해시 등 불필요한 컬럼은 읽지 않습니다.
+    row = (
+        await User.filter(id=user_id)
+        .first()
+        .values("id", "is_active", "is_staff", "is_admin")
+    )
+    if row is None:
         return None
 
+    user = AuthenticatedUser(**row)
+    user_cache.set(user_id, user)
+    return user
+
 
 # **새로 추가된 함수**
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(http_bearer),
-) -> User:
+) -> AuthenticatedUser:
     token = credentials.credentials
     user = await get_user_from_token(token)
     if not user:
@@ -0,0 +1,195 @@
+# app/utils/token_cache.py
+
+import asyncio
+import hashlib
+import logging
+import math
+import time
+from typing import Dict, List, Optional
+
+from ..models.token_blacklist import TokenBlacklist
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """
+    고정 크기 비트 배열로 "확실히 없음"을 빠르게 판단하는 확률적 집합입니다.
+    거짓 양성은 있을 수 있지만 거짓 음성은 없습니다.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        self.capacity = capacity
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(key)
+        )
+
+
+class RevokedTokenCache:
+    """
+    로그아웃된 토큰(jti)을 메모리에 보관해 인증 요청마다 DB를 조회하지 않도록 합니다.
+
+    backend
+    - "memory": jti -> 만료 시각을 메모리에 보관하고 DB를 전혀 조회하지 않습니다.
+    - "bloom":  블룸 필터로 음성 응답만 메모리에서 처리하고, 양성일 때만 DB로 확인합니다.
+    - "db":     캐시 없이 매번 DB를 조회합니다. (기존 동작)
+
+    다른 워커에서 로그아웃한 토큰은 sync()가 주기적으로 반영합니다.
+    PostgreSQL에서는 동시에 들어온 로그아웃이 id 순서와 다르게 커밋될 수 있으므로,
+    sync()는 마지막으로 본 id보다 sync_overlap 만큼 앞에서부터 다시 읽고,
+    full_sync_every 번마다 전체를 다시 읽습니다.
+    """
+
+    def __init__(
+        self,
+        backend: str = "memory",
+        bloom_capacity: int = 100_000,
+        sync_overlap: int = 1000,
+        full_sync_every: int = 60,
+    ):
+        if backend not in ("memory", "bloom", "db"):
+            raise ValueError(f"지원하지 않는 토큰 캐시 방식입니다: {backend}")
+        self.backend = backend
+        self.bloom_capacity = bloom_capacity
+        self.sync_overlap = sync_overlap
+        self.full_sync_every = full_sync_every
+        self.loaded = False
+        self._entries: Dict[str, float] = {}
+        self._bloom: Optional[BloomFilter] = None
+        self._last_id = 0
+        self._syncs = 0
+
+        # 메트릭
+        self.memory_hits = 0
+        self.memory_misses = 0
+        self.db_lookups = 0
+
+    def reset(self) -> None:
+        self.loaded = False
+        self._entries.clear()
+        self._bloom = None
+        self._last_id = 0
+        self._syncs = 0
+
+    def add(self, jti: str, exp: float) -> None:
+        """만료 시각(exp, epoch 초)까지만 유효한 항목으로 jti를 등록합니다."""
+        if self.backend == "memory":
+            self._entries[jti] = exp
+        elif self.backend == "bloom" and self._bloom is not None:
+            if jti in self._bloom:
+                # 겹쳐 읽은 행을 다시 넣어 용량을 채우지 않도록 건너뜁니다.
+                return
+            if self._bloom.count >= self.bloom_capacity:
+                # 용량을 넘기면 오탐률이 올라가므로 다음 동기화 때 다시 만듭니다.
+                self.loaded = False
+            else:
+                self._bloom.add(jti)
+
+    async def load(self) -> None:
+        """TokenBlacklist에서 아직 만료되지 않은 토큰을 모두 읽어 캐시를 채웁니다."""
+        if self.backend != "db":
+            rows = await self._fetch_rows(after_id=0)
+            # 조회가 끝난 뒤 한 번에 바꿔서, 다시 읽는 동안에도 기존 항목으로 판단합니다.
+            self._entries = {}
+            self._bloom = (
+                BloomFilter(self.bloom_capacity) if self.backend == "bloom" else None
+            )
+            self._last_id = 0
+            self._apply_rows(rows, only_unexpired=True)
+        self._syncs = 0
+        self.loaded = True
+
+    async def sync(self) -> None:
+        """마지막 동기화 이후 추가된 블랙리스트 행을 반영하고 만료된 항목을 정리합니다."""
+        if self.backend == "db":
+            return
+        self._syncs += 1
+        if not self.loaded or self._syncs >= self.full_sync_every:
+            await self.load()
+            return
+        rows = await self._fetch_rows(after_id=self._last_id - self.sync_overlap)
+        self._apply_rows(rows, only_unexpired=False)
+
+        now = time.time()
+        expired = [jti for jti, exp in self._entries.items() if exp <= now]
+        for jti in expired:
+            del self._entries[jti]
+
+    async def run_sync_loop(self, interval: float) -> None:
+        """interval 초마다 sync()를 호출합니다. lifespan에서 태스크로 실행합니다."""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.sync()
+            except Exception as e:
+                logger.warning("토큰 블랙리스트 동기화 실패: %s", e)
+
+    async def _fetch_rows(self, after_id: int) -> List[dict]:
+        query = TokenBlacklist.filter(id__gt=after_id)
+        return await query.order_by("id").values("id", "jti", "exp")
+
+    def _apply_rows(self, rows: List[dict], only_unexpired: bool) -> None:
+        now = time.time()
+        for row in rows:
+            self._last_id = max(self._last_id, row["id"])
+            exp = row["exp"].timestamp()
+            if only_unexpired and exp <= now:
+                continue
+            self.add(row["jti"], exp)
+
+    async def is_revoked(self, jti: str) -> bool:
+        if self.backend == "db" or not self.loaded:
+            return await self._lookup_db(jti)
+
+        if self.backend == "bloom":
+            if jti not in self._bloom:
+                self.memory_misses += 1
+                return False
+            return await self._lookup_db(jti)
+
+        exp = self._entries.get(jti)
+        if exp is None:
+            self.memory_misses += 1
+            return False
+        if exp <= time.time():
+            # 이미 만료된 토큰은 JWT 검증 단계에서 거부되므로 캐시에서 제거합니다.
+            del self._entries[jti]
+            self.memory_misses += 1
+            return False
+        self.memory_hits += 1
+        return True
+
+    async def _lookup_db(self, jti: str) -> bool:
+        self.db_lookups += 1
+        return await TokenBlacklist.exists(jti=jti)
+
+    def stats(self) -> dict:
+        return {
+            "backend": self.backend,
+            "loaded": self.loaded,
+            "entries": (
+                self._bloom.count if self._bloom is not None else len(self._entries)
+            ),
+            "memory_hits": self.memory_hits,
+            "memory_misses": self.memory_misses,
+            "db_lookups": self.db_lookups,
+        }
@@ -0,0 +1,106 @@
+"""
+일기 목록 응답 직렬화 마이크로벤치마크: DiaryOut + FastAPI 기본 경로 vs dict + orjson
+
+DB 조회(일기/태그)는 두 경로가 같으므로 제외하고, 메모리에 만든 일기 N개(10, 1천, 1만 개)를
+응답 바이트로 만드는 시간만 비교합니다.
+
+- current: to_diary_out으로 DiaryOut 생성 -> response_model 검증/직렬화 -> JSONResponse
+- fast:    diary_to_dict로 dict 생성 -> FastJSONResponse(orjson)
+
+    python -m benchmarks.bench_diary_response --sizes 10 1000 10000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from tortoise import Tortoise
+
+from app.core.config import TORTOISE_ORM
+from app.models.diary import Diary, EmotionalState
+from app.schemas.diary import DiaryPage
+from app.services.diary_service import diary_to_dict, to_diary_out
+from app.utils.responses import FastJSONResponse
+
+PAGE_FIELD = create_model_field("Response", DiaryPage, mode="serialization")
+
+
+def make_diaries(count):
+    now = datetime.now(timezone.utc)
+    states = list(EmotionalState)
+    return [
+        (
+            Diary(
+                id=i,
+                user_id=1,
+                title=f"{i}번째 일기",
+                content="오늘은 평범하지만 조금 특별한 하루였다. " * 10,
+                emotional_state=states[i % len(states)],
+                ai_summary=None,
+                emotion_scores={"happy": 0.5, "sad": 0.25},
+                created_at=now - timedelta(minutes=i),
+                updated_at=now,
+            ),
+            [f"태그{i % 50}", "공통"],
+        )
+        for i in range(count)
+    ]
+
+
+async def current_path(rows):
+    page = DiaryPage(
+        items=[to_diary_out(diary, tags) for diary, tags in rows], next_cursor=None
+    )
+    content = await serialize_response(field=PAGE_FIELD, response_content=page)
+    return JSONResponse(content).body
+
+
+async def fast_path(rows):
+    content = {
+        "items": [diary_to_dict(diary, tags) for diary, tags in rows],
+        "next_cursor": None,
+    }
+    return FastJSONResponse(content).body
+
+
+async def timed(func, rows, repeat):
+    latencies = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        body = await func(rows)
+        latencies.append((time.perf_counter() - started) * 1000)
+    return statistics.median(latencies), len(body)
+
+
+async def run(args):
+    # 모델 인스턴스를 만들기 위해 초기화만 합니다. (DB는 사용하지 않음)
+    await Tortoise.init(
+        db_url="sqlite://:memory:",
+        modules={"models": TORTOISE_ORM["apps"]["models"]["models"]},
+    )
+    for size in args.sizes:
+        rows = make_diaries(size)
+        repeat = max(3, min(args.repeat, 100_000 // size))
+        current_ms, current_size = await timed(current_path, rows, repeat)
+        fast_ms, fast_size = await timed(fast_path, rows, repeat)
+        print(
+            f"{size:>6} diaries: current={current_ms:9.3f}ms  fast={fast_ms:9.3f}ms  "
+            f"x{current_ms / fast_ms:5.1f}  ({current_size}B / {fast_size}B)"
+        )
+    await Tortoise.close_connections()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1_000, 10_000])
+    parser.add_argument("--repeat", type=int, default=50)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+태그가 많은 일기의 수정 처리량 벤치마크
+
+기존 방식(태그 전체 삭제 후 재삽입 + 항상 save)과 차이 기반 수정(update_diary_service)을
+같은 데이터로 비교합니다.
+
+- same: 태그 목록이 그대로인 수정 (가장 흔한 경우: 본문만 고친 뒤 저장)
+- swap: 태그 하나만 바뀐 수정
+
+    python -m benchmarks.bench_diary_tag_update --diaries 200 --tags 20
+"""
+
+import argparse
+import asyncio
+import time
+
+from tortoise import Tortoise
+
+from app.core.config import TORTOISE_ORM
+from app.models import User
+from app.models.diary import Diary, DiaryTag
+from app.schemas.diary import DiaryCreate, DiaryUpdate
+from app.services.diary_service import create_diary_service, update_diary_service
+from app.services.fulltext_service import ensure_fulltext_index
+from app.services.tag_service import resolve_tags
+from app.utils.security import AuthenticatedUser
+
+
+async def legacy_update(diary_id, tag_names, user_id):
+    # 기존 update_diary_service의 태그 처리 방식
+    diary = await Diary.get(id=diary_id, user_id=user_id)
+    # (M2M add는 diary_tags의 비정규화 컬럼을 채우지 못하므로 행 단위 insert로 재현)
+    await DiaryTag.filter(diary_id=diary.id).delete()
+    tags = await resolve_tags(tag_names)
+    for tag in tags:
+        await DiaryTag.create(
+            diary_id=diary.id,
+            tag_id=tag.id,
+            user_id=diary.user_id,
+            created_at=diary.created_at,
+        )
+    await diary.save()
+    await diary.fetch_related("tags")
+
+
+async def new_update(diary_id, tag_names, user_id):
+    await update_diary_service(diary_id, DiaryUpdate(tags=tag_names), user_id)
+
+
+async def run(args):
+    await Tortoise.init(
+        db_url=args.db_url,
+        modules={"models": TORTOISE_ORM["apps"]["models"]["models"]},
+    )
+    await Tortoise.generate_schemas()
+    await ensure_fulltext_index()
+
+    user = await User.create(
+        email="bench@example.com", password="x", nickname="b", name="b"
+    )
+    principal = AuthenticatedUser(
+        id=user.id, is_active=True, is_staff=False, is_admin=False
+    )
+    base_tags = [f"tag{i}" for i in range(args.tags)]
+    diary_ids = []
+    for i in range(args.diaries):
+        diary = await create_diary_service(
+            principal,
+            DiaryCreate(
+                title=f"diary {i}",
+                content="content",
+                emotional_state="neutral",
+                tags=base_tags,
+            ),
+        )
+        diary_ids.append(diary.id)
+
+    scenarios = {
+        "same": lambda i: base_tags,
+        "swap": lambda i: base_tags[:-1] + [f"swap{i % 2}"],
+    }
+    for name, update in (("legacy", legacy_update), ("diff", new_update)):
+        for scenario, tags_for in scenarios.items():
+            started = time.perf_counter()
+            for round_no in range(args.rounds):
+                for diary_id in diary_ids:
+                    await update(diary_id, tags_for(round_no), user.id)
+            elapsed = time.perf_counter() - started
+            total = args.rounds * len(diary_ids)
+            print(f"{name:>6} {scenario}: {total / elapsed:8.1f} updates/s")
+            # 다음 측정을 위해 원래 태그로 되돌립니다.
+            for diary_id in diary_ids:
+                await new_update(diary_id, base_tags, user.id)
+
+    await Tortoise.close_connections()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--diaries", type=int, default=200)
+    parser.add_argument("--tags", type=int, default=20, help="일기당 태그 수")
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--db-url", default="sqlite://:memory:")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
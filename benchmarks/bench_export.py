@@ -0,0 +1,131 @@
+"""
+일기 내보내기 메모리 벤치마크: 전체 목록 직렬화 vs 청크 스트리밍
+
+한 사용자에게 일기 N개(기본 10만 개)와 태그를 넣은 뒤,
+스트리밍 내보내기(NDJSON/CSV)를 끝까지 읽는 동안의 최대 RSS 증가량을
+모든 일기를 DiaryOut 목록으로 만든 뒤 직렬화하는 방식과 비교합니다.
+(RSS는 잘 줄어들지 않으므로 스트리밍을 먼저 측정합니다.)
+
+    python -m benchmarks.bench_export --diaries 100000
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import random
+import resource
+import time
+
+from tortoise import Tortoise
+
+from app.core.config import TORTOISE_ORM
+from app.models import User
+from app.models.diary import Diary, DiaryTag
+from app.models.tag import Tag
+from app.services.diary_service import serialize_diaries
+from app.services.export_service import export_diaries
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def current_rss_mb() -> float:
+    """현재 RSS (MB). /proc이 없으면 프로세스 최대 RSS를 대신 사용합니다."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE / 2**20
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def load(args, rng):
+    user = await User.create(
+        email="bench@example.com", password="x", nickname="b", name="b"
+    )
+    await Tag.bulk_create([Tag(name=f"태그{i}") for i in range(args.tags)])
+    tag_ids = await Tag.all().values_list("id", flat=True)
+
+    for offset in range(0, args.diaries, args.batch_size):
+        count = min(args.batch_size, args.diaries - offset)
+        await Diary.bulk_create(
+            [
+                Diary(
+                    user_id=user.id,
+                    title=f"{offset + i}번째 일기",
+                    content="오늘은 " + "평범하지만 조금 특별한 하루였다. " * 10,
+                    emotional_state="neutral",
+                )
+                for i in range(count)
+            ]
+        )
+        diaries = await Diary.filter(id__gt=offset).order_by("id").limit(count)
+        await DiaryTag.bulk_create(
+            [
+                DiaryTag(
+                    diary_id=diary.id,
+                    tag_id=tag_id,
+                    user_id=user.id,
+                    created_at=diary.created_at,
+                )
+                for diary in diaries
+                for tag_id in rng.sample(tag_ids, args.tags_per_diary)
+            ]
+        )
+    return user
+
+
+async def measure(name, consume):
+    gc.collect()
+    baseline = peak = current_rss_mb()
+    started = time.perf_counter()
+    size = 0
+    async for part in consume():
+        size += len(part)
+        peak = max(peak, current_rss_mb())
+    elapsed = time.perf_counter() - started
+    print(
+        f"{name:>10}: {elapsed:6.1f}s  {size / 2**20:7.1f}MB written  "
+        f"peak RSS +{peak - baseline:6.1f}MB"
+    )
+
+
+async def run(args):
+    await Tortoise.init(
+        db_url=args.db_url,
+        modules={"models": TORTOISE_ORM["apps"]["models"]["models"]},
+    )
+    await Tortoise.generate_schemas()
+
+    rng = random.Random(42)
+    started = time.perf_counter()
+    user = await load(args, rng)
+    print(f"loaded {args.diaries} diaries in {time.perf_counter() - started:.1f}s")
+
+    async def full_list():
+        # 기존 방식: 모든 일기를 DiaryOut 목록으로 만든 뒤 한 번에 직렬화
+        diaries = await Diary.filter(user_id=user.id).order_by("created_at", "id")
+        items = await serialize_diaries(diaries)
+        yield json.dumps(
+            [item.model_dump(mode="json") for item in items], ensure_ascii=False
+        )
+
+    await measure("ndjson", lambda: export_diaries(user.id, "ndjson"))
+    await measure("csv", lambda: export_diaries(user.id, "csv"))
+    await measure("full list", full_list)
+
+    await Tortoise.close_connections()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--diaries", type=int, default=100_000)
+    parser.add_argument("--tags", type=int, default=200, help="전체 태그 수")
+    parser.add_argument("--tags-per-diary", type=int, default=3)
+    parser.add_argument("--batch-size", type=int, default=5_000)
+    parser.add_argument("--db-url", default="sqlite://:memory:")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
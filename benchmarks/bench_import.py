@@ -0,0 +1,98 @@
+"""
+일기 가져오기 처리량 벤치마크: create_diary_service 반복 vs NDJSON 일괄 가져오기
+
+무작위 일기 N개(기본 2만 개)를 NDJSON 줄로 만든 뒤,
+앞의 --single 개는 기존 create_diary_service로 하나씩, 전체는 import_diaries로
+청크 단위 일괄 저장하여 초당 처리량을 비교합니다.
+(두 방식 모두 전문 검색/n-gram 색인과 통계 집계를 함께 갱신합니다.)
+
+    python -m benchmarks.bench_import --diaries 20000 --chunk-size 1000
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from tortoise import Tortoise
+
+from app.core.config import TORTOISE_ORM
+from app.models import User
+from app.models.diary import Diary
+from app.schemas.diary import DiaryCreate
+from app.services.diary_service import create_diary_service
+from app.services.fulltext_service import ensure_fulltext_index
+from app.services.import_service import import_diaries
+from app.utils.security import AuthenticatedUser
+
+WORDS = (
+    "오늘 어제 아침 점심 저녁 친구 가족 회사 학교 공부 운동 산책 여행 바다 하늘 "
+    "커피 영화 음악 독서 요리 청소 행복했다 슬펐다 피곤했다 즐거웠다 맛있는 조용한 "
+    "따뜻한 바쁜 카페에서 집에서 공원에서 만났다 걸었다 먹었다 읽었다 웃었다"
+).split()
+STATES = ["happy", "sad", "angry", "neutral"]
+
+
+def make_lines(rng, count, words):
+    for i in range(count):
+        row = {
+            "title": " ".join(rng.choices(WORDS, k=3)),
+            "content": " ".join(rng.choices(WORDS, k=words)),
+            "emotional_state": rng.choice(STATES),
+            "tags": rng.sample([f"태그{n}" for n in range(100)], 2),
+            "created_at": f"20{rng.randint(15, 24)}-{rng.randint(1, 12):02d}-"
+            f"{rng.randint(1, 28):02d}T{rng.randint(0, 23):02d}:00:00",
+        }
+        yield json.dumps(row, ensure_ascii=False).encode()
+
+
+async def create_user(email):
+    user = await User.create(email=email, password="x", nickname="b", name="b")
+    return AuthenticatedUser(id=user.id, is_active=True, is_staff=False, is_admin=False)
+
+
+async def run(args):
+    await Tortoise.init(
+        db_url=args.db_url,
+        modules={"models": TORTOISE_ORM["apps"]["models"]["models"]},
+    )
+    await Tortoise.generate_schemas()
+    await ensure_fulltext_index()
+
+    lines = list(make_lines(random.Random(42), args.diaries, args.words))
+
+    single_user = await create_user("single@example.com")
+    started = time.perf_counter()
+    for line in lines[: args.single]:
+        await create_diary_service(single_user, DiaryCreate.model_validate_json(line))
+    elapsed = time.perf_counter() - started
+    print(f"create_diary_service: {args.single / elapsed:8.0f} diaries/s")
+
+    bulk_user = await create_user("bulk@example.com")
+    started = time.perf_counter()
+    async for event in import_diaries(bulk_user.id, lines, args.chunk_size):
+        last = event
+    elapsed = time.perf_counter() - started
+    assert last["event"] == "done" and last["imported"] == args.diaries, last
+    print(
+        f"import_diaries:       {args.diaries / elapsed:8.0f} diaries/s "
+        f"({args.diaries} in {elapsed:.1f}s)"
+    )
+    assert await Diary.filter(user_id=bulk_user.id).count() == args.diaries
+
+    await Tortoise.close_connections()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--diaries", type=int, default=20_000)
+    parser.add_argument("--single", type=int, default=1_000, help="하나씩 만들 일기 수")
+    parser.add_argument("--words", type=int, default=12, help="본문 단어 수")
+    parser.add_argument("--chunk-size", type=int, default=1_000)
+    parser.add_argument("--db-url", default="sqlite://:memory:")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+로그인 부하 중 /api/v1/diary/inquiry 지연 시간 벤치마크
+
+bcrypt 연산이 이벤트 루프를 막으면 로그인이 몰릴 때 다른 요청도 함께 느려집니다.
+동시 로그인 요청을 보내면서 일기 목록 조회의 p50/p99 지연을 측정합니다.
+
+    python -m benchmarks.bench_login_inquiry --mode pool
+    python -m benchmarks.bench_login_inquiry --mode sync   # 기존 동기 방식 비교
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+from app.main import app
+from app.services import auth_service
+from app.utils.security import hash_password, password_pool, verify_password
+
+
+def use_blocking_hash():
+    # 기존 동작(이벤트 루프에서 bcrypt를 직접 호출)을 재현합니다.
+    async def blocking_hash(password):
+        return hash_password(password)
+
+    async def blocking_verify(password, hashed_password):
+        return verify_password(password, hashed_password)
+
+    auth_service.hash_password_async = blocking_hash
+    auth_service.verify_password_async = blocking_verify
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run(args):
+    user = {
+        "email": "bench@example.com",
+        "password": "benchpassword123",
+        "nickname": "bench",
+        "name": "bench",
+    }
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench"
+        ) as client:
+            await client.post("/api/v1/register", json=user)
+            response = await client.post(
+                "/api/v1/login",
+                json={"email": user["email"], "password": user["password"]},
+            )
+            headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+            for i in range(args.diaries):
+                await client.post(
+                    "/api/v1/diary/create",
+                    json={
+                        "title": f"벤치마크 {i}",
+                        "content": "오늘은 벤치마크를 돌렸다.",
+                        "emotional_state": "neutral",
+                        "tags": ["bench"],
+                    },
+                    headers=headers,
+                )
+
+            stop = asyncio.Event()
+            logins = 0
+
+            async def login_loop():
+                nonlocal logins
+                while not stop.is_set():
+                    await client.post(
+                        "/api/v1/login",
+                        json={"email": user["email"], "password": user["password"]},
+                    )
+                    logins += 1
+
+            latencies = []
+
+            async def inquiry_loop():
+                deadline = time.perf_counter() + args.duration
+                while time.perf_counter() < deadline:
+                    started = time.perf_counter()
+                    await client.get("/api/v1/diary/inquiry", headers=headers)
+                    latencies.append((time.perf_counter() - started) * 1000)
+                    await asyncio.sleep(args.interval)
+                stop.set()
+
+            login_tasks = [
+                asyncio.create_task(login_loop()) for _ in range(args.logins)
+            ]
+            await inquiry_loop()
+            await asyncio.gather(*login_tasks)
+
+    print(f"mode={args.mode} concurrent_logins={args.logins} logins={logins}")
+    print(
+        f"inquiry requests={len(latencies)} "
+        f"p50={statistics.median(latencies):.1f}ms "
+        f"p99={percentile(latencies, 99):.1f}ms "
+        f"max={max(latencies):.1f}ms"
+    )
+    if args.mode == "pool":
+        print(f"pool={password_pool.stats()}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--mode", choices=["pool", "sync"], default="pool")
+    parser.add_argument("--logins", type=int, default=8, help="동시 로그인 수")
+    parser.add_argument("--duration", type=float, default=5.0, help="측정 시간(초)")
+    parser.add_argument("--interval", type=float, default=0.01)
+    parser.add_argument("--diaries", type=int, default=20)
+    args = parser.parse_args()
+
+    if args.mode == "sync":
+        use_blocking_hash()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
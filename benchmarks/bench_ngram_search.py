@@ -0,0 +1,140 @@
+"""
+한국어 부분 문자열 검색 벤치마크: icontains vs n-gram 역색인
+
+무작위로 생성한 한국어 일기 N개(기본 10만 개)를 한 사용자에게 넣고,
+같은 검색어로 기존 icontains 검색과 n-gram 색인 검색의 지연 시간을 비교합니다.
+
+    python -m benchmarks.bench_ngram_search --diaries 100000
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from tortoise import Tortoise
+
+from app.core.config import TORTOISE_ORM
+from app.models import User
+from app.models.diary import Diary
+from app.services.ngram_service import (
+    CONTENT,
+    TITLE,
+    index_diaries_ngrams,
+    search_ngram,
+)
+
+WORDS = (
+    "오늘 어제 내일 아침 점심 저녁 친구 가족 회사 학교 공부 운동 산책 여행 바다 "
+    "하늘 비가 눈이 커피 영화 음악 독서 요리 청소 행복했다 슬펐다 화가났다 "
+    "피곤했다 즐거웠다 맛있는 조용한 따뜻한 추운 바쁜 느긋한 새로운 오래된 "
+    "카페에서 집에서 공원에서 도서관에서 버스에서 지하철에서 만났다 걸었다 "
+    "먹었다 읽었다 들었다 보았다 생각했다 기억했다 웃었다 울었다"
+).split()
+SYLLABLES = "가나다라마바사아자차카타파하고노도로모보소오조초코토포호구누두루무부수우주추쿠투푸후기니디리미비시이지치키티피히강난당랑망방상앙장창캉탕팡항"
+
+
+def make_vocabulary(rng, size):
+    # 드물게 등장하는 고유 단어(지명, 사람 이름 등)를 흉내 낸 2~4음절 단어
+    return [
+        "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+        for _ in range(size)
+    ]
+
+
+def make_text(rng, words, vocabulary):
+    return " ".join(
+        rng.choice(WORDS) if rng.random() < 0.7 else rng.choice(vocabulary)
+        for _ in range(words)
+    )
+
+
+async def timed(func, repeat):
+    latencies = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = await func()
+        latencies.append((time.perf_counter() - started) * 1000)
+    return statistics.median(latencies), len(result)
+
+
+async def run(args):
+    await Tortoise.init(
+        db_url=args.db_url,
+        modules={"models": TORTOISE_ORM["apps"]["models"]["models"]},
+    )
+    await Tortoise.generate_schemas()
+
+    rng = random.Random(42)
+    vocabulary = make_vocabulary(rng, args.vocabulary)
+    # 자주 나오는 검색어 2개 + 드문 검색어 3개 (드문 단어는 중간 부분 문자열로 검색)
+    queries = ["행복했", "도서관에서"] + [
+        word if len(word) < 3 else word[1:] for word in rng.sample(vocabulary, 3)
+    ]
+    user = await User.create(
+        email="bench@example.com", password="x", nickname="b", name="b"
+    )
+
+    started = time.perf_counter()
+    for offset in range(0, args.diaries, args.batch_size):
+        count = min(args.batch_size, args.diaries - offset)
+        await Diary.bulk_create(
+            [
+                Diary(
+                    user_id=user.id,
+                    title=make_text(rng, 3, vocabulary),
+                    content=make_text(rng, args.words, vocabulary),
+                    emotional_state="neutral",
+                )
+                for _ in range(count)
+            ]
+        )
+        diaries = await Diary.filter(id__gt=offset).order_by("id").limit(count)
+        await index_diaries_ngrams(diaries)
+    print(f"loaded {args.diaries} diaries in {time.perf_counter() - started:.1f}s")
+
+    for query in queries:
+        icontains_ms, icontains_count = await timed(
+            lambda: Diary.filter(user_id=user.id, content__icontains=query).order_by(
+                "-created_at"
+            ),
+            args.repeat,
+        )
+        ngram_ms, ngram_count = await timed(
+            lambda: search_ngram(user.id, query, (CONTENT,)), args.repeat
+        )
+        print(
+            f"{query!r:>14}: icontains={icontains_ms:8.1f}ms ({icontains_count})"
+            f"  ngram={ngram_ms:8.1f}ms ({ngram_count})"
+        )
+
+    title_query = "행복했"
+    icontains_ms, _ = await timed(
+        lambda: Diary.filter(user_id=user.id, title__icontains=title_query),
+        args.repeat,
+    )
+    ngram_ms, _ = await timed(
+        lambda: search_ngram(user.id, title_query, (TITLE,)), args.repeat
+    )
+    print(
+        f"title {title_query!r}: icontains={icontains_ms:.1f}ms ngram={ngram_ms:.1f}ms"
+    )
+
+    await Tortoise.close_connections()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--diaries", type=int, default=100_000)
+    parser.add_argument("--words", type=int, default=12, help="본문 단어 수")
+    parser.add_argument("--vocabulary", type=int, default=20_000, help="드문 단어 수")
+    parser.add_argument("--batch-size", type=int, default=5_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--db-url", default="sqlite://:memory:")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
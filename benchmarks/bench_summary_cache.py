@@ -0,0 +1,77 @@
+"""
+AI 요약 캐시 벤치마크
+
+가짜 Gemini 서비스(호출당 --latency 초)로 같은 일기를 반복 요약할 때
+캐시 없이 매번 모델을 호출하는 경우와 요약 캐시를 쓰는 경우를 비교합니다.
+
+    python -m benchmarks.bench_summary_cache --diaries 50 --repeat 5 --latency 0.5
+"""
+
+import argparse
+import asyncio
+import time
+
+from tortoise import Tortoise
+
+from app.services.ai_service import FakeGeminiService
+from app.services.summary_service import (
+    get_or_create_summary,
+    get_summary_cache_stats,
+    summary_memory_cache,
+)
+
+
+async def run(args):
+    await Tortoise.init(
+        db_url=args.db_url, modules={"models": ["app.models.summary_cache"]}
+    )
+    await Tortoise.generate_schemas()
+
+    contents = [
+        f"{i}번째 일기입니다. 오늘은 평범한 하루였다." for i in range(args.diaries)
+    ]
+    requests = contents * args.repeat
+
+    fake = FakeGeminiService(latency=args.latency)
+    started = time.perf_counter()
+    for content in requests:
+        await fake.summarize_diary(content)
+    print(
+        f"no cache: {time.perf_counter() - started:.2f}s "
+        f"model_calls={fake.calls} requests={len(requests)}"
+    )
+
+    fake = FakeGeminiService(latency=args.latency)
+    started = time.perf_counter()
+    for content in requests:
+        await get_or_create_summary(content, fake)
+    print(
+        f"   cache: {time.perf_counter() - started:.2f}s "
+        f"model_calls={fake.calls} requests={len(requests)}"
+    )
+
+    # 재시작 후 (메모리 계층이 빈 상태) 테이블 계층만으로 응답
+    summary_memory_cache.clear()
+    started = time.perf_counter()
+    for content in contents:
+        await get_or_create_summary(content, fake)
+    print(
+        f" restart: {time.perf_counter() - started:.2f}s "
+        f"model_calls={fake.calls} requests={len(contents)}"
+    )
+    print(get_summary_cache_stats())
+
+    await Tortoise.close_connections()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--diaries", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5, help="일기당 요약 요청 수")
+    parser.add_argument("--latency", type=float, default=0.5, help="모델 호출 지연(초)")
+    parser.add_argument("--db-url", default="sqlite://:memory:")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+TokenBlacklist 누적에 따른 조회 비용 벤치마크
+
+로그아웃이 계속 쌓이는 상황을 라운드 단위로 흉내 내고, 라운드마다
+블랙리스트 조회(jti) 지연 시간과 테이블 크기를 측정합니다.
+정리 작업을 켠 경우(--purge) 만료된 행이 삭제되어 테이블 크기와 조회 비용이 일정하게 유지됩니다.
+
+    python -m benchmarks.bench_token_blacklist_purge
+    python -m benchmarks.bench_token_blacklist_purge --purge
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from tortoise import Tortoise
+
+from app.models.token_blacklist import TokenBlacklist
+from app.services.auth_service import purge_expired_tokens_service
+
+
+async def run(args):
+    await Tortoise.init(
+        db_url=args.db_url, modules={"models": ["app.models.token_blacklist"]}
+    )
+    await Tortoise.generate_schemas()
+
+    for round_no in range(1, args.rounds + 1):
+        # 이번 라운드의 로그아웃: 대부분은 시간이 지나 이미 만료된 토큰입니다.
+        now = datetime.now()
+        rows = [
+            TokenBlacklist(
+                jti=str(uuid.uuid4()),
+                exp=now
+                + (
+                    timedelta(minutes=30)
+                    if i % 10 == 0
+                    else timedelta(minutes=-30 - round_no)
+                ),
+            )
+            for i in range(args.logouts)
+        ]
+        await TokenBlacklist.bulk_create(rows, batch_size=5000)
+
+        purge = ""
+        if args.purge:
+            result = await purge_expired_tokens_service(args.batch_size)
+            purge = (
+                f" purged={result['deleted']} batches={result['batches']}"
+                f" in {result['duration_ms']:.0f}ms"
+            )
+
+        latencies = []
+        for _ in range(args.lookups):
+            jti = str(uuid.uuid4())
+            started = time.perf_counter()
+            await TokenBlacklist.exists(jti=jti)
+            latencies.append((time.perf_counter() - started) * 1_000_000)
+
+        size = await TokenBlacklist.all().count()
+        print(
+            f"round {round_no:>2}: rows={size:>8} "
+            f"lookup mean={statistics.mean(latencies):.1f}us{purge}"
+        )
+
+    await Tortoise.close_connections()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument(
+        "--logouts", type=int, default=20_000, help="라운드당 로그아웃 수"
+    )
+    parser.add_argument("--lookups", type=int, default=1_000)
+    parser.add_argument("--batch-size", type=int, default=1_000)
+    parser.add_argument(
+        "--purge", action="store_true", help="라운드마다 정리 작업 실행"
+    )
+    parser.add_argument("--db-url", default="sqlite://:memory:")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
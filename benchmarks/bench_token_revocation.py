@@ -0,0 +1,72 @@
+"""
+로그아웃 토큰 확인(is_revoked) 지연 시간 벤치마크
+
+블랙리스트에 N개의 토큰을 넣은 뒤 backend(db, bloom, memory)별로
+로그아웃되지 않은 토큰(대부분의 요청)과 로그아웃된 토큰의 확인 비용을 비교합니다.
+
+    python -m benchmarks.bench_token_revocation --rows 50000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from tortoise import Tortoise
+
+from app.models.token_blacklist import TokenBlacklist
+from app.utils.token_cache import RevokedTokenCache
+
+
+async def measure(cache, jtis):
+    latencies = []
+    for jti in jtis:
+        started = time.perf_counter()
+        await cache.is_revoked(jti)
+        latencies.append((time.perf_counter() - started) * 1_000_000)
+    return statistics.mean(latencies), sorted(latencies)[int(len(latencies) * 0.99)]
+
+
+async def run(args):
+    await Tortoise.init(
+        db_url=args.db_url, modules={"models": ["app.models.token_blacklist"]}
+    )
+    await Tortoise.generate_schemas()
+
+    exp = datetime.now() + timedelta(days=1)
+    revoked = [str(uuid.uuid4()) for _ in range(args.rows)]
+    await TokenBlacklist.bulk_create(
+        [TokenBlacklist(jti=jti, exp=exp) for jti in revoked], batch_size=5000
+    )
+    active = [str(uuid.uuid4()) for _ in range(args.lookups)]
+
+    for backend in ("db", "bloom", "memory"):
+        cache = RevokedTokenCache(backend=backend, bloom_capacity=args.rows * 2)
+        started = time.perf_counter()
+        await cache.load()
+        load_ms = (time.perf_counter() - started) * 1000
+
+        active_mean, active_p99 = await measure(cache, active)
+        revoked_mean, revoked_p99 = await measure(cache, revoked[: args.lookups])
+        print(
+            f"{backend:>6}: load={load_ms:.0f}ms "
+            f"active mean={active_mean:.1f}us p99={active_p99:.1f}us | "
+            f"revoked mean={revoked_mean:.1f}us p99={revoked_p99:.1f}us | "
+            f"db_lookups={cache.db_lookups}"
+        )
+
+    await Tortoise.close_connections()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=50_000, help="블랙리스트 행 수")
+    parser.add_argument("--lookups", type=int, default=2_000)
+    parser.add_argument("--db-url", default="sqlite://:memory:")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "aerich" (
+            "id" SERIAL NOT NULL PRIMARY KEY,
+            "version" VARCHAR(255) NOT NULL,
+            "app" VARCHAR(100) NOT NULL,
+            "content" JSONB NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS "user" (
+            "id" SERIAL NOT NULL PRIMARY KEY,
+            "email" VARCHAR(255) NOT NULL UNIQUE,
+            "password" VARCHAR(255) NOT NULL,
+            "nickname" VARCHAR(50) NOT NULL,
+            "name" VARCHAR(50) NOT NULL,
+            "phone_number" VARCHAR(20),
+            "last_login" TIMESTAMPTZ,
+            "is_staff" BOOL NOT NULL DEFAULT False,
+            "is_admin" BOOL NOT NULL DEFAULT False,
+            "is_active" BOOL NOT NULL DEFAULT True,
+            "created_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            "updated_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP
+        );
+        CREATE TABLE IF NOT EXISTS "tokenblacklist" (
+            "id" SERIAL NOT NULL PRIMARY KEY,
+            "jti" VARCHAR(36) NOT NULL UNIQUE,
+            "exp" TIMESTAMPTZ NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS "diary" (
+            "id" SERIAL NOT NULL PRIMARY KEY,
+            "title" VARCHAR(100) NOT NULL,
+            "content" TEXT NOT NULL,
+            "emotional_state" VARCHAR(7),
+            "created_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            "updated_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            "user_id" INT NOT NULL REFERENCES "user" ("id") ON DELETE CASCADE
+        );
+        COMMENT ON COLUMN "diary"."emotional_state" IS 'HAPPY: happy\\nSAD: sad\\nANGRY: angry\\nNEUTRAL: neutral';
+        CREATE TABLE IF NOT EXISTS "tag" (
+            "id" SERIAL NOT NULL PRIMARY KEY,
+            "name" VARCHAR(50) NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS "diary_tags" (
+            "id" SERIAL NOT NULL PRIMARY KEY,
+            "diary_id" INT NOT NULL REFERENCES "diary" ("id") ON DELETE CASCADE,
+            "tag_id" INT NOT NULL REFERENCES "tag" ("id") ON DELETE CASCADE,
+            CONSTRAINT "uid_diary_tags_diary_i_cf5d22" UNIQUE ("diary_id", "tag_id")
+        );
+        CREATE TABLE IF NOT EXISTS "diary_tag" (
+            "diary_id" INT NOT NULL REFERENCES "diary" ("id") ON DELETE CASCADE,
+            "tag_id" INT NOT NULL REFERENCES "tag" ("id") ON DELETE CASCADE
+        );
+        CREATE UNIQUE INDEX IF NOT EXISTS "uidx_diary_tag_diary_i_47c64b" ON "diary_tag" ("diary_id", "tag_id");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        """
@@ -0,0 +1,138 @@
+"""
+diary_tag(암묵적 M2M 테이블) -> diary_tags 이전과 집계/색인용 테이블 추가
+
+- 같은 이름의 태그를 가장 작은 id 하나로 합친 뒤 tag.name에 unique 인덱스 추가
+- diary_tags에 비정규화 컬럼(user_id, created_at)을 추가하고 diary 값으로 채움
+- diary_tag의 연결을 diary_tags로 복사한 뒤 diary_tag 삭제
+- diary.ai_summary/emotion_scores 컬럼, 조회용 인덱스, 새 테이블 추가
+
+집계 테이블(user_emotion_daily, user_tag_usage, user_calendar)은 앱 시작 시
+ensure_user_stats가 비어 있는 것을 확인하고 한 번 다시 계산합니다.
+(python -m app.scripts.rebuild_stats 로 직접 실행해도 됩니다.)
+"""
+
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "diary" ADD COLUMN IF NOT EXISTS "ai_summary" TEXT;
+        ALTER TABLE "diary" ADD COLUMN IF NOT EXISTS "emotion_scores" JSONB;
+        CREATE INDEX IF NOT EXISTS "idx_diary_user_id_e671de" ON "diary" ("user_id", "created_at", "id");
+        CREATE INDEX IF NOT EXISTS "idx_tokenblackl_exp_f968a1" ON "tokenblacklist" ("exp");
+
+        -- 같은 이름의 태그를 가장 작은 id로 합칩니다.
+        CREATE TEMPORARY TABLE "tag_merge" AS
+            SELECT "id", MIN("id") OVER (PARTITION BY "name") AS "keep_id" FROM "tag";
+        DELETE FROM "diary_tags" AS dt USING "tag_merge" AS m
+            WHERE dt."tag_id" = m."id" AND m."id" <> m."keep_id"
+              AND EXISTS (
+                  SELECT 1 FROM "diary_tags" AS kept
+                  WHERE kept."diary_id" = dt."diary_id" AND kept."tag_id" = m."keep_id"
+              );
+        UPDATE "diary_tags" AS dt SET "tag_id" = m."keep_id" FROM "tag_merge" AS m
+            WHERE dt."tag_id" = m."id" AND m."id" <> m."keep_id";
+
+        -- diary_tags 비정규화 컬럼
+        ALTER TABLE "diary_tags" ADD COLUMN IF NOT EXISTS "user_id" INT;
+        ALTER TABLE "diary_tags" ADD COLUMN IF NOT EXISTS "created_at" TIMESTAMPTZ;
+        UPDATE "diary_tags" AS dt SET "user_id" = d."user_id", "created_at" = d."created_at"
+            FROM "diary" AS d
+            WHERE d."id" = dt."diary_id" AND (dt."user_id" IS NULL OR dt."created_at" IS NULL);
+
+        -- diary_tag -> diary_tags
+        INSERT INTO "diary_tags" ("diary_id", "tag_id", "user_id", "created_at")
+            SELECT dt."diary_id", m."keep_id", d."user_id", d."created_at"
+            FROM "diary_tag" AS dt
+            JOIN "tag_merge" AS m ON m."id" = dt."tag_id"
+            JOIN "diary" AS d ON d."id" = dt."diary_id"
+            ON CONFLICT ("diary_id", "tag_id") DO NOTHING;
+        DROP TABLE IF EXISTS "diary_tag";
+
+        DELETE FROM "tag" USING "tag_merge" AS m
+            WHERE "tag"."id" = m."id" AND m."id" <> m."keep_id";
+        CREATE UNIQUE INDEX IF NOT EXISTS "uid_tag_name_9a4d3b" ON "tag" ("name");
+        DROP TABLE "tag_merge";
+
+        ALTER TABLE "diary_tags" ALTER COLUMN "user_id" SET NOT NULL;
+        ALTER TABLE "diary_tags" ALTER COLUMN "created_at" SET NOT NULL;
+        CREATE INDEX IF NOT EXISTS "idx_diary_tags_user_id_402e1b" ON "diary_tags" ("user_id", "tag_id", "created_at");
+
+        CREATE TABLE IF NOT EXISTS "diary_ngram" (
+            "id" SERIAL NOT NULL PRIMARY KEY,
+            "user_id" INT NOT NULL,
+            "field" VARCHAR(1) NOT NULL,
+            "gram" VARCHAR(8) NOT NULL,
+            "diary_id" INT NOT NULL REFERENCES "diary" ("id") ON DELETE CASCADE,
+            CONSTRAINT "uid_diary_ngram_diary_i_5d9a3a" UNIQUE ("diary_id", "field", "gram")
+        );
+        CREATE INDEX IF NOT EXISTS "idx_diary_ngram_user_id_8a4441" ON "diary_ngram" ("user_id", "gram", "field", "diary_id");
+        CREATE TABLE IF NOT EXISTS "summary_cache" (
+            "key" VARCHAR(64) NOT NULL PRIMARY KEY,
+            "model" VARCHAR(100) NOT NULL,
+            "summary" TEXT NOT NULL,
+            "created_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP
+        );
+        CREATE TABLE IF NOT EXISTS "emotion_keyword" (
+            "id" SERIAL NOT NULL PRIMARY KEY,
+            "emotion_keyword" VARCHAR(50) NOT NULL UNIQUE,
+            "emotion_type" VARCHAR(20) NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS "user_calendar" (
+            "id" SERIAL NOT NULL PRIMARY KEY,
+            "user_id" INT NOT NULL,
+            "year" INT NOT NULL,
+            "days" BYTEA NOT NULL,
+            CONSTRAINT "uid_user_calend_user_id_6af928" UNIQUE ("user_id", "year")
+        );
+        CREATE TABLE IF NOT EXISTS "user_diary_version" (
+            "user_id" INT NOT NULL PRIMARY KEY,
+            "version" BIGINT NOT NULL DEFAULT 0
+        );
+        CREATE TABLE IF NOT EXISTS "user_emotion_daily" (
+            "id" SERIAL NOT NULL PRIMARY KEY,
+            "user_id" INT NOT NULL,
+            "day" DATE NOT NULL,
+            "emotional_state" VARCHAR(20) NOT NULL,
+            "count" INT NOT NULL DEFAULT 0,
+            CONSTRAINT "uid_user_emotio_user_id_da156d" UNIQUE ("user_id", "day", "emotional_state")
+        );
+        CREATE TABLE IF NOT EXISTS "user_tag_usage" (
+            "id" SERIAL NOT NULL PRIMARY KEY,
+            "user_id" INT NOT NULL,
+            "usage_count" INT NOT NULL DEFAULT 0,
+            "updated_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            "tag_id" INT NOT NULL REFERENCES "tag" ("id") ON DELETE CASCADE,
+            CONSTRAINT "uid_user_tag_us_user_id_2b4bee" UNIQUE ("user_id", "tag_id")
+        );
+        CREATE INDEX IF NOT EXISTS "idx_user_tag_us_user_id_c9c3f7" ON "user_tag_usage" ("user_id", "usage_count", "tag_id");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "diary_tag" (
+            "diary_id" INT NOT NULL REFERENCES "diary" ("id") ON DELETE CASCADE,
+            "tag_id" INT NOT NULL REFERENCES "tag" ("id") ON DELETE CASCADE
+        );
+        CREATE UNIQUE INDEX IF NOT EXISTS "uidx_diary_tag_diary_i_47c64b" ON "diary_tag" ("diary_id", "tag_id");
+        INSERT INTO "diary_tag" ("diary_id", "tag_id")
+            SELECT "diary_id", "tag_id" FROM "diary_tags"
+            ON CONFLICT DO NOTHING;
+
+        DROP INDEX IF EXISTS "idx_diary_tags_user_id_402e1b";
+        ALTER TABLE "diary_tags" DROP COLUMN IF EXISTS "user_id";
+        ALTER TABLE "diary_tags" DROP COLUMN IF EXISTS "created_at";
+        DROP INDEX IF EXISTS "uid_tag_name_9a4d3b";
+
+        DROP TABLE IF EXISTS "user_tag_usage";
+        DROP TABLE IF EXISTS "user_emotion_daily";
+        DROP TABLE IF EXISTS "user_diary_version";
+        DROP TABLE IF EXISTS "user_calendar";
+        DROP TABLE IF EXISTS "emotion_keyword";
+        DROP TABLE IF EXISTS "summary_cache";
+        DROP TABLE IF EXISTS "diary_ngram";
+
+        DROP INDEX IF EXISTS "idx_tokenblackl_exp_f968a1";
+        DROP INDEX IF EXISTS "idx_diary_user_id_e671de";
+        ALTER TABLE "diary" DROP COLUMN IF EXISTS "emotion_scores";
+        ALTER TABLE "diary" DROP COLUMN IF EXISTS "ai_summary";"""